@@ -0,0 +1,109 @@
+"""
+Benchmark about the memory used per crawler.
+
+It creates a temporary directory tree containing image sequences (empty files)
+and measures the memory allocated by the crawlers created through glob.
+
+By default the centipede source code of this checkout is used, use --source
+to measure a different checkout, for instance to compare against a previous
+revision:
+    git worktree add /tmp/centipede-baseline <revision>
+    python crawlerMemory.py --source /tmp/centipede-baseline/src/lib
+    python crawlerMemory.py
+
+The size of the directory tree can be changed through --sequences and
+--frames (python crawlerMemory.py --sequences 100 --frames 1000).
+"""
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+
+# command-line interface
+parser = argparse.ArgumentParser()
+
+parser.add_argument(
+    '--sequences',
+    type=int,
+    default=20,
+    help='number of image sequences created in the directory tree'
+)
+
+parser.add_argument(
+    '--frames',
+    type=int,
+    default=1000,
+    help='number of frames per image sequence'
+)
+
+parser.add_argument(
+    '--source',
+    default=os.path.join(
+        os.path.dirname(os.path.dirname(os.path.realpath(__file__))),
+        "src",
+        "lib"
+    ),
+    help='centipede source code (lib directory) used by the benchmark'
+)
+
+
+def __createTree(rootPath, sequences, frames):
+    """
+    Create a directory tree containing image sequences.
+    """
+    for sequence in range(sequences):
+        sequencePath = os.path.join(
+            rootPath,
+            "shot{}".format(str(sequence).zfill(4)),
+            "1920x1080"
+        )
+        os.makedirs(sequencePath)
+
+        for frame in range(frames):
+            framePath = os.path.join(
+                sequencePath,
+                "RND-TST-SHT{}_lighting_beauty_sr.{}.exr".format(
+                    sequence,
+                    str(frame + 1001).zfill(4)
+                )
+            )
+            open(framePath, 'a').close()
+
+def __run(sequences, frames):
+    """
+    Run the benchmark.
+    """
+    # centipede is only imported here, since its source code is provided
+    # through the command-line arguments
+    from centipede.Crawler.Fs import FsPath
+
+    rootPath = tempfile.mkdtemp()
+    try:
+        __createTree(rootPath, sequences, frames)
+
+        tracemalloc.start()
+        crawlers = FsPath.createFromPath(rootPath).glob()
+        allocatedBytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        sys.stdout.write(
+            'crawlers: {}\ntotal: {:.2f} MB\nbytes per crawler: {}\n'.format(
+                len(crawlers),
+                allocatedBytes / (1024.0 * 1024.0),
+                int(allocatedBytes / len(crawlers)) if crawlers else 0
+            )
+        )
+    finally:
+        shutil.rmtree(rootPath)
+
+
+# executing it
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    # adding centipede source code to the python path
+    sys.path.insert(1, os.path.realpath(args.source))
+
+    __run(args.sequences, args.frames)
@@ -8,6 +8,7 @@ import subprocess
 import centipede
 from centipede.Dispatcher import Dispatcher
 from centipede.Crawler import Crawler
+from centipede.CrawlerIndex import CrawlerIndex
 from collections import OrderedDict
 from PySide2 import QtCore, QtGui, QtWidgets
 
@@ -23,6 +24,10 @@ class CentipedeApp(QtWidgets.QApplication):
 
     __viewModes = ["group", "flat"]
     __runOnTheFarm = os.environ.get('CENTIPEDEAPP_RUN_FARM', '0')
+    __globWorkers = int(os.environ.get('CENTIPEDEAPP_GLOB_WORKERS', 8))
+    __crawlIndexFile = os.environ.get('CENTIPEDEAPP_CRAWL_INDEX', '')
+    __watchSource = os.environ.get('CENTIPEDEAPP_WATCH_SOURCE', '0')
+    __collapseSequences = os.environ.get('CENTIPEDEAPP_COLLAPSE_SEQUENCES', '0')
 
     def __init__(self, argv, **kwargs):
         """
@@ -31,6 +36,8 @@ class CentipedeApp(QtWidgets.QApplication):
         super(CentipedeApp, self).__init__(argv, **kwargs)
 
         self.__configurationDirectory = ""
+        self.__crawlIndex = None
+        self.__sourceWatchers = {}
         self.__applyStyleSheet()
         self.__uiHintSourceColumns = []
         self.__buildWidgets()
@@ -183,11 +190,19 @@ class CentipedeApp(QtWidgets.QApplication):
 
             filterTypes += taskHolder.crawlerMatcher().matchTypes()
 
-        # globbing crawlers
-        crawlerList = []
-        for pathItem in path.split(';'):
-            crawler = centipede.Crawler.Fs.FsPath.createFromPath(pathItem)
-            crawlerList += crawler.glob(filterTypes)
+        # globbing crawlers (all the paths are traversed together in parallel)
+        rootCrawlers = self.__sourceRootCrawlers(path.split(';'))
+        crawlerList = Crawler.globCrawlers(
+            rootCrawlers,
+            filterTypes,
+            workers=self.__globWorkers,
+            crawlIndex=self.__crawlIndexInstance()
+        )
+
+        # watching the source paths, so next time the glob cache is
+        # updated only by the changes
+        if self.__watchSource == '1':
+            self.__updateSourceWatchers(rootCrawlers, filterTypes)
 
         # in centipede interface we don't care about directory crawlers
         # TODO: we need to have a better way to get rid of directory crawlers
@@ -196,6 +211,13 @@ class CentipedeApp(QtWidgets.QApplication):
         # sorting result by name
         crawlerList.sort(key=lambda x: x.var('name').lower())
 
+        # computing the lazy variables displayed as columns at once
+        Crawler.resolveLazyVars(
+            crawlerList,
+            self.__uiHintSourceColumns,
+            workers=self.__globWorkers
+        )
+
         crawlerTypes = set()
         crawlerTags = {}
 
@@ -313,10 +335,13 @@ class CentipedeApp(QtWidgets.QApplication):
 
         self.__targetTree.clear()
 
+        # the crawlers are indexed once for all task holders
+        crawlerIndex = CrawlerIndex(visibleCrawlers)
+
         for taskHolder in self.__taskHolders:
 
             try:
-                matchedCrawlers = taskHolder.query(visibleCrawlers)
+                matchedCrawlers = taskHolder.query(crawlerIndex)
             except Exception as error:
                 QtWidgets.QMessageBox.critical(
                     self.__main,
@@ -559,6 +584,62 @@ class CentipedeApp(QtWidgets.QApplication):
             stderr=subprocess.DEVNULL
         )
 
+    def __crawlIndexInstance(self):
+        """
+        Return the crawl index used to glob the source paths (None when not enabled).
+        """
+        if self.__crawlIndex is None and self.__crawlIndexFile:
+            self.__crawlIndex = centipede.Crawler.Fs.CrawlIndex(self.__crawlIndexFile)
+
+        return self.__crawlIndex
+
+    def __sourceRootCrawlers(self, paths):
+        """
+        Return the root crawlers for the source paths (the watched crawlers are updated and re-used).
+        """
+        result = []
+        for path in paths:
+            if path in self.__sourceWatchers:
+                watcher = self.__sourceWatchers[path]
+                watcher.update()
+                result.append(watcher.rootCrawler())
+            else:
+                rootCrawler = centipede.Crawler.Fs.FsPath.createFromPath(path)
+
+                # image sequences are represented by a single crawler (the
+                # frames are created when the crawlers are used)
+                if self.__collapseSequences == '1' and isinstance(rootCrawler, centipede.Crawler.Fs.Directory):
+                    rootCrawler.setCollapseSequences(True)
+
+                result.append(rootCrawler)
+
+        return result
+
+    def __updateSourceWatchers(self, rootCrawlers, filterTypes):
+        """
+        Watch the directories of the root crawlers (stopping the watchers that are not used anymore).
+
+        The watchers reuse the traversal done by the glob with the filter types.
+        """
+        sourceWatchers = {}
+        for rootCrawler in rootCrawlers:
+            path = rootCrawler.var('filePath')
+            # the watchers that watch all crawlers can be used by any filter
+            if path in self.__sourceWatchers and \
+                    set(self.__sourceWatchers[path].filterTypes()) in (set(), set(filterTypes)):
+                sourceWatchers[path] = self.__sourceWatchers.pop(path)
+            elif isinstance(rootCrawler, centipede.Crawler.Fs.Directory):
+                sourceWatchers[path] = centipede.Crawler.Fs.Watcher(
+                    rootCrawler,
+                    filterTypes=filterTypes,
+                    workers=self.__globWorkers
+                )
+
+        for watcher in self.__sourceWatchers.values():
+            watcher.close()
+
+        self.__sourceWatchers = sourceWatchers
+
     def __treeWidget(self, columns=[]):
         """
         Return a tree widget used by source and target.
@@ -593,7 +674,7 @@ class CentipedeApp(QtWidgets.QApplication):
                     else:
                         result.append(crawler)
 
-        return list(map(lambda x: x.clone(), result))
+        return list(map(lambda x: x.clone(), Crawler.expand(result)))
 
     def __createSubtasks(self, parentEntry, taskHolder):
         """
@@ -648,7 +729,7 @@ class CentipedeApp(QtWidgets.QApplication):
                 value = self.__sourceOverrides[crawler.var('filePath')][column]
                 hasOverride = True
 
-            if column in crawler.varNames():
+            if crawler.hasVar(column):
                 if not hasOverride:
                     value = crawler.var(column)
 
@@ -695,9 +776,10 @@ class CentipedeApp(QtWidgets.QApplication):
             QtCore.Qt.EditRole,
             'vars'
         )
-        for varName in sorted(crawler.varNames()):
+        # the lazy variables are computed when they are displayed
+        for varName in sorted(crawler.varNames() + crawler.lazyVarNames()):
 
-            if varName in ['path']:
+            if varName in ['path'] or not crawler.hasVar(varName):
                 continue
 
             variablesChild = QtWidgets.QTreeWidgetItem(variables)
@@ -770,6 +852,9 @@ class CentipedeApp(QtWidgets.QApplication):
 
         try:
             for crawlersGroup in Crawler.group(visibleCrawlers):
+
+                # the crawlers of the group are indexed once for all task holders
+                crawlerIndex = CrawlerIndex(crawlersGroup)
                 for taskHolder in self.__taskHolders:
 
                     # run on the farm
@@ -783,12 +868,12 @@ class CentipedeApp(QtWidgets.QApplication):
                         label += ": "
                         label += crawlersGroup[0].tag('group') if 'group' in crawlersGroup[0].tagNames() else crawlersGroup[0].var('baseName')
                         renderFarmDispatcher.setOption('label', label)
-                        renderFarmDispatcher.dispatch(taskHolder, crawlersGroup)
+                        renderFarmDispatcher.dispatch(taskHolder, crawlerIndex)
 
                     # run locally
                     else:
                         localDispatcher = Dispatcher.create('local')
-                        localDispatcher.dispatch(taskHolder, crawlersGroup)
+                        localDispatcher.dispatch(taskHolder, crawlerIndex)
 
         except Exception as err:
             QtWidgets.QMessageBox.critical(
@@ -860,7 +945,7 @@ class CentipedeApp(QtWidgets.QApplication):
                 crawler = [crawler]
 
             hintValue = ""
-            if columnName in crawler[0].varNames():
+            if crawler[0].hasVar(columnName):
                 hintValue = crawler[0].var(columnName)
 
             if value is None:
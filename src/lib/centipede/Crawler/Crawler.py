@@ -1,11 +1,17 @@
 import os
+import copy
 import json
 from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+from ..PathHolder import PathHolder
 
 # compatibility with python 2/3
 try:
-    basestring
-except NameError:
+    import Queue as queue
+    import cPickle as pickle
+except ImportError:
+    import queue
+    import pickle
     basestring = str
 
 class InvalidVarError(Exception):
@@ -24,26 +30,66 @@ class CreateCrawlerError(Exception):
 class Crawler(object):
     """
     Abstracted Crawler.
+
+    The crawler is stored in a compact way: the variables of the parent crawler
+    are referenced (through a snapshot that is shared by all the children)
+    rather than copied, the context variable names are shared immutable sets
+    and the tags are only allocated when used.
     """
 
+    __slots__ = (
+        '__vars',
+        '__baseVars',
+        '__varsSnapshot',
+        '__contextVarNames',
+        '__tags',
+        '__globCache',
+        '__resolvedLazyVars'
+    )
+
+    # cost classes about the lazy variable providers (see registerLazyVars)
+    lazyVarCostCpu = 'cpu'
+    lazyVarCostIo = 'io'
+    lazyVarCostProcess = 'process'
+
     __registeredTypes = OrderedDict()
+    __registryVersion = 0
+    __typeHierarchyIndex = {}
+    __dispatchIndex = None
+    __dispatchStats = {
+        'creates': 0,
+        'testsRun': 0,
+        'testsSkipped': 0,
+        'typeHits': {}
+    }
+    __emptyContextVarNames = frozenset()
+    __immutableValueTypes = (basestring, bool, int, float, type(None))
+    __contextVarNamesCache = {}
+    __lazyVarProviders = OrderedDict()
+    __lazyVarProvidersIndex = {}
 
     def __init__(self, name, parentCrawler=None):
         """
         Create a crawler.
         """
         self.__vars = {}
-        self.__tags = {}
-        self.__contextVarNames = set()
+        self.__baseVars = None
+        self.__varsSnapshot = None
+        self.__contextVarNames = self.__emptyContextVarNames
+        self.__tags = None
+        self.__globCache = None
+        self.__resolvedLazyVars = None
 
         # passing variables
         if parentCrawler:
             assert isinstance(parentCrawler, Crawler), \
                 "Invalid crawler type!"
 
-            for varName in parentCrawler.varNames():
-                isContextVar = (varName in parentCrawler.contextVarNames())
-                self.setVar(varName, parentCrawler.var(varName), isContextVar)
+            # the variables from the parent are referenced rather than
+            # copied, any change done afterwards in the parent is not
+            # going to affect the variables of the crawler
+            self.__baseVars = parentCrawler.__sharedVars()
+            self.__contextVarNames = parentCrawler.__contextVarNames
 
             self.setVar(
                 'fullPath',
@@ -56,7 +102,6 @@ class Crawler(object):
             self.setVar('fullPath', '/')
 
         self.setVar('name', name)
-        self.__globCache = None
 
     def isLeaf(self):
         """
@@ -77,11 +122,34 @@ class Crawler(object):
 
         return result
 
+    def iterChildren(self):
+        """
+        Return an iterator that yields the children crawlers.
+
+        Differently from children, the crawlers may be created on demand (it
+        depends on the implementation of _iterChildren).
+        """
+        assert not self.isLeaf(), "Can't compute children from a leaf crawler!"
+
+        for crawler in self._iterChildren():
+            assert isinstance(crawler, Crawler), \
+                "Invalid Crawler Type"
+
+            yield crawler
+
     def varNames(self):
         """
         Return a list of variable names assigned to the crawler.
         """
-        return list(self.__vars.keys())
+        if not self.__baseVars:
+            return list(self.__vars.keys())
+
+        result = list(self.__baseVars.keys())
+        for varName in self.__vars.keys():
+            if varName not in self.__baseVars:
+                result.append(varName)
+
+        return result
 
     def contextVarNames(self):
         """
@@ -93,41 +161,91 @@ class Crawler(object):
         """
         Set a value for a variable.
         """
-        if isContextVar:
-            self.__contextVarNames.add(name)
-        elif name in self.__contextVarNames:
-            self.__contextVarNames.remove(name)
+        if isContextVar != (name in self.__contextVarNames):
+            self.__contextVarNames = Crawler.__updatedContextVarNames(
+                self.__contextVarNames,
+                name,
+                isContextVar
+            )
 
         self.__vars[name] = value
 
+        # the snapshot shared with the children needs to be re-computed
+        self.__varsSnapshot = None
+
     def var(self, name):
         """
         Return the value for a variable.
+
+        Variables provided by lazy variable providers (see registerLazyVars)
+        are computed when they are accessed for the first time.
         """
-        if name not in self.__vars:
+        if name in self.__vars:
+            return self.__vars[name]
+
+        if self.__baseVars is not None and name in self.__baseVars:
+            return self.__baseVars[name]
+
+        if not self.__resolveLazyVar(name):
             raise InvalidVarError(
                 'Variable not found "{0}"'.format(name)
             )
 
         return self.__vars[name]
 
+    def hasVar(self, name):
+        """
+        Return a boolean telling if the variable is available in the crawler.
+
+        Differently from checking the variable names, variables provided by
+        lazy variable providers are taken into consideration (they are
+        computed when necessary).
+        """
+        if name in self.__vars or (self.__baseVars is not None and name in self.__baseVars):
+            return True
+
+        return self.__resolveLazyVar(name)
+
+    def lazyVarNames(self):
+        """
+        Return a list of variable names that can be computed on demand (the ones computed already are not included).
+        """
+        varNames = set(self.varNames())
+        result = []
+        for name, provider in Crawler.__lazyVarProvidersByName(self.__class__).items():
+            if name in varNames:
+                continue
+
+            if self.__resolvedLazyVars is not None and provider['id'] in self.__resolvedLazyVars:
+                continue
+
+            result.append(name)
+
+        return result
+
     def tagNames(self):
         """
         Return a list of tag names assigned to the crawler.
         """
-        return self.__tags.keys()
+        if self.__tags is None:
+            return []
+
+        return list(self.__tags.keys())
 
     def setTag(self, name, value):
         """
         Set a value for a tag.
         """
+        if self.__tags is None:
+            self.__tags = {}
+
         self.__tags[name] = value
 
     def tag(self, name):
         """
         Return the value for a tagiable.
         """
-        if name not in self.__tags:
+        if self.__tags is None or name not in self.__tags:
             raise InvalidTagError(
                 'Tag not found "{0}"'.format(name)
             )
@@ -137,8 +255,44 @@ class Crawler(object):
     def clone(self):
         """
         Return a cloned instance about the current crawler.
+
+        The clone is a structural copy of the crawler: all variables (including
+        the ones inherited from the parent crawler) and tags are copied to
+        the new crawler, where mutable values are deep copied. The constructor
+        of the crawler is not called.
+        """
+        vars, contextVarNames, tags = self.__flattenedContents()
+
+        return Crawler._createFromContents(
+            vars['type'],
+            Crawler.__copyValues(vars),
+            contextVarNames,
+            Crawler.__copyValues(tags)
+        )
+
+    def toBinary(self):
+        """
+        Serialize the crawler to a compact binary format (it can be recovered later using createFromBinary).
+
+        The binary format is based on pickle (using the highest protocol
+        available), therefore it's meant to be used between processes
+        running the same version of python and centipede.
         """
-        return Crawler.createFromJson(self.toJson())
+        return pickle.dumps(self, pickle.HIGHEST_PROTOCOL)
+
+    def __reduce__(self):
+        """
+        Return the data used to pickle the crawler.
+
+        The crawler is recreated through _restoreCrawler (the constructor
+        is not called).
+        """
+        vars, contextVarNames, tags = self.__flattenedContents()
+
+        return (
+            _restoreCrawler,
+            (vars['type'], vars, contextVarNames, tags)
+        )
 
     def toJson(self):
         """
@@ -165,26 +319,73 @@ class Crawler(object):
             separators=(',', ': ')
         )
 
-    def glob(self, filterTypes=[], useCache=True):
+    def glob(self, filterTypes=[], useCache=True, workers=0, crawlIndex=None):
         """
         Return a list of all crawlers found recursively under this path.
 
         Filter result list by crawler type (str) or class type (both include derived classes).
+        When filtering without a glob cache available, the filter is applied
+        during the traversal: leaf crawlers that cannot satisfy the filter
+        are not created at all (see candidateTypes). In this case the
+        traversal is stored in the glob cache for that filter, while the
+        traversal without filter is used by any filter.
+
+        When workers is greater than zero the children of the crawlers are
+        computed in parallel through a pool of threads (with that number of
+        threads). The result is the same (including the order) as the serial
+        traversal.
+
+        Optionally a crawl index can be used to provide the children of the
+        crawlers (see Fs.CrawlIndex).
         """
-        if self.__globCache is None or not useCache:
-            # Recursively collect all crawlers for this path
-            self.__globCache = Crawler.__collectCrawlers(self)
+        return Crawler.globCrawlers([self], filterTypes, useCache, workers, crawlIndex)
 
-        if not filterTypes:
-            return self.__globCache
-
-        filteredCrawlers = set()
-        for filterType in filterTypes:
-            subClasses = tuple(Crawler.registeredSubclasses(filterType))
-            filteredCrawlers.update(
-                filter(lambda x: isinstance(x, subClasses), self.__globCache)
-            )
-        return list(filteredCrawlers)
+    def iglob(self, filterTypes=[], useCache=True, crawlIndex=None):
+        """
+        Return a generator that yields all crawlers found recursively under this path.
+
+        The crawlers are yielded lazily using the same order as glob (depth first)
+        and filtered on the fly by crawler type (str) or class type (both include
+        derived classes). Differently from glob, the crawlers are not
+        cached (only the crawlers of the directory being traversed are held
+        in memory), however when the glob cache is available it is used
+        (useCache). The traversal stops as soon as the generator is not
+        consumed anymore. Optionally a crawl index can be used to provide
+        the children of the crawlers (see Fs.CrawlIndex). Same as glob,
+        the filter is applied during the traversal (leaf crawlers that
+        cannot satisfy it are not created).
+        """
+        filterClasses = None
+        if filterTypes:
+            filterClasses = Crawler._filterClasses(filterTypes)
+
+        # yielding the result from the glob cache
+        globCache = self.__cachedTraversal(filterClasses)
+        if useCache and globCache is not None:
+            for crawler in globCache:
+                if filterClasses is None or Crawler.__matchFilter(crawler, filterClasses):
+                    yield crawler
+            return
+
+        stack = [iter([self])]
+        while stack:
+            crawler = next(stack[-1], None)
+            if crawler is None:
+                stack.pop()
+                continue
+
+            if filterClasses is None or Crawler.__matchFilter(crawler, filterClasses):
+                yield crawler
+
+            if crawler.isLeaf():
+                continue
+
+            if crawlIndex is not None:
+                stack.append(iter(crawlIndex.children(crawler)))
+            elif filterClasses is None:
+                stack.append(crawler.iterChildren())
+            else:
+                stack.append(crawler._iterChildren(filterClasses))
 
     @classmethod
     def test(cls, data, parentCrawler=None):
@@ -196,15 +397,35 @@ class Crawler(object):
         """
         raise NotImplementedError
 
+    @classmethod
+    def testExtensions(cls):
+        """
+        For re-implementation: Return a list of extensions that can pass the test.
+
+        This information is used by the dispatch index (Crawler.create) to
+        only test the crawler types that can handle the extension of the
+        data. None means the test is not bound to any extension (the crawler
+        type is tested for any data). Derived classes that re-implement test
+        should re-implement this method as well, otherwise the crawler type
+        is tested for any data.
+        """
+        return None
+
     @staticmethod
     def create(data, parentCrawler=None):
         """
         Create a crawler for the input data.
+
+        The crawler types are tested from the latest registration to the
+        first one, however only the candidates returned by the dispatch
+        index for the data are tested (see Crawler.testExtensions).
         """
         result = None
-        for registeredName in reversed(Crawler.__registeredTypes.keys()):
-            crawlerTypeClass = Crawler.__registeredTypes[registeredName]
+        candidates = Crawler.__dispatchCandidates(data)
+        testsRun = 0
+        for registeredName, crawlerTypeClass in candidates:
             passedTest = False
+            testsRun += 1
 
             # testing crawler
             try:
@@ -232,13 +453,59 @@ class Crawler(object):
                     )
                 else:
                     result.setVar('type', registeredName)
+
+                typeHits = Crawler.__dispatchStats['typeHits']
+                typeHits[registeredName] = typeHits.get(registeredName, 0) + 1
                 break
 
+        # updating the dispatch statistics
+        stats = Crawler.__dispatchStats
+        stats['creates'] += 1
+        stats['testsRun'] += testsRun
+        stats['testsSkipped'] += len(Crawler.__registeredTypes) - len(candidates)
+
         assert isinstance(result, Crawler),\
             "Don't know how to create a crawler for \"{0}\"".format(data)
 
         return result
 
+    @staticmethod
+    def candidateTypes(data):
+        """
+        Return a list of crawler classes that may be created for the data (sorted by priority).
+
+        The result is provided by the dispatch index (see testExtensions), so
+        no test is performed. It's used to know beforehand the crawler
+        types that Crawler.create can result for the data.
+        """
+        return list(map(lambda x: x[1], Crawler.__dispatchCandidates(data)))
+
+    @staticmethod
+    def dispatchStats():
+        """
+        Return a dict containing the statistics about the dispatch index used by Crawler.create.
+
+        The statistics contain the total of created crawlers (creates), the total
+        of crawler types that have been tested (testsRun) and skipped
+        by the dispatch index (testsSkipped), and the total of crawlers
+        created per registered type (typeHits). The values are approximated
+        when crawlers are created from multiple threads.
+        """
+        stats = dict(Crawler.__dispatchStats)
+        stats['typeHits'] = dict(stats['typeHits'])
+
+        return stats
+
+    @staticmethod
+    def resetDispatchStats():
+        """
+        Reset the statistics about the dispatch index.
+        """
+        Crawler.__dispatchStats['creates'] = 0
+        Crawler.__dispatchStats['testsRun'] = 0
+        Crawler.__dispatchStats['testsSkipped'] = 0
+        Crawler.__dispatchStats['typeHits'] = {}
+
     @staticmethod
     def register(name, crawlerClass):
         """
@@ -254,6 +521,36 @@ class Crawler(object):
 
         Crawler.__registeredTypes[name] = crawlerClass
 
+        # the dispatch index and the type hierarchy index need to be re-computed
+        Crawler.__registryVersion += 1
+        Crawler.__typeHierarchyIndex = {}
+        Crawler.__dispatchIndex = None
+
+    @staticmethod
+    def unregister(name):
+        """
+        Remove a registered crawler type.
+        """
+        assert name in Crawler.__registeredTypes, \
+            "No registered crawler type for \"{0}\"".format(name)
+
+        del Crawler.__registeredTypes[name]
+
+        # the dispatch index and the type hierarchy index need to be re-computed
+        Crawler.__registryVersion += 1
+        Crawler.__typeHierarchyIndex = {}
+        Crawler.__dispatchIndex = None
+
+    @staticmethod
+    def registryVersion():
+        """
+        Return a number that changes every time a crawler type is registered (or unregistered).
+
+        It can be used to invalidate information computed from the
+        registered crawler types.
+        """
+        return Crawler.__registryVersion
+
     @staticmethod
     def registeredType(name):
         """
@@ -274,24 +571,123 @@ class Crawler(object):
         """
         Return a list of registered subClasses for the given class or class type name.
         """
-        baseClass = Crawler.__baseClass(baseClassOrTypeName)
-        result = set()
-        for registeredType in Crawler.__registeredTypes.values():
-            if issubclass(registeredType, baseClass):
-                result.add(registeredType)
-        return list(result)
+        return list(Crawler.__typeHierarchy(baseClassOrTypeName)[0])
 
     @staticmethod
     def registeredSubTypes(baseClassOrTypeName):
         """
         Return a list of registered names of all derived classes for the given class or class type name.
         """
-        baseClass = Crawler.__baseClass(baseClassOrTypeName)
-        result = set()
-        for name, registeredType in Crawler.__registeredTypes.items():
-            if issubclass(registeredType, baseClass):
-                result.add(name)
-        return list(result)
+        return list(Crawler.__typeHierarchy(baseClassOrTypeName)[1])
+
+    @staticmethod
+    def isSubType(name, baseClassOrTypeName):
+        """
+        Return a boolean telling if the registered name is the given class or class type name (or derived from it).
+
+        The result is provided by the type hierarchy index, so it does
+        not scan the registered types.
+        """
+        return name in Crawler.__typeHierarchy(baseClassOrTypeName)[1]
+
+    @staticmethod
+    def registerLazyVars(crawlerClass, varNames, provider, cost='io', batchProvider=None):
+        """
+        Register a provider that computes variables on demand for the crawler class (including derived classes).
+
+        The provider is a callable that receives a crawler and returns a dict
+        containing the values for the variables (variables that cannot be
+        computed can be omitted). It gets called when one of the variables is
+        accessed for the first time (see Crawler.var), therefore the
+        variables are only part of the crawler (varNames, toJson...) once
+        they have been computed. The cost tells how expensive the provider is
+        (lazyVarCostCpu, lazyVarCostIo or lazyVarCostProcess), it's used by
+        resolveLazyVars to decide if the providers run in parallel. Optionally,
+        a batch provider can be used by resolveLazyVars to compute the
+        variables for multiple crawlers at once, it receives a list of
+        crawlers and returns a list of dicts (one per crawler).
+
+        Registering a provider for a derived class overrides the providers
+        of the base classes for the same variables.
+        """
+        assert issubclass(crawlerClass, Crawler), \
+            "Invalid crawler class!"
+
+        assert cost in (Crawler.lazyVarCostCpu, Crawler.lazyVarCostIo, Crawler.lazyVarCostProcess), \
+            "Invalid cost: {}".format(cost)
+
+        if crawlerClass not in Crawler.__lazyVarProviders:
+            Crawler.__lazyVarProviders[crawlerClass] = []
+
+        Crawler.__lazyVarProviders[crawlerClass].append(
+            {
+                'id': (crawlerClass, len(Crawler.__lazyVarProviders[crawlerClass])),
+                'varNames': list(varNames),
+                'provider': provider,
+                'cost': cost,
+                'batchProvider': batchProvider
+            }
+        )
+
+        # the index needs to be re-computed
+        Crawler.__lazyVarProvidersIndex = {}
+
+    @staticmethod
+    def registeredLazyVarNames(crawlerClass):
+        """
+        Return a list of variable names computed on demand for the crawler class.
+        """
+        return list(Crawler.__lazyVarProvidersByName(crawlerClass).keys())
+
+    @staticmethod
+    def resolveLazyVars(crawlers, varNames=None, workers=8):
+        """
+        Compute the lazy variables for multiple crawlers at once.
+
+        The crawlers are grouped by provider, where the providers that support
+        batches compute the variables for all the crawlers of the group at
+        once. Otherwise, the providers that are not cpu bound run through a pool
+        of threads (with the number of workers). By default all lazy
+        variables are computed, use varNames to compute only some of them.
+        """
+        pending = OrderedDict()
+        for crawler in crawlers:
+            crawlerVarNames = None
+            for name, provider in Crawler.__lazyVarProvidersByName(crawler.__class__).items():
+                if varNames is not None and name not in varNames:
+                    continue
+
+                if crawler.__resolvedLazyVars is not None and provider['id'] in crawler.__resolvedLazyVars:
+                    continue
+
+                if crawlerVarNames is None:
+                    crawlerVarNames = set(crawler.varNames())
+
+                if name in crawlerVarNames:
+                    continue
+
+                if provider['id'] not in pending:
+                    pending[provider['id']] = (provider, [])
+
+                providerCrawlers = pending[provider['id']][1]
+                if not providerCrawlers or providerCrawlers[-1] is not crawler:
+                    providerCrawlers.append(crawler)
+
+        for provider, providerCrawlers in pending.values():
+            if provider['batchProvider'] is not None:
+                results = provider['batchProvider'](providerCrawlers)
+            elif provider['cost'] == Crawler.lazyVarCostCpu or workers <= 0 or len(providerCrawlers) < 2:
+                results = list(map(provider['provider'], providerCrawlers))
+            else:
+                pool = ThreadPool(min(workers, len(providerCrawlers)))
+                try:
+                    results = pool.map(provider['provider'], providerCrawlers)
+                finally:
+                    pool.close()
+                    pool.join()
+
+            for crawler, values in zip(providerCrawlers, results):
+                crawler.__setLazyVars(provider, values)
 
     @staticmethod
     def createFromJson(jsonContents):
@@ -316,6 +712,17 @@ class Crawler(object):
 
         return crawler
 
+    @staticmethod
+    def createFromBinary(data):
+        """
+        Create a crawler based on the binary data (serialized via toBinary).
+        """
+        crawler = pickle.loads(data)
+        assert isinstance(crawler, Crawler), \
+            "Invalid crawler data!"
+
+        return crawler
+
     @staticmethod
     def group(crawlers, tag='group'):
         """
@@ -325,6 +732,11 @@ class Crawler(object):
         that contain the same tag value. The crawlers inside of the group are
         sorted alphabetically using the path by default. If you want to do a custom
         sorting, take a look at: Crawler.sortGroup
+
+        Collapsed crawlers (for instance image sequences collapsed by the
+        directory scan) carry the same tag as the crawlers they represent, so
+        they are grouped together with them without being expanded (see
+        Crawler.expand).
         """
         groupedCrawlers = OrderedDict()
         uniqueCrawlers = []
@@ -356,7 +768,295 @@ class Crawler(object):
         return result
 
     @staticmethod
-    def __collectCrawlers(crawler):
+    def globCrawlers(crawlers, filterTypes=[], useCache=True, workers=0, crawlIndex=None):
+        """
+        Return a list of all crawlers found recursively under the input crawlers.
+
+        This is the equivalent of calling glob for each one of the input crawlers
+        and joining the results. However, when workers is greater than zero all
+        the input crawlers are traversed together sharing the same pool of threads.
+        """
+        filterClasses = None
+        if filterTypes:
+            filterClasses = Crawler._filterClasses(filterTypes)
+
+        pendingCrawlers = []
+        for crawler in crawlers:
+            if not useCache or crawler.__cachedTraversal(filterClasses) is None:
+                pendingCrawlers.append(crawler)
+
+        # recursively collecting all crawlers for the pending crawlers (the
+        # filter is pushed down to the traversal, so the crawlers that
+        # cannot satisfy it are not created)
+        if workers > 0:
+            collectedCrawlers = Crawler.__collectCrawlersParallel(pendingCrawlers, workers, crawlIndex, filterClasses)
+        else:
+            collectedCrawlers = list(map(
+                lambda x: Crawler.__collectCrawlers(x, crawlIndex, filterClasses),
+                pendingCrawlers
+            ))
+
+        # the traversal is cached per filter
+        collectedByCrawler = {}
+        for crawler, collected in zip(pendingCrawlers, collectedCrawlers):
+            collectedByCrawler[id(crawler)] = collected
+            if filterClasses is None or crawler.__globCache is None:
+                crawler.__globCache = {}
+            crawler.__globCache[Crawler.__filterKey(filterClasses)] = collected
+
+        result = []
+        for crawler in crawlers:
+            if id(crawler) in collectedByCrawler:
+                result += collectedByCrawler[id(crawler)]
+            else:
+                result += crawler.__cachedTraversal(filterClasses)
+
+        if filterClasses is None:
+            return result
+
+        return list(filter(lambda x: Crawler.__matchFilter(x, filterClasses), result))
+
+    @staticmethod
+    def expand(crawlers):
+        """
+        Return a generator that yields the crawlers replacing the collapsed ones by the crawlers they represent.
+
+        A collapsed crawler represents multiple crawlers (for instance, the
+        frames of an image sequence collapsed by the directory scan, see
+        Fs.Directory.setCollapseSequences). The represented crawlers are only
+        created when the generator reaches them.
+        """
+        for crawler in crawlers:
+            collapsedCrawlers = crawler._collapsedCrawlers()
+            if collapsedCrawlers is None:
+                yield crawler
+            else:
+                for collapsedCrawler in collapsedCrawlers:
+                    yield collapsedCrawler
+
+    def _globCache(self, filterTypes=[]):
+        """
+        Return the list of crawlers cached by the glob traversal for the filter types (None when it has not been computed).
+
+        The traversal with filter types only contains the crawlers that can
+        satisfy them (plus the crawlers that are not leaf).
+        """
+        if self.__globCache is None:
+            return None
+
+        filterClasses = None
+        if filterTypes:
+            filterClasses = Crawler._filterClasses(filterTypes)
+
+        return self.__globCache.get(Crawler.__filterKey(filterClasses))
+
+    def _setGlobCache(self, crawlers, filterTypes=[]):
+        """
+        Set the list of crawlers found by the glob traversal for the filter types.
+
+        It's used to keep the cache up to date without globbing the crawler
+        again. The traversals cached for other filters are discarded.
+        """
+        filterClasses = None
+        if filterTypes:
+            filterClasses = Crawler._filterClasses(filterTypes)
+
+        self.__globCache = {
+            Crawler.__filterKey(filterClasses): crawlers
+        }
+
+    def _contents(self):
+        """
+        Return a tuple (vars, context var names, tags) about the data assigned to the crawler.
+
+        The vars only include the variables that have been set on the crawler
+        itself (the variables inherited from the parent crawler are not included).
+        """
+        return (
+            dict(self.__vars),
+            list(self.__contextVarNames),
+            dict(self.__tags or {})
+        )
+
+    @staticmethod
+    def _createFromContents(crawlerType, vars, contextVarNames=[], tags={}, parentCrawler=None):
+        """
+        Create a crawler based on the contents (returned by _contents) without calling its constructor.
+
+        The variables of the parent crawler are inherited by the new crawler
+        (the same way as it happens when the crawler is created through the
+        constructor), so the result is the same as the crawler used to compute
+        the contents.
+        """
+        crawlerClass = Crawler.__registeredTypes[crawlerType]
+        crawler = crawlerClass.__new__(crawlerClass)
+
+        crawler.__vars = dict(vars)
+        crawler.__baseVars = None
+        crawler.__varsSnapshot = None
+        crawler.__tags = dict(tags) if tags else None
+        crawler.__globCache = None
+        crawler.__resolvedLazyVars = None
+
+        # sharing the same immutable set across the crawlers with the same
+        # context variable names
+        contextVarNames = frozenset(contextVarNames)
+        crawler.__contextVarNames = Crawler.__contextVarNamesCache.setdefault(
+            contextVarNames,
+            contextVarNames
+        )
+
+        if parentCrawler:
+            assert isinstance(parentCrawler, Crawler), \
+                "Invalid crawler type!"
+            crawler.__baseVars = parentCrawler.__sharedVars()
+
+        crawler._restore(parentCrawler)
+
+        return crawler
+
+    def _restore(self, parentCrawler=None):
+        """
+        For re-implementation: Initialize the crawler created through _createFromContents.
+
+        In this case the constructor is not called, therefore crawlers that hold
+        data outside of the variables and tags should initialize it here.
+        """
+        pass
+
+    def _collapsedCrawlers(self):
+        """
+        For re-implementation: Return an iterator about the crawlers represented by a collapsed crawler.
+
+        Return None when the crawler is not collapsed (default), see Crawler.expand.
+        """
+        return None
+
+    def _collapsedClass(self):
+        """
+        For re-implementation: Return the class about the crawlers represented by a collapsed crawler.
+
+        It's used by glob to filter the collapsed crawlers by the type of the
+        crawlers they represent. Return None when the crawler is not collapsed (default).
+        """
+        return None
+
+    def _iterChildren(self, filterClasses=None):
+        """
+        For re-implementation: Return an iterator that yields the children crawlers.
+
+        When filter classes are provided (a tuple of crawler classes) the
+        leaf children that cannot be an instance of them (or represent them,
+        see _collapsedClass) can be skipped without being created, used by
+        glob to avoid creating crawlers that are going to be filtered out. By
+        default it iterates over the result of _computeChildren.
+        """
+        return iter(self._computeChildren())
+
+    def __resolveLazyVar(self, name):
+        """
+        Compute the lazy variable through its provider.
+
+        Return a boolean telling if the variable is available.
+        """
+        provider = Crawler.__lazyVarProvidersByName(self.__class__).get(name)
+        if provider is None:
+            return False
+
+        # the provider has already been called (it could not compute the variable)
+        if self.__resolvedLazyVars is not None and provider['id'] in self.__resolvedLazyVars:
+            return False
+
+        self.__setLazyVars(provider, provider['provider'](self))
+
+        return name in self.__vars
+
+    def __setLazyVars(self, provider, values):
+        """
+        Assign the values computed by the provider (variables that are already assigned are not overridden).
+        """
+        if self.__resolvedLazyVars is None:
+            self.__resolvedLazyVars = set()
+        self.__resolvedLazyVars.add(provider['id'])
+
+        varNames = set(self.varNames())
+        for name, value in values.items():
+            if name not in varNames:
+                self.setVar(name, value)
+
+    @staticmethod
+    def __lazyVarProvidersByName(crawlerClass):
+        """
+        Return a dict containing the lazy variable provider per variable name for the crawler class.
+        """
+        index = Crawler.__lazyVarProvidersIndex
+        if crawlerClass in index:
+            return index[crawlerClass]
+
+        # the providers from the derived classes have priority
+        result = OrderedDict()
+        for baseClass in crawlerClass.__mro__:
+            for provider in Crawler.__lazyVarProviders.get(baseClass, []):
+                for name in provider['varNames']:
+                    if name not in result:
+                        result[name] = provider
+
+        index[crawlerClass] = result
+
+        return result
+
+    @staticmethod
+    def _filterClasses(filterTypes):
+        """
+        Return a tuple containing the registered classes used to filter the input types.
+
+        The result is passed as the filter classes to _iterChildren (used by
+        glob and by the fs watcher).
+        """
+        result = set()
+        for filterType in filterTypes:
+            result.update(Crawler.__typeHierarchy(filterType)[0])
+
+        return tuple(result)
+
+    @staticmethod
+    def __filterKey(filterClasses):
+        """
+        Return the key used by the glob cache for the filter classes.
+        """
+        if filterClasses is None:
+            return None
+
+        return frozenset(filterClasses)
+
+    def __cachedTraversal(self, filterClasses):
+        """
+        Return the list of crawlers cached by the glob traversal that can be used by the filter classes (None when not available).
+
+        The traversal without filter is used by any filter.
+        """
+        if self.__globCache is None:
+            return None
+
+        if None in self.__globCache:
+            return self.__globCache[None]
+
+        return self.__globCache.get(Crawler.__filterKey(filterClasses))
+
+    @staticmethod
+    def __matchFilter(crawler, filterClasses):
+        """
+        Return a boolean telling if the crawler (or the crawlers it represents when collapsed) match the filter classes.
+        """
+        if isinstance(crawler, filterClasses):
+            return True
+
+        collapsedClass = crawler._collapsedClass()
+
+        return collapsedClass is not None and issubclass(collapsedClass, filterClasses)
+
+    @staticmethod
+    def __collectCrawlers(crawler, crawlIndex=None, filterClasses=None):
         """
         Resursively collect crawlers.
         """
@@ -364,8 +1064,260 @@ class Crawler(object):
         result.append(crawler)
 
         if not crawler.isLeaf():
-            for childCrawler in crawler.children():
-                result += Crawler.__collectCrawlers(childCrawler)
+            for childCrawler in Crawler.__computeChildren(crawler, crawlIndex, filterClasses):
+                result += Crawler.__collectCrawlers(childCrawler, crawlIndex, filterClasses)
+
+        return result
+
+    @staticmethod
+    def __collectCrawlersParallel(crawlers, workers, crawlIndex=None, filterClasses=None):
+        """
+        Collect crawlers recursively computing the children through a pool of threads.
+
+        Return a list containing the collected crawlers for each one of the input
+        crawlers (in the same order used by __collectCrawlers).
+        """
+        childrenByCrawler = {}
+        resultQueue = queue.Queue()
+        pendingTotal = 0
+
+        pool = ThreadPool(workers)
+        try:
+            # scheduling the children computation as soon as a non-leaf
+            # crawler is found, so the traversal is not bound to the
+            # depth of the tree
+            for crawler in crawlers:
+                if not crawler.isLeaf():
+                    pool.apply_async(Crawler.__computeChildrenTask, (crawler, resultQueue, crawlIndex, filterClasses))
+                    pendingTotal += 1
+
+            while pendingTotal:
+                crawler, children, error = resultQueue.get()
+                pendingTotal -= 1
+
+                if error is not None:
+                    raise error
+
+                childrenByCrawler[id(crawler)] = children
+                for childCrawler in children:
+                    if not childCrawler.isLeaf():
+                        pool.apply_async(Crawler.__computeChildrenTask, (childCrawler, resultQueue, crawlIndex, filterClasses))
+                        pendingTotal += 1
+        finally:
+            pool.terminate()
+            pool.join()
+
+        # assembling the result using the same order as the serial traversal
+        # (depth first)
+        result = []
+        for crawler in crawlers:
+            collected = []
+            stack = [crawler]
+            while stack:
+                currentCrawler = stack.pop()
+                collected.append(currentCrawler)
+                stack += reversed(childrenByCrawler.get(id(currentCrawler), []))
+            result.append(collected)
+
+        return result
+
+    @staticmethod
+    def __computeChildrenTask(crawler, resultQueue, crawlIndex=None, filterClasses=None):
+        """
+        Compute the children of the crawler and put the result in the queue.
+        """
+        try:
+            resultQueue.put((crawler, Crawler.__computeChildren(crawler, crawlIndex, filterClasses), None))
+        except Exception as err:
+            resultQueue.put((crawler, None, err))
+
+    @staticmethod
+    def __computeChildren(crawler, crawlIndex=None, filterClasses=None):
+        """
+        Return the children of the crawler (provided by the crawl index when available).
+
+        When filter classes are provided, the leaf children that cannot be an
+        instance of them may not be created (the crawl index always provides
+        all the children, since they are stored in the index).
+        """
+        if crawlIndex is not None:
+            return crawlIndex.children(crawler)
+
+        if filterClasses is None:
+            return crawler.children()
+
+        result = list(crawler._iterChildren(filterClasses))
+        for childCrawler in result:
+            assert isinstance(childCrawler, Crawler), \
+                "Invalid Crawler Type"
+
+        return result
+
+    def __flattenedContents(self):
+        """
+        Return a tuple (vars, context var names, tags) containing all the data about the crawler.
+
+        Differently from _contents, the vars include the variables inherited
+        from the parent crawler.
+        """
+        vars = {}
+        for varName in self.varNames():
+            vars[varName] = self.var(varName)
+
+        return (
+            vars,
+            list(self.__contextVarNames),
+            dict(self.__tags or {})
+        )
+
+    @staticmethod
+    def __copyValues(values):
+        """
+        Return a copy of the values dict where the mutable values are deep copied.
+        """
+        result = {}
+        for name, value in values.items():
+            if not isinstance(value, Crawler.__immutableValueTypes):
+                value = copy.deepcopy(value)
+            result[name] = value
+
+        return result
+
+    def __sharedVars(self):
+        """
+        Return a snapshot containing all the variables of the crawler.
+
+        The snapshot is referenced by the children of the crawler, therefore
+        it is never modified (a new snapshot is computed after a
+        variable gets changed).
+        """
+        if self.__varsSnapshot is None:
+            snapshot = {}
+            if self.__baseVars:
+                snapshot.update(self.__baseVars)
+            snapshot.update(self.__vars)
+
+            self.__varsSnapshot = snapshot
+
+        return self.__varsSnapshot
+
+    @staticmethod
+    def __updatedContextVarNames(contextVarNames, name, isContextVar):
+        """
+        Return the immutable set of context variable names after adding or removing the name.
+
+        The resulting sets are cached, so crawlers with the same context
+        variable names share the same set.
+        """
+        key = (contextVarNames, name, isContextVar)
+        if key not in Crawler.__contextVarNamesCache:
+            if isContextVar:
+                result = contextVarNames.union([name])
+            else:
+                result = contextVarNames.difference([name])
+
+            Crawler.__contextVarNamesCache[key] = result
+
+        return Crawler.__contextVarNamesCache[key]
+
+    @staticmethod
+    def __dispatchCandidates(data):
+        """
+        Return a list of (registered name, crawler class) that can be created for the data.
+
+        The list is sorted by the priority used to test the crawler types.
+        """
+        dispatchIndex = Crawler.__dispatchIndex
+        if dispatchIndex is None:
+            dispatchIndex = Crawler.__buildDispatchIndex()
+            Crawler.__dispatchIndex = dispatchIndex
+
+        priorityTypes, candidatesByKey = dispatchIndex
+
+        key = None
+        if isinstance(data, PathHolder):
+            key = data.ext()
+
+        # computing the candidates for the key in case it has not been
+        # computed yet
+        candidates = candidatesByKey.get(key)
+        if candidates is None:
+            candidates = []
+            for registeredName, crawlerTypeClass, extensions in priorityTypes:
+                if extensions is None or key in extensions:
+                    candidates.append((registeredName, crawlerTypeClass))
+
+            candidatesByKey[key] = candidates
+
+        return candidates
+
+    @staticmethod
+    def __buildDispatchIndex():
+        """
+        Build the dispatch index used to find the crawler types that can be created for a data.
+
+        Return a tuple containing a list with all registered types sorted by
+        priority (registered name, crawler class, extensions) and an empty
+        dict used to store the candidates per key (extension).
+        """
+        priorityTypes = []
+        for registeredName in reversed(list(Crawler.__registeredTypes.keys())):
+            crawlerTypeClass = Crawler.__registeredTypes[registeredName]
+
+            # the extensions are only taken in consideration when they
+            # are declared by the same class that implements the
+            # test (or a derived class of it)
+            extensions = None
+            testClass = Crawler.__implementationClass(crawlerTypeClass, 'test')
+            extensionsClass = Crawler.__implementationClass(crawlerTypeClass, 'testExtensions')
+            if issubclass(extensionsClass, testClass):
+                extensions = crawlerTypeClass.testExtensions()
+
+            if extensions is not None:
+                extensions = frozenset(extensions)
+
+            priorityTypes.append((registeredName, crawlerTypeClass, extensions))
+
+        return (priorityTypes, {})
+
+    @staticmethod
+    def __implementationClass(crawlerClass, attributeName):
+        """
+        Return the class that implements the attribute for the input crawler class.
+        """
+        for baseClass in crawlerClass.__mro__:
+            if attributeName in baseClass.__dict__:
+                return baseClass
+
+        return Crawler
+
+    @staticmethod
+    def __typeHierarchy(baseClassOrTypeName):
+        """
+        Return a tuple (frozenset of registered classes, frozenset of registered names) derived from the base class.
+
+        The result is memoized by the type hierarchy index, which is reset
+        when a crawler type is registered.
+        """
+        index = Crawler.__typeHierarchyIndex
+        if baseClassOrTypeName in index:
+            return index[baseClassOrTypeName]
+
+        baseClass = Crawler.__baseClass(baseClassOrTypeName)
+        if baseClass in index:
+            result = index[baseClass]
+        else:
+            subclasses = set()
+            names = set()
+            for name, registeredType in Crawler.__registeredTypes.items():
+                if issubclass(registeredType, baseClass):
+                    subclasses.add(registeredType)
+                    names.add(name)
+
+            result = (frozenset(subclasses), frozenset(names))
+            index[baseClass] = result
+
+        index[baseClassOrTypeName] = result
 
         return result
 
@@ -381,3 +1333,12 @@ class Crawler(object):
             assert issubclass(baseClassOrTypeName, Crawler)
             baseClass = baseClassOrTypeName
         return baseClass
+
+def _restoreCrawler(crawlerType, vars, contextVarNames, tags):
+    """
+    Recreate a pickled crawler (see Crawler.__reduce__).
+
+    It's defined at the module level since python 2 pickle can only look up
+    plain functions by their name.
+    """
+    return Crawler._createFromContents(crawlerType, vars, contextVarNames, tags)
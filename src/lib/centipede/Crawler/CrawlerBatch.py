@@ -0,0 +1,221 @@
+import copy
+import json
+import zlib
+from .Crawler import Crawler
+
+# compatibility with python 2/3
+try:
+    basestring
+except NameError:
+    basestring = str
+
+class InvalidCrawlerBatchError(Exception):
+    """Invalid crawler batch error."""
+
+
+class CrawlerBatch(object):
+    """
+    Columnar container used to serialize a list of crawlers.
+
+    Rather than serializing each crawler individually (repeating the variable
+    names and values shared by the crawlers), the batch stores:
+        - a dictionary with the variable and tag names used by the crawlers
+        - a table with the unique values (each value is stored once)
+        - a column per variable/tag containing the index of the value for each
+          crawler (or -1 when the crawler does not have it)
+        - a table with the unique sets of context variables and a column
+          telling the set used by each crawler
+
+    The batch is serialized as json, optionally compressed through zlib. The
+    legacy format (a json list where each item is a crawler serialized through
+    Crawler.toJson) is also supported when loading a batch.
+    """
+
+    __format = 'centipede.crawlerBatch'
+    __version = 1
+    __immutableValueTypes = (basestring, bool, int, float, type(None))
+
+    @staticmethod
+    def serialize(crawlers, compress=False):
+        """
+        Return the crawlers serialized as a batch (bytes when compressed, otherwise str).
+        """
+        varIndices = {}
+        varNames = []
+        varColumns = []
+        tagIndices = {}
+        tagNames = []
+        tagColumns = []
+        valueIndices = {}
+        values = []
+        contextVarIndices = {}
+        contextVarNames = []
+        contextVarColumn = []
+
+        total = 0
+        for crawler in crawlers:
+            for column in varColumns + tagColumns:
+                column.append(-1)
+
+            for varName in crawler.varNames():
+                column = CrawlerBatch.__column(varName, varIndices, varNames, varColumns, total)
+                column[total] = CrawlerBatch.__valueIndex(crawler.var(varName), valueIndices, values)
+
+            for tagName in crawler.tagNames():
+                column = CrawlerBatch.__column(tagName, tagIndices, tagNames, tagColumns, total)
+                column[total] = CrawlerBatch.__valueIndex(crawler.tag(tagName), valueIndices, values)
+
+            # the context variable names are stored as a list of var name indices
+            contextVarNameIndices = sorted(map(varIndices.__getitem__, crawler.contextVarNames()))
+            contextVarColumn.append(
+                CrawlerBatch.__valueIndex(contextVarNameIndices, contextVarIndices, contextVarNames)
+            )
+
+            total += 1
+
+        contents = json.dumps(
+            {
+                'format': CrawlerBatch.__format,
+                'version': CrawlerBatch.__version,
+                'total': total,
+                'varNames': varNames,
+                'tagNames': tagNames,
+                'values': values,
+                'contextVarNames': contextVarNames,
+                'varColumns': varColumns,
+                'tagColumns': tagColumns,
+                'contextVarColumn': contextVarColumn
+            },
+            separators=(',', ':')
+        )
+
+        if compress:
+            return zlib.compress(contents.encode('utf-8'), 1)
+
+        return contents
+
+    @staticmethod
+    def deserialize(data):
+        """
+        Return a list of crawlers based on the serialized data (see serialize).
+        """
+        # compressed data (zlib data starts with 0x78)
+        if isinstance(data, bytes) and data[:1] == b'x':
+            data = zlib.decompress(data)
+
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+
+        contents = json.loads(data)
+
+        # legacy format
+        if isinstance(contents, list):
+            return list(map(Crawler.createFromJson, contents))
+
+        if not isinstance(contents, dict) or contents.get('format') != CrawlerBatch.__format:
+            raise InvalidCrawlerBatchError('Invalid crawler batch data!')
+
+        if contents['version'] > CrawlerBatch.__version:
+            raise InvalidCrawlerBatchError(
+                'Unsupported crawler batch version: {}'.format(contents['version'])
+            )
+
+        varNames = contents['varNames']
+        tagNames = contents['tagNames']
+        values = contents['values']
+
+        # the context variable names are shared by the crawlers
+        contextVarNames = []
+        for contextVarIndices in contents['contextVarNames']:
+            contextVarNames.append(list(map(varNames.__getitem__, contextVarIndices)))
+
+        varColumns = list(zip(varNames, contents['varColumns']))
+        tagColumns = list(zip(tagNames, contents['tagColumns']))
+
+        result = []
+        for index in range(contents['total']):
+            vars = CrawlerBatch.__rowValues(varColumns, values, index)
+            tags = CrawlerBatch.__rowValues(tagColumns, values, index)
+
+            result.append(
+                Crawler._createFromContents(
+                    vars['type'],
+                    vars,
+                    contextVarNames[contents['contextVarColumn'][index]],
+                    tags
+                )
+            )
+
+        return result
+
+    @staticmethod
+    def write(crawlers, filePath, compress=False):
+        """
+        Write the crawlers serialized as a batch to the file path.
+        """
+        data = CrawlerBatch.serialize(crawlers, compress)
+        if not isinstance(data, bytes):
+            data = data.encode('utf-8')
+
+        with open(filePath, 'wb') as batchFile:
+            batchFile.write(data)
+
+    @staticmethod
+    def read(filePath):
+        """
+        Return a list of crawlers loaded from the file path (written by write or in the legacy format).
+        """
+        with open(filePath, 'rb') as batchFile:
+            return CrawlerBatch.deserialize(batchFile.read())
+
+    @staticmethod
+    def __rowValues(columns, values, index):
+        """
+        Return a dict containing the values for the crawler at the index.
+        """
+        result = {}
+        for name, column in columns:
+            valueIndex = column[index]
+            if valueIndex == -1:
+                continue
+
+            value = values[valueIndex]
+
+            # the values are shared by the crawlers, mutable values
+            # need to be copied
+            if not isinstance(value, CrawlerBatch.__immutableValueTypes):
+                value = copy.deepcopy(value)
+
+            result[name] = value
+
+        return result
+
+    @staticmethod
+    def __column(name, indices, names, columns, total):
+        """
+        Return the column for the name (the column is created when necessary).
+        """
+        if name not in indices:
+            indices[name] = len(names)
+            names.append(name)
+            columns.append([-1] * (total + 1))
+
+        return columns[indices[name]]
+
+    @staticmethod
+    def __valueIndex(value, indices, values):
+        """
+        Return the index for the value in the values (the value is added when necessary).
+        """
+        # the type is part of the key, so values that are equal but have
+        # different types (1 and True for instance) are not merged
+        if isinstance(value, CrawlerBatch.__immutableValueTypes):
+            key = (type(value), value)
+        else:
+            key = (None, json.dumps(value, sort_keys=True))
+
+        if key not in indices:
+            indices[key] = len(values)
+            values.append(value)
+
+        return indices[key]
@@ -5,6 +5,8 @@ class Ascii(File):
     Abstracted ascii crawler.
     """
 
+    __slots__ = ('__parsedContents',)
+
     def __init__(self, *args, **kwargs):
         """
         Create a ascii crawler.
@@ -14,6 +16,14 @@ class Ascii(File):
 
         self.setVar('category', 'ascii')
 
+    def _restore(self, parentCrawler=None):
+        """
+        Initialize the parsed contents of a crawler created through _createFromContents.
+        """
+        super(Ascii, self)._restore(parentCrawler)
+
+        self.__parsedContents = None
+
     def _runParser(self):
         """
         For re-implementation: Needs to return the parsed data.
@@ -6,6 +6,8 @@ class Json(Ascii):
     Json crawler.
     """
 
+    __slots__ = ()
+
     def _runParser(self):
         """
         Parse the json contents.
@@ -13,6 +15,13 @@ class Json(Ascii):
         with open(self.var('filePath')) as f:
             return json.load(f)
 
+    @classmethod
+    def testExtensions(cls):
+        """
+        Return the extensions that can pass the test.
+        """
+        return ['json']
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
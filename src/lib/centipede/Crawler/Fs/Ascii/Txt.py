@@ -5,6 +5,15 @@ class Txt(Ascii):
     Txt crawler.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def testExtensions(cls):
+        """
+        Return the extensions that can pass the test.
+        """
+        return ['txt']
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
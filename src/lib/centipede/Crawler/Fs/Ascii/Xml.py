@@ -10,6 +10,8 @@ class Xml(Ascii):
     Xml crawler.
     """
 
+    __slots__ = ('__cache',)
+
     def __init__(self, *args, **kwargs):
         """
         Constructor.
@@ -18,6 +20,14 @@ class Xml(Ascii):
 
         self.__cache = {}
 
+    def _restore(self, parentCrawler=None):
+        """
+        Initialize the cache of a crawler created through _createFromContents.
+        """
+        super(Xml, self)._restore(parentCrawler)
+
+        self.__cache = {}
+
     def queryTag(self, tag, ignoreNameSpace=True):
         """
         Query the values that are related to the specified tag.
@@ -28,6 +38,13 @@ class Xml(Ascii):
         """
         return self.__runQueryTag(tag, ignoreNameSpace)
 
+    @classmethod
+    def testExtensions(cls):
+        """
+        Return the extensions that can pass the test.
+        """
+        return ['xml']
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
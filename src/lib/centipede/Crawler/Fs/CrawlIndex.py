@@ -0,0 +1,270 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from ..Crawler import Crawler
+from .Directory import Directory
+
+class CrawlIndex(object):
+    """
+    Persistent crawl index backed by sqlite.
+
+    The index stores the contents (vars, context var names and tags) of the
+    crawlers found under each directory together with the modification time
+    and inode of the directory. When the children of a directory are requested
+    the directory is only listed again in case it has changed, otherwise the
+    crawlers are created directly from the index (without querying the files).
+
+    Since only the directories are checked, files that are modified in place
+    (without affecting the listing of the directory) are not detected, in this
+    case use remove or clear to invalidate the index. Directories are also
+    listed again when they are requested with a different option about
+    collapsing image sequences (see Directory.setCollapseSequences).
+    """
+
+    __version = 2
+
+    # directories modified within this interval (in seconds) from the moment
+    # they were indexed are listed again next time, since further modifications
+    # done in the same interval may not change the modification time
+    __racyInterval = 2.0
+
+    def __init__(self, filePath=':memory:'):
+        """
+        Create a crawl index object.
+
+        The index is stored in the file path (it is created in case it does not exist).
+        """
+        self.__filePath = filePath
+        self.__lock = threading.Lock()
+        self.__registryVersion = None
+        self.__stats = {
+            'listed': 0,
+            'restored': 0
+        }
+
+        self.__connection = sqlite3.connect(
+            filePath,
+            check_same_thread=False
+        )
+        self.__initialize()
+
+    def filePath(self):
+        """
+        Return the file path used by the index.
+        """
+        return self.__filePath
+
+    def children(self, crawler):
+        """
+        Return the children of the crawler.
+
+        For directory crawlers the children are created from the index when
+        the directory has not changed since it was indexed, otherwise the
+        directory is listed again and the result is stored in the index.
+        """
+        if not isinstance(crawler, Directory):
+            return crawler.children()
+
+        path = crawler.var('filePath')
+        stat = os.stat(path)
+        collapseSequences = crawler.collapseSequences()
+
+        contents = None
+        with self.__lock:
+            self.__validate()
+
+            row = self.__connection.execute(
+                'SELECT mtime, inode, collapseSequences FROM directory WHERE path = ?',
+                (path,)
+            ).fetchone()
+
+            if row is not None and row[0] == stat.st_mtime and row[1] == stat.st_ino and \
+                    bool(row[2]) == collapseSequences:
+                contents = self.__connection.execute(
+                    'SELECT contents FROM crawler WHERE parent = ? ORDER BY position',
+                    (path,)
+                ).fetchall()
+                self.__stats['restored'] += 1
+
+        # creating the crawlers from the index
+        if contents is not None:
+            result = []
+            for crawlerContents, in contents:
+                crawlerContents = json.loads(crawlerContents)
+                result.append(
+                    Crawler._createFromContents(
+                        crawlerContents['vars']['type'],
+                        crawlerContents['vars'],
+                        crawlerContents['contextVarNames'],
+                        crawlerContents['tags'],
+                        crawler
+                    )
+                )
+
+            return result
+
+        # listing the directory since it's not indexed or it has changed
+        result = crawler.children()
+        with self.__lock:
+            self.__store(path, stat, collapseSequences, result)
+            self.__stats['listed'] += 1
+
+        return result
+
+    def remove(self, path):
+        """
+        Remove the directory and all directories under it from the index.
+        """
+        with self.__lock:
+            self.__remove(path)
+            self.__connection.commit()
+
+    def clear(self):
+        """
+        Remove all the contents stored in the index.
+        """
+        with self.__lock:
+            self.__clear()
+            self.__connection.commit()
+
+    def stats(self):
+        """
+        Return a dict containing the total of directories listed and restored from the index.
+        """
+        with self.__lock:
+            return dict(self.__stats)
+
+    def close(self):
+        """
+        Close the index.
+        """
+        with self.__lock:
+            self.__connection.close()
+
+    def __initialize(self):
+        """
+        Create the tables used by the index.
+        """
+        # the commits are done for each directory, avoiding to wait for the
+        # disk on each one of them
+        self.__connection.execute('PRAGMA journal_mode=WAL')
+        self.__connection.execute('PRAGMA synchronous=NORMAL')
+
+        # the tables are re-created when they were created by a different
+        # version of the index (the layout of the tables may have changed)
+        userVersion = self.__connection.execute('PRAGMA user_version').fetchone()[0]
+        if userVersion != self.__version:
+            for tableName in ('info', 'directory', 'crawler'):
+                self.__connection.execute('DROP TABLE IF EXISTS {}'.format(tableName))
+            self.__connection.execute('PRAGMA user_version = {}'.format(self.__version))
+
+        self.__connection.execute(
+            'CREATE TABLE IF NOT EXISTS info (name TEXT PRIMARY KEY, value TEXT)'
+        )
+        self.__connection.execute(
+            'CREATE TABLE IF NOT EXISTS directory (path TEXT PRIMARY KEY, mtime REAL, inode INTEGER, collapseSequences INTEGER)'
+        )
+        self.__connection.execute(
+            'CREATE TABLE IF NOT EXISTS crawler (parent TEXT, position INTEGER, path TEXT, contents TEXT, PRIMARY KEY (parent, position))'
+        )
+        self.__connection.commit()
+
+    def __validate(self):
+        """
+        Clear the index in case it was created by a different version or crawler types.
+
+        The signature of the registered crawler types is only computed again
+        when a crawler type is registered (see Crawler.registryVersion).
+        """
+        registryVersion = Crawler.registryVersion()
+        if registryVersion == self.__registryVersion:
+            return
+
+        signature = [self.__version]
+        for registeredName in Crawler.registeredNames():
+            crawlerClass = Crawler.registeredType(registeredName)
+            signature.append(
+                [
+                    registeredName,
+                    '{}.{}'.format(crawlerClass.__module__, crawlerClass.__name__)
+                ]
+            )
+        signature = json.dumps(signature)
+
+        row = self.__connection.execute(
+            'SELECT value FROM info WHERE name = ?',
+            ('signature',)
+        ).fetchone()
+
+        if row is None or row[0] != signature:
+            self.__clear()
+            self.__connection.execute(
+                'INSERT OR REPLACE INTO info (name, value) VALUES (?, ?)',
+                ('signature', signature)
+            )
+            self.__connection.commit()
+
+        self.__registryVersion = registryVersion
+
+    def __store(self, path, stat, collapseSequences, crawlers):
+        """
+        Store the crawlers found under the directory path.
+        """
+        childPaths = set()
+        rows = []
+        for position, crawler in enumerate(crawlers):
+            vars, contextVarNames, tags = crawler._contents()
+            crawlerContents = {
+                'vars': vars,
+                'contextVarNames': contextVarNames,
+                'tags': tags
+            }
+
+            childPath = crawler.var('filePath')
+            childPaths.add(childPath)
+            rows.append((path, position, childPath, json.dumps(crawlerContents)))
+
+        # removing the directories that are no longer available
+        for previousPath, in self.__connection.execute('SELECT path FROM crawler WHERE parent = ?', (path,)).fetchall():
+            if previousPath not in childPaths:
+                self.__remove(previousPath)
+
+        # a racy directory is stored without the modification time, so
+        # it gets listed again next time
+        mtime = stat.st_mtime
+        if time.time() - mtime < self.__racyInterval:
+            mtime = None
+
+        self.__connection.execute('DELETE FROM crawler WHERE parent = ?', (path,))
+        self.__connection.executemany(
+            'INSERT INTO crawler (parent, position, path, contents) VALUES (?, ?, ?, ?)',
+            rows
+        )
+        self.__connection.execute(
+            'INSERT OR REPLACE INTO directory (path, mtime, inode, collapseSequences) VALUES (?, ?, ?, ?)',
+            (path, mtime, stat.st_ino, int(collapseSequences))
+        )
+        self.__connection.commit()
+
+    def __remove(self, path):
+        """
+        Remove the path and all paths under it from the index (without committing).
+        """
+        prefix = path.rstrip(os.sep) + os.sep
+        for tableName, columnName in (('directory', 'path'), ('crawler', 'parent')):
+            self.__connection.execute(
+                'DELETE FROM {0} WHERE {1} = ? OR substr({1}, 1, ?) = ?'.format(
+                    tableName,
+                    columnName
+                ),
+                (path, len(prefix), prefix)
+            )
+
+    def __clear(self):
+        """
+        Remove all the contents from the index (without committing).
+        """
+        self.__connection.execute('DELETE FROM directory')
+        self.__connection.execute('DELETE FROM crawler')
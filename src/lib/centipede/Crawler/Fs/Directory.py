@@ -5,11 +5,23 @@ from .FsPath import FsPath
 from ...PathHolder import PathHolder
 from ..Crawler import Crawler
 
+# compatibility with python 2/3 (os.scandir is only available on python 3.5+,
+# otherwise the scandir backport is used when available)
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
 class Directory(FsPath):
     """
     Directory crawler.
     """
 
+    __slots__ = ('__collapseSequences',)
+
     # checking for digits as prefix separated by x or X and finishing with digits as suffix
     __resolutionRegex = '^[0-9]+[x|X][0-9]+$'
 
@@ -22,6 +34,8 @@ class Directory(FsPath):
         """
         super(Directory, self).__init__(*args, **kwargs)
 
+        self.__collapseSequences = False
+
         # in case the directory has a name "<width>x<height>" lets extract
         # this information and assign that to variables
         if re.match(self.__resolutionRegex, self.var('name')):
@@ -39,28 +53,96 @@ class Directory(FsPath):
         """
         return False
 
+    def setCollapseSequences(self, collapseSequences):
+        """
+        Set if the image sequences found under the directory are collapsed.
+
+        When enabled, the frames of an image sequence are represented by a
+        single crawler (Image.ImageSequence) created directly by the directory
+        scan, where the crawlers of the frames are only created on demand
+        (see Crawler.expand). The option is passed to the sub directories.
+        """
+        self.__collapseSequences = bool(collapseSequences)
+
+    def collapseSequences(self):
+        """
+        Return a boolean telling if the image sequences found under the directory are collapsed.
+        """
+        return self.__collapseSequences
+
     def _computeChildren(self):
         """
         Return the directory contents.
         """
-        result = []
+        return list(self._iterChildren())
+
+    def _iterChildren(self, filterClasses=None):
+        """
+        Return a generator that creates the crawlers for the directory contents on demand.
+
+        When filter classes are provided, the files that cannot result in
+        a crawler of those classes are skipped (see _createChild).
+        """
+        currentPath = self.pathHolder().path()
+        entries = self.__listDirectory(currentPath)
+
+        # the collapsing is provided by the image sequence crawler (looked up
+        # through the registration to avoid a circular import)
+        if self.__collapseSequences:
+            for childCrawler in Crawler.registeredType('imageSequence').collapseChildren(self, entries, filterClasses):
+                yield childCrawler
+            return
+
+        for childFile, dirEntry in entries:
+            childCrawler = self._createChild(childFile, dirEntry, filterClasses)
+            if childCrawler is not None:
+                yield childCrawler
+
+    def _createChild(self, childFile, dirEntry=None, filterClasses=None):
+        """
+        Return a crawler for the file name under the directory.
+
+        Return None when the file is ignored. When filter classes are provided,
+        files (directories are never skipped) where none of the candidate crawler
+        types (see Crawler.candidateTypes) derive from them are ignored as
+        well, without creating their crawlers.
+        """
         currentPath = self.pathHolder().path()
-        for childFile in os.listdir(currentPath):
-
-            # skipping any file with an illegal name
-            if not re.match(self.__invalidFileNameRegex, childFile):
-                sys.stderr.write(
-                    'file ignored: "{}" (invalid characters)\n'.format(
-                        os.path.join(currentPath, childFile)
-                    )
+
+        # skipping any file with an illegal name
+        if not re.match(self.__invalidFileNameRegex, childFile):
+            sys.stderr.write(
+                'file ignored: "{}" (invalid characters)\n'.format(
+                    os.path.join(currentPath, childFile)
                 )
-                continue
+            )
+            return None
 
-            childPathHolder = PathHolder(os.path.join(currentPath, childFile))
-            childCrawler = Crawler.create(childPathHolder, self)
-            result.append(childCrawler)
+        childPathHolder = PathHolder(os.path.join(currentPath, childFile), dirEntry)
 
-        return result
+        if filterClasses is not None and not childPathHolder.isDirectory():
+            for candidateType in Crawler.candidateTypes(childPathHolder):
+                if issubclass(candidateType, filterClasses):
+                    break
+            else:
+                return None
+
+        childCrawler = Crawler.create(childPathHolder, self)
+
+        if isinstance(childCrawler, Directory):
+            childCrawler.setCollapseSequences(self.__collapseSequences)
+
+        return childCrawler
+
+    def _restore(self, parentCrawler=None):
+        """
+        Initialize the directory created through _createFromContents.
+        """
+        super(Directory, self)._restore(parentCrawler)
+
+        self.__collapseSequences = False
+        if isinstance(parentCrawler, Directory):
+            self.__collapseSequences = parentCrawler.collapseSequences()
 
     @classmethod
     def test(cls, pathHolder, parentCrawler):
@@ -71,6 +153,30 @@ class Directory(FsPath):
             return False
         return pathHolder.isDirectory()
 
+    @staticmethod
+    def __listDirectory(path):
+        """
+        Return a generator that yields (name, dir entry) for the contents of the directory.
+
+        The dir entries carry the information about the type of each entry
+        (and the stat on some platforms) provided by the listing itself, avoiding
+        extra stat calls later. In case scandir is not available the dir
+        entry is None.
+        """
+        if scandir is None:
+            for name in os.listdir(path):
+                yield (name, None)
+            return
+
+        iterator = scandir(path)
+        try:
+            for dirEntry in iterator:
+                yield (dirEntry.name, dirEntry)
+        finally:
+            # releasing the directory handle when the listing is interrupted
+            if hasattr(iterator, 'close'):
+                iterator.close()
+
 
 # registration
 Crawler.register(
@@ -6,6 +6,8 @@ class File(FsPath):
     File crawler.
     """
 
+    __slots__ = ()
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -13,6 +13,8 @@ class FsPath(Crawler):
     Abstracted file system Path.
     """
 
+    __slots__ = ('__pathHolder',)
+
     def __init__(self, filePathOrPathHolder, parentCrawler=None):
         """
         Create a crawler (use the factory function Path.create instead).
@@ -42,14 +44,18 @@ class FsPath(Crawler):
         """
         return self.__pathHolder
 
-    def globFromParent(self, filterTypes=[], useCache=True):
+    def globFromParent(self, filterTypes=[], useCache=True, crawlIndex=None):
         """
         Return a list of all crawlers found recursively under the parent directory of the given path.
 
         Filter result list by exact crawler type (str) or class type (includes derived classes).
         """
         parentPath = os.path.dirname(self.var("filePath"))
-        return FsPath.createFromPath(parentPath).glob(filterTypes, useCache)
+        return FsPath.createFromPath(parentPath).glob(
+            filterTypes,
+            useCache,
+            crawlIndex=crawlIndex
+        )
 
     @classmethod
     def test(cls, data=None, parentCrawler=None):
@@ -74,6 +80,14 @@ class FsPath(Crawler):
         else:
             return FsPath.create(PathHolder(fullPath), parentCrawler)
 
+    def _restore(self, parentCrawler=None):
+        """
+        Initialize the path holder of a crawler created through _createFromContents.
+        """
+        super(FsPath, self)._restore(parentCrawler)
+
+        self.__setPathHolder(PathHolder(self.var('filePath')))
+
     def __setPathHolder(self, pathHolder):
         """
         Set the path holder to the crawler.
@@ -1,10 +1,20 @@
 from .Oiio import Oiio
+from .ImageHeader import ImageHeader
 
 class Dpx(Oiio):
     """
     Dpx crawler.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def testExtensions(cls):
+        """
+        Return the extensions that can pass the test.
+        """
+        return ['dpx']
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -21,3 +31,11 @@ Dpx.register(
     'dpx',
     Dpx
 )
+
+# registering lazy variables (the header variables of the format)
+Dpx.registerLazyVars(
+    Dpx,
+    ImageHeader.varNames('dpx'),
+    Dpx._headerVars,
+    Dpx.lazyVarCostIo
+)
@@ -1,10 +1,20 @@
 from .Oiio import Oiio
+from .ImageHeader import ImageHeader
 
 class Exr(Oiio):
     """
     Exr crawler.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def testExtensions(cls):
+        """
+        Return the extensions that can pass the test.
+        """
+        return ['exr']
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -21,3 +31,11 @@ Exr.register(
     'exr',
     Exr
 )
+
+# registering lazy variables (the header variables of the format)
+Exr.registerLazyVars(
+    Exr,
+    ImageHeader.varNames('exr'),
+    Exr._headerVars,
+    Exr.lazyVarCostIo
+)
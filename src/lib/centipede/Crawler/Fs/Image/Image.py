@@ -1,10 +1,13 @@
 from ..File import File
+from ....PathHolder import internString
 
 class Image(File):
     """
     Abstracted image crawler.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create an image crawler.
@@ -22,76 +25,72 @@ class Image(File):
         """
         Return if path holder is holding a file that is part of a image sequence.
         """
-        # first test is to test agains the conventional image seq abc.0001.ext
-        isImageSeq = self.__isStandardSequence()
-
-        # second test is to check against the non-conventional image seq abc_0001.ext
-        if not isImageSeq:
-            isImageSeq = self.__isAmbiguousSequence()
+        return self.sequenceParts(self.pathHolder().baseName()) is not None
 
-        return isImageSeq
-
-    def __computeImageSequence(self):
+    @staticmethod
+    def sequenceParts(baseName):
         """
-        Compute the image sequence tags and vars.
-        """
-        nameParts = self.pathHolder().baseName().split(".")
-        frame = None
-        name = None
-        frameSep = None
-        if self.__isStandardSequence():
-            frame = nameParts[-2]
-            name = '.'.join(nameParts[:-2])
-            frameSep = "."
-        elif self.__isAmbiguousSequence():
-            nameParts = nameParts[0].split("_")
-            frame = nameParts[-1]
-            name = '_'.join(nameParts[:-1])
-            frameSep = "_"
-
-        if frame is not None:
-            self.setVar('imageType', 'sequence')
-            self.setVar('name', name)
-            self.setVar('frame', int(frame))
-            self.setVar('padding', len(frame))
-
-            # image sequence tag:
-            # this information is used to group files, we don't necessary
-            # need to obey the information about the padding from the file itself,
-            # since the sequence can be unpadded.
-            self.setTag(
-                'group',
-                '{0}{1}{2}.{3}'.format(
-                    name,
-                    frameSep,
-                    '#' * len(frame),
-                    self.var('ext')
-                )
-            )
-        else:
-            self.setTag('image', self.pathHolder().baseName())
+        Return a tuple (name, frame separator, frame, suffix) when the base name is part of an image sequence.
 
-    def __isStandardSequence(self):
+        The base name is tested against the conventional image seq abc.0001.ext and
+        the non-conventional image seq abc_0001.ext (the frame needs to have at
+        least 4 digits in this case). The suffix contains everything after the
+        frame (including the extension). Return None when the base name is
+        not part of an image sequence.
         """
-        Return a boolean telling if the crawler contains a standard image sequence.
+        nameParts = baseName.split(".")
+
+        # standard image sequence: abc.0001.ext
+        if len(nameParts) >= 3 and nameParts[-2].isdigit():
+            return (
+                '.'.join(nameParts[:-2]),
+                '.',
+                nameParts[-2],
+                '.' + nameParts[-1]
+            )
 
-        The crawler must follow the standard seq covention: abc.0001.ext
-        """
-        nameParts = self.pathHolder().baseName().split(".")
-        isImageSeq = (len(nameParts) >= 3 and self.pathHolder().baseName().split(".")[-2].isdigit())
+        # ambiguous image sequence: abc_0001.ext
+        parts = nameParts[0].rsplit("_", 1)
+        if len(parts) > 1 and parts[-1].isdigit() and len(parts[-1]) >= 4:
+            return (
+                parts[0],
+                '_',
+                parts[-1],
+                baseName[len(nameParts[0]):]
+            )
 
-        return isImageSeq
+        return None
 
-    def __isAmbiguousSequence(self):
+    def __computeImageSequence(self):
         """
-        Return a boolean telling if the crawler contains an ambiguous image sequence.
-
-        This crawler must follow the ambiguous seq covention: abc_0001.ext
+        Compute the image sequence tags and vars.
         """
-        nameParts = self.pathHolder().baseName().split(".")
-        parts = nameParts[0].split("_")
-        isImageSeq = False
-        if len(parts) > 1:
-            isImageSeq = (parts[-1].isdigit() and len(parts[-1]) >= 4)
-
-        return isImageSeq
+        sequenceParts = self.sequenceParts(self.pathHolder().baseName())
+        if sequenceParts is None:
+            self.setTag('image', self.pathHolder().baseName())
+            return
+
+        name, frameSep, frame, suffix = sequenceParts
+
+        # the name is shared by all the frames of the sequence, interning
+        # it to save memory
+        name = internString(name)
+
+        self.setVar('imageType', 'sequence')
+        self.setVar('name', name)
+        self.setVar('frame', int(frame))
+        self.setVar('padding', len(frame))
+
+        # image sequence tag:
+        # this information is used to group files, we don't necessary
+        # need to obey the information about the padding from the file itself,
+        # since the sequence can be unpadded.
+        self.setTag(
+            'group',
+            internString('{0}{1}{2}.{3}'.format(
+                name,
+                frameSep,
+                '#' * len(frame),
+                self.var('ext')
+            ))
+        )
@@ -0,0 +1,326 @@
+import os
+import struct
+
+class ImageHeaderError(Exception):
+    """Image header error."""
+
+class ImageHeader(object):
+    """
+    Native reader for the header of image files (exr, dpx, png and jpg).
+
+    The headers are parsed directly from the beginning of the files (only
+    the first few KB are read), without depending on OpenImageIO or ffprobe.
+    The information is returned as a dict of crawler variables (see varNames).
+    """
+
+    __exrMagic = b'\x76\x2f\x31\x01'
+    __pngSignature = b'\x89PNG\r\n\x1a\n'
+
+    # exr compression names (ImfCompression.h)
+    __exrCompressions = (
+        'none',
+        'rle',
+        'zips',
+        'zip',
+        'piz',
+        'pxr24',
+        'b44',
+        'b44a',
+        'dwaa',
+        'dwab'
+    )
+
+    # the variables provided by each format
+    __varNames = {
+        'exr': ['width', 'height', 'dataWindow', 'displayWindow', 'channels', 'compression'],
+        'dpx': ['width', 'height', 'bitDepth', 'orientation', 'descriptor', 'transfer', 'colorimetric', 'packing', 'encoding'],
+        'png': ['width', 'height', 'bitDepth', 'colorType', 'interlace'],
+        'jpg': ['width', 'height', 'bitDepth', 'components']
+    }
+
+    # extensions that share the same format
+    __extensionFormats = {
+        'exr': 'exr',
+        'dpx': 'dpx',
+        'png': 'png',
+        'jpg': 'jpg',
+        'jpeg': 'jpg'
+    }
+
+    # the headers are not supposed to be bigger than this (the header of
+    # an exr file containing hundreds of channels is still a few KB)
+    __maxHeaderSize = 1024 * 1024
+
+    @staticmethod
+    def supportedExtensions():
+        """
+        Return a list of extensions that can be read.
+        """
+        return list(ImageHeader.__extensionFormats.keys())
+
+    @staticmethod
+    def varNames(ext):
+        """
+        Return a list of variable names provided by the header of the extension (empty list when not supported).
+        """
+        imageFormat = ImageHeader.__extensionFormats.get(ext.lower())
+        if imageFormat is None:
+            return []
+
+        return list(ImageHeader.__varNames[imageFormat])
+
+    @staticmethod
+    def allVarNames():
+        """
+        Return a list of variable names provided by all supported formats.
+        """
+        result = []
+        for varNames in ImageHeader.__varNames.values():
+            for varName in varNames:
+                if varName not in result:
+                    result.append(varName)
+
+        return result
+
+    @staticmethod
+    def read(filePath, ext=None):
+        """
+        Return a dict with the variables read from the header of the image.
+
+        The format is based on the extension (by default the extension
+        of the file path).
+        """
+        if ext is None:
+            ext = os.path.splitext(filePath)[-1][1:]
+
+        imageFormat = ImageHeader.__extensionFormats.get(ext.lower())
+        if imageFormat is None:
+            raise ImageHeaderError(
+                'Unsupported image format: "{}"'.format(filePath)
+            )
+
+        try:
+            with open(filePath, 'rb') as imageFile:
+                if imageFormat == 'exr':
+                    return ImageHeader.__readExr(imageFile)
+                elif imageFormat == 'dpx':
+                    return ImageHeader.__readDpx(imageFile)
+                elif imageFormat == 'png':
+                    return ImageHeader.__readPng(imageFile)
+                else:
+                    return ImageHeader.__readJpg(imageFile)
+        except (IOError, OSError, struct.error, ValueError) as err:
+            raise ImageHeaderError(
+                'Could not read the header of "{}": {}'.format(filePath, err)
+            )
+
+    @staticmethod
+    def __readExr(imageFile):
+        """
+        Return the variables about an exr file.
+
+        The attributes of the header are read until the channels, compression,
+        data window and display window are found (for multi-part files the
+        header of the first part is used).
+        """
+        if imageFile.read(4) != ImageHeader.__exrMagic:
+            raise ImageHeaderError('Invalid exr file')
+
+        # version and flags
+        imageFile.read(4)
+
+        result = {}
+        headerSize = 8
+        while True:
+            name = ImageHeader.__readNullTerminated(imageFile)
+
+            # end of the header
+            if not name:
+                break
+
+            attributeType = ImageHeader.__readNullTerminated(imageFile)
+            size = ImageHeader.__unpack(imageFile, '<i')[0]
+
+            headerSize += len(name) + len(attributeType) + size + 6
+            if size < 0 or headerSize > ImageHeader.__maxHeaderSize:
+                raise ImageHeaderError('Invalid exr header')
+
+            data = imageFile.read(size)
+            if len(data) != size:
+                raise ImageHeaderError('Truncated exr header')
+
+            if name == b'channels' and attributeType == b'chlist':
+                result['channels'] = ImageHeader.__exrChannels(data)
+
+            elif name == b'compression' and attributeType == b'compression':
+                compression = struct.unpack('<B', data[:1])[0]
+                if compression < len(ImageHeader.__exrCompressions):
+                    result['compression'] = ImageHeader.__exrCompressions[compression]
+                else:
+                    result['compression'] = 'unknown'
+
+            elif name in (b'dataWindow', b'displayWindow') and attributeType == b'box2i':
+                result[name.decode('ascii')] = list(struct.unpack('<4i', data[:16]))
+
+            if len(result) == 4:
+                break
+
+        if 'displayWindow' not in result:
+            raise ImageHeaderError('Missing display window')
+
+        # following the resolution reported by OpenImageIO (full width/height)
+        xMin, yMin, xMax, yMax = result['displayWindow']
+        result['width'] = xMax - xMin + 1
+        result['height'] = yMax - yMin + 1
+
+        return result
+
+    @staticmethod
+    def __exrChannels(data):
+        """
+        Return a list with the channel names from the exr chlist attribute.
+        """
+        result = []
+        offset = 0
+        while offset < len(data):
+            end = data.index(b'\0', offset)
+            if end == offset:
+                break
+
+            result.append(data[offset:end].decode('utf-8'))
+
+            # pixel type (int), pLinear (uchar), reserved (3 chars), x and y sampling (int)
+            offset = end + 1 + 16
+
+        return result
+
+    @staticmethod
+    def __readDpx(imageFile):
+        """
+        Return the variables about a dpx file (based on the image information header and the first image element).
+        """
+        header = imageFile.read(808)
+        if len(header) != 808:
+            raise ImageHeaderError('Truncated dpx header')
+
+        if header[:4] == b'SDPX':
+            byteOrder = '>'
+        elif header[:4] == b'XPDS':
+            byteOrder = '<'
+        else:
+            raise ImageHeaderError('Invalid dpx file')
+
+        orientation, elements, width, height = struct.unpack_from(byteOrder + 'HHII', header, 768)
+        descriptor, transfer, colorimetric, bitDepth, packing, encoding = struct.unpack_from(
+            byteOrder + 'BBBBHH',
+            header,
+            800
+        )
+
+        return {
+            'width': width,
+            'height': height,
+            'bitDepth': bitDepth,
+            'orientation': orientation,
+            'descriptor': descriptor,
+            'transfer': transfer,
+            'colorimetric': colorimetric,
+            'packing': packing,
+            'encoding': encoding
+        }
+
+    @staticmethod
+    def __readPng(imageFile):
+        """
+        Return the variables about a png file (based on the IHDR chunk).
+        """
+        header = imageFile.read(29)
+        if len(header) != 29 or header[:8] != ImageHeader.__pngSignature or header[12:16] != b'IHDR':
+            raise ImageHeaderError('Invalid png file')
+
+        width, height, bitDepth, colorType, compression, filterMethod, interlace = struct.unpack_from(
+            '>IIBBBBB',
+            header,
+            16
+        )
+
+        return {
+            'width': width,
+            'height': height,
+            'bitDepth': bitDepth,
+            'colorType': colorType,
+            'interlace': interlace
+        }
+
+    @staticmethod
+    def __readJpg(imageFile):
+        """
+        Return the variables about a jpg file (based on the start of frame marker).
+        """
+        if imageFile.read(2) != b'\xff\xd8':
+            raise ImageHeaderError('Invalid jpg file')
+
+        while True:
+            marker = imageFile.read(1)
+            if marker != b'\xff':
+                raise ImageHeaderError('Invalid jpg marker')
+
+            # skipping fill bytes
+            while marker == b'\xff':
+                marker = imageFile.read(1)
+
+            if not marker:
+                raise ImageHeaderError('Missing jpg start of frame')
+
+            markerCode = ord(marker)
+
+            # markers without a segment (TEM and RSTn)
+            if markerCode == 0x01 or 0xd0 <= markerCode <= 0xd7:
+                continue
+
+            # reached the image data or the end of the image before the start of frame
+            if markerCode in (0xd9, 0xda):
+                raise ImageHeaderError('Missing jpg start of frame')
+
+            size = ImageHeader.__unpack(imageFile, '>H')[0]
+
+            # start of frame (excluding DHT, JPG and DAC)
+            if 0xc0 <= markerCode <= 0xcf and markerCode not in (0xc4, 0xc8, 0xcc):
+                bitDepth, height, width, components = ImageHeader.__unpack(imageFile, '>BHHB')
+
+                return {
+                    'width': width,
+                    'height': height,
+                    'bitDepth': bitDepth,
+                    'components': components
+                }
+
+            imageFile.seek(size - 2, os.SEEK_CUR)
+
+    @staticmethod
+    def __readNullTerminated(imageFile):
+        """
+        Return the bytes until the next null character (exr names are limited to 255 characters).
+        """
+        result = b''
+        while len(result) < 256:
+            char = imageFile.read(1)
+            if not char:
+                raise ImageHeaderError('Truncated header')
+            if char == b'\0':
+                return result
+            result += char
+
+        raise ImageHeaderError('Invalid header name')
+
+    @staticmethod
+    def __unpack(imageFile, structFormat):
+        """
+        Return the values read from the file based on the struct format.
+        """
+        size = struct.calcsize(structFormat)
+        data = imageFile.read(size)
+        if len(data) != size:
+            raise ImageHeaderError('Truncated header')
+
+        return struct.unpack(structFormat, data)
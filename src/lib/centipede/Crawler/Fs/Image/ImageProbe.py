@@ -0,0 +1,240 @@
+import os
+import json
+import threading
+import subprocess
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+from .ImageHeader import ImageHeader, ImageHeaderError
+
+try:
+    import OpenImageIO
+except ImportError:
+    hasOpenImageIO = False
+else:
+    hasOpenImageIO = True
+
+class OiioReadFileError(Exception):
+    """Oiio Read File Error."""
+
+class ImageProbe(object):
+    """
+    Batched probe about the resolution (width and height) of image crawlers.
+
+    Rather than reading the header of each image when its width/height is
+    requested for the first time (see Oiio.var), the crawlers are added to
+    the probe and their headers are read together through a pool of threads
+    (run). Optionally (propagateSequences) only one frame is read per image
+    sequence, where its resolution is assigned to the other frames of the
+    sequence (the frames are expected to have the same resolution).
+
+    The resolutions are cached per path together with the modification time
+    and size of the file, so files that have not changed are not read again
+    (the cache is shared by all probes and the lazy loading implemented by
+    the crawlers). The cache is size-bounded, where a file that has changed
+    replaces its previous entry.
+    """
+
+    # least recently used cache of resolutions
+    __cacheLock = threading.Lock()
+    __cache = OrderedDict()
+    __cacheSize = 16384
+
+    def __init__(self, workers=8, propagateSequences=False, reader=None):
+        """
+        Create an image probe object.
+
+        The reader is a callable that receives a file path and returns a
+        tuple (width, height), by default readResolution is used.
+        """
+        self.__workers = workers
+        self.__propagateSequences = propagateSequences
+        self.__reader = reader or ImageProbe.readResolution
+        self.__pending = OrderedDict()
+
+    def add(self, crawler):
+        """
+        Add a crawler to the pending requests.
+
+        Crawlers that already have the width and height are ignored.
+        """
+        if 'width' in crawler.varNames() and 'height' in crawler.varNames():
+            return
+
+        key = crawler.var('filePath')
+        if self.__propagateSequences and 'group' in crawler.tagNames():
+            key = (os.path.dirname(key), crawler.tag('group'))
+
+        if key not in self.__pending:
+            self.__pending[key] = []
+
+        self.__pending[key].append(crawler)
+
+    def addCrawlers(self, crawlers):
+        """
+        Add a list of crawlers to the pending requests.
+        """
+        for crawler in crawlers:
+            self.add(crawler)
+
+    def pending(self):
+        """
+        Return the number of files that are going to be read by run (ignoring the cache).
+        """
+        return len(self.__pending)
+
+    def run(self):
+        """
+        Read the resolution of the pending requests and assign it to the crawlers (width and height vars).
+
+        Return the number of files read from disk (files found in the
+        cache are not included). The crawlers about files that could not
+        be read are left without the resolution (so it's computed when
+        requested, see Oiio.var).
+        """
+        pending = list(self.__pending.values())
+        self.__pending = OrderedDict()
+
+        # the first crawler of each request is the one that is read
+        pathHolders = list(map(lambda x: x[0].pathHolder(), pending))
+
+        if self.__workers > 0 and len(pathHolders) > 1:
+            pool = ThreadPool(min(self.__workers, len(pathHolders)))
+            try:
+                results = pool.map(self.__probe, pathHolders)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = list(map(self.__probe, pathHolders))
+
+        total = 0
+        for crawlers, result in zip(pending, results):
+            if result is None:
+                continue
+
+            (width, height), fromDisk = result
+            for crawler in crawlers:
+                crawler.setVar('width', width)
+                crawler.setVar('height', height)
+
+            if fromDisk:
+                total += 1
+
+        return total
+
+    @staticmethod
+    def resolution(pathHolder, reader=None):
+        """
+        Return a tuple (width, height) about the image (the result is cached).
+        """
+        return ImageProbe.__cachedResolution(
+            pathHolder,
+            reader or ImageProbe.readResolution
+        )[0]
+
+    @staticmethod
+    def readResolution(filePath):
+        """
+        Return a tuple (width, height) read from the header of the image (not cached).
+
+        The formats supported by ImageHeader are read natively, otherwise
+        the header is read through OpenImageIO (or ffprobe when it's not available).
+        """
+        if ImageHeader.varNames(os.path.splitext(filePath)[-1][1:]):
+            try:
+                header = ImageHeader.read(filePath)
+            except ImageHeaderError:
+                pass
+            else:
+                return (header['width'], header['height'])
+
+        if hasOpenImageIO:
+            imageInput = OpenImageIO.ImageInput.open(filePath)
+
+            # making sure the image has been successfully loaded
+            if imageInput is None:
+                raise OiioReadFileError(
+                    "Can't read information from file:\n{}".format(
+                        filePath
+                    )
+                )
+
+            spec = imageInput.spec()
+            imageInput.close()
+
+            return (spec.full_width, spec.full_height)
+
+        return ImageProbe.__ffprobeResolution(filePath)
+
+    @staticmethod
+    def clearCache():
+        """
+        Remove all the resolutions stored in the cache.
+        """
+        with ImageProbe.__cacheLock:
+            ImageProbe.__cache.clear()
+
+    def __probe(self, pathHolder):
+        """
+        Return a tuple ((width, height), boolean telling if the file was read from disk).
+
+        Return None when the file cannot be read, so a single bad file
+        does not abort the whole batch.
+        """
+        try:
+            return ImageProbe.__cachedResolution(pathHolder, self.__reader)
+        except Exception:
+            return None
+
+    @staticmethod
+    def __cachedResolution(pathHolder, reader):
+        """
+        Return a tuple ((width, height), boolean telling if the file was read from disk).
+        """
+        path = pathHolder.path()
+
+        # querying the stat again (rather than the one memoized by the path
+        # holder), so files rewritten in the meantime are read again
+        stat = os.stat(path)
+        fileStat = (stat.st_mtime, stat.st_size)
+
+        with ImageProbe.__cacheLock:
+            cached = ImageProbe.__cache.pop(path, None)
+            if cached is not None and cached[0] == fileStat:
+                ImageProbe.__cache[path] = cached
+                return (cached[1], False)
+
+        # reading the file outside of the lock, so multiple files
+        # can be read at the same time
+        resolution = tuple(reader(path))
+
+        with ImageProbe.__cacheLock:
+            ImageProbe.__cache.pop(path, None)
+            ImageProbe.__cache[path] = (fileStat, resolution)
+            while len(ImageProbe.__cache) > ImageProbe.__cacheSize:
+                ImageProbe.__cache.popitem(last=False)
+
+        return (resolution, True)
+
+    @staticmethod
+    def __ffprobeResolution(filePath):
+        """
+        Return a tuple (width, height) queried through ffprobe.
+        """
+        # Get width and height from movie using ffprobe
+        cmd = 'ffprobe -v quiet -print_format json -show_entries stream=height,width {}'.format(filePath)
+
+        # calling ffmpeg
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=os.environ,
+            shell=True
+        )
+
+        # capturing the output
+        output, error = process.communicate()
+        result = json.loads(output.decode("utf-8"))
+
+        return (result['streams'][0]['width'], result['streams'][0]['height'])
@@ -0,0 +1,245 @@
+import os
+import re
+from ..File import File
+from .Image import Image
+from ...Crawler import Crawler
+from ....PathHolder import PathHolder, internString
+
+class ImageSequence(File):
+    """
+    Collapsed image sequence crawler.
+
+    It represents all the frames of an image sequence found by a directory
+    that collapses the image sequences (see Directory.setCollapseSequences).
+    The file path of the sequence uses "#" for the frame (abc.####.exr),
+    and the frames are stored as a list of inclusive ranges [[first, last], ...].
+    The crawlers for the frames are only created when they are requested
+    (see frameCrawlers and Crawler.expand).
+    """
+
+    __slots__ = ('__parentCrawler',)
+
+    # name, frame separator, padding and suffix of the sequence file path
+    __patternRegex = re.compile('^(.*)([._])(#+)(.*)$')
+
+    def __init__(self, filePathOrPathHolder, parentCrawler=None, frames=[], frameType='generic'):
+        """
+        Create an image sequence crawler.
+        """
+        super(ImageSequence, self).__init__(filePathOrPathHolder, parentCrawler)
+        self.__parentCrawler = parentCrawler
+
+        name, frameSep, padding, suffix = self.__patternParts()
+        frameRange = self.__frameRange(frames)
+
+        self.setVar('category', 'image')
+        self.setVar('imageType', 'sequence')
+        self.setVar('name', internString(name))
+        self.setVar('padding', padding)
+        self.setVar('frameType', frameType)
+        self.setVar('frameRange', frameRange)
+        if frameRange:
+            self.setVar('firstFrame', frameRange[0][0])
+            self.setVar('lastFrame', frameRange[-1][-1])
+
+        # using the same group tag as the frames
+        self.setTag(
+            'group',
+            internString('{0}{1}{2}.{3}'.format(
+                name,
+                frameSep,
+                '#' * padding,
+                self.var('ext')
+            ))
+        )
+
+    def frames(self):
+        """
+        Return the frame numbers that are part of the sequence.
+        """
+        result = []
+        for firstFrame, lastFrame in self.var('frameRange'):
+            result += range(firstFrame, lastFrame + 1)
+
+        return result
+
+    def framePaths(self):
+        """
+        Return a list with the file paths of the frames.
+        """
+        name, frameSep, padding, suffix = self.__patternParts()
+        directory = os.path.dirname(self.var('filePath'))
+
+        result = []
+        for frame in self.frames():
+            result.append(
+                os.path.join(
+                    directory,
+                    '{0}{1}{2}{3}'.format(
+                        name,
+                        frameSep,
+                        str(frame).zfill(padding),
+                        suffix
+                    )
+                )
+            )
+
+        return result
+
+    def frameCrawlers(self):
+        """
+        Return a generator that creates the crawlers for the frames.
+
+        The frames are created as children of the directory that collapsed the
+        sequence. When the directory is not available (for instance, a clone
+        or a deserialized sequence) the frames are created as children of
+        a directory crawler created from the directory of the sequence, which
+        receives the context variables of the sequence.
+        """
+        parentCrawler = self.__parentCrawler
+        if parentCrawler is None:
+            parentCrawler = Crawler.create(PathHolder(os.path.dirname(self.var('filePath'))))
+            for contextVarName in self.contextVarNames():
+                parentCrawler.setVar(contextVarName, self.var(contextVarName), True)
+
+        for framePath in self.framePaths():
+            yield Crawler.create(PathHolder(framePath), parentCrawler)
+
+    @classmethod
+    def test(cls, pathHolder, parentCrawler):
+        """
+        Image sequences are only created by the directory scan.
+        """
+        return False
+
+    @classmethod
+    def testExtensions(cls):
+        """
+        Return the extensions that can pass the test (none).
+        """
+        return []
+
+    @staticmethod
+    def collapseChildren(directoryCrawler, entries, filterClasses=None):
+        """
+        Return a generator that yields the crawlers for the entries of the directory collapsing the image sequences.
+
+        The sequences are detected in a single pass over the entries (name,
+        dir entry). A sequence with more than one frame where the first frame
+        results in an image crawler is yielded as an ImageSequence (at the
+        position of its first frame), everything else is yielded as
+        regular crawlers. The filter classes are passed to the creation of
+        the crawlers (see Directory._createChild), where an image sequence
+        is kept when it is accepted by the filter.
+        """
+        # the first frame of a sequence is always created when the filter
+        # accepts image sequences, since it's used to create the sequence
+        sequenceFilterClasses = filterClasses
+        if filterClasses is not None and issubclass(ImageSequence, filterClasses):
+            sequenceFilterClasses = None
+
+        items = []
+        sequences = {}
+        for childFile, dirEntry in entries:
+            sequenceParts = None
+
+            # directories are never collapsed
+            if dirEntry is None or not dirEntry.is_dir():
+                sequenceParts = Image.sequenceParts(childFile)
+
+            if sequenceParts is None:
+                items.append((None, childFile, dirEntry))
+                continue
+
+            name, frameSep, frame, suffix = sequenceParts
+            key = (name, frameSep, len(frame), suffix)
+            if key not in sequences:
+                sequences[key] = []
+                items.append((key, childFile, dirEntry))
+
+            sequences[key].append((int(frame), childFile, dirEntry))
+
+        for key, childFile, dirEntry in items:
+            if key is not None and len(sequences[key]) > 1:
+                crawler = directoryCrawler._createChild(childFile, dirEntry, sequenceFilterClasses)
+            else:
+                crawler = directoryCrawler._createChild(childFile, dirEntry, filterClasses)
+
+            if key is not None and len(sequences[key]) > 1 and crawler is not None and \
+                    'imageType' in crawler.varNames() and crawler.var('imageType') == 'sequence':
+
+                name, frameSep, padding, suffix = key
+                sequencePath = os.path.join(
+                    directoryCrawler.var('filePath'),
+                    '{0}{1}{2}{3}'.format(name, frameSep, '#' * padding, suffix)
+                )
+
+                sequence = ImageSequence(
+                    PathHolder(sequencePath),
+                    directoryCrawler,
+                    list(map(lambda x: x[0], sequences[key])),
+                    crawler.var('type')
+                )
+                sequence.setVar('type', 'imageSequence')
+
+                yield sequence
+                continue
+
+            if crawler is not None:
+                yield crawler
+
+            # the frames that could not be collapsed
+            if key is not None:
+                for frame, frameFile, frameDirEntry in sequences[key][1:]:
+                    frameCrawler = directoryCrawler._createChild(frameFile, frameDirEntry, filterClasses)
+                    if frameCrawler is not None:
+                        yield frameCrawler
+
+    def _restore(self, parentCrawler=None):
+        """
+        Initialize the parent crawler of a crawler created through _createFromContents.
+        """
+        super(ImageSequence, self)._restore(parentCrawler)
+
+        self.__parentCrawler = parentCrawler
+
+    def _collapsedCrawlers(self):
+        """
+        Return a generator that creates the crawlers for the frames.
+        """
+        return self.frameCrawlers()
+
+    def _collapsedClass(self):
+        """
+        Return the class used by the frames.
+        """
+        return Crawler.registeredType(self.var('frameType'))
+
+    def __patternParts(self):
+        """
+        Return a tuple (name, frame separator, padding, suffix) based on the file path of the sequence.
+        """
+        name, frameSep, padding, suffix = self.__patternRegex.match(self.var('baseName')).groups()
+
+        return (name, frameSep, len(padding), suffix)
+
+    @staticmethod
+    def __frameRange(frames):
+        """
+        Return a list of inclusive ranges [[first, last], ...] for the frames.
+        """
+        result = []
+        for frame in sorted(set(frames)):
+            if result and result[-1][-1] == frame - 1:
+                result[-1][-1] = frame
+            else:
+                result.append([frame, frame])
+
+        return result
+
+
+# registration
+Crawler.register(
+    'imageSequence',
+    ImageSequence
+)
@@ -1,10 +1,20 @@
 from .Oiio import Oiio
+from .ImageHeader import ImageHeader
 
 class Jpg(Oiio):
     """
     Jpg crawler.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def testExtensions(cls):
+        """
+        Return the extensions that can pass the test.
+        """
+        return ['jpg']
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -21,3 +31,11 @@ Jpg.register(
     'jpg',
     Jpg
 )
+
+# registering lazy variables (the header variables of the format)
+Jpg.registerLazyVars(
+    Jpg,
+    ImageHeader.varNames('jpg'),
+    Jpg._headerVars,
+    Jpg.lazyVarCostIo
+)
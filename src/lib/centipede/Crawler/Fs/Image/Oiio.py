@@ -1,70 +1,48 @@
 from .Image import Image
-import subprocess
-import os
-import json
-
-try:
-    import OpenImageIO
-except ImportError:
-    hasOpenImageIO = False
-else:
-    hasOpenImageIO = True
-
-class OiioReadFileError(Exception):
-    """Oiio Read File Error."""
+from .ImageProbe import ImageProbe
+from .ImageHeader import ImageHeader, ImageHeaderError
 
 class Oiio(Image):
     """
     Open image io crawler.
-    """
-
-    def var(self, name):
-        """
-        Return var value using lazy loading implementation for width and height.
-        """
-        if name in ['width', 'height'] and name not in self.varNames():
-            # alternatively width and height information could come from the
-            # parent directory crawler "1920x1080". For more details take a look
-            # at "Directory" crawler.
-            if hasOpenImageIO:
-                imageInput = OpenImageIO.ImageInput.open(self.pathHolder().path())
 
-                # making sure the image has been successfully loaded
-                if imageInput is None:
-                    raise OiioReadFileError(
-                        "Can't read information from file:\n{}".format(
-                            self.pathHolder().path()
-                        )
-                    )
-
-                spec = imageInput.spec()
-                self.setVar('width', spec.full_width)
-                self.setVar('height', spec.full_height)
-
-                imageInput.close()
-            else:
-                self.__getWidthHeight()
+    The information about the image header is provided as lazy variables:
+    the width and height are available for any image, while the format
+    specific variables (see ImageHeader.varNames) are registered by the
+    crawlers of the formats that provide them. To query the width and
+    height of multiple crawlers at once use ImageProbe.
+    """
 
-        return super(Oiio, self).var(name)
+    __slots__ = ()
 
-    def __getWidthHeight(self):
+    def _headerVars(self):
         """
-        Query width and height using ffprobe and set them as crawler variables.
-        """
-        # Get width and height from movie using ffprobe
-        cmd = 'ffprobe -v quiet -print_format json -show_entries stream=height,width {}'.format(self.var('filePath'))
-
-        # calling ffmpeg
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            env=os.environ,
-            shell=True
-        )
+        Return a dict containing the variables about the header of the image.
 
-        # capturing the output
-        output, error = process.communicate()
-        result = json.loads(output.decode("utf-8"))
-        self.setVar('width', result['streams'][0]['width'])
-        self.setVar('height', result['streams'][0]['height'])
+        The header is read natively for the formats supported by ImageHeader,
+        otherwise (or when the file cannot be read natively) only the width and
+        height are read through ImageProbe.
+        """
+        result = {}
+        if ImageHeader.varNames(self.var('ext')):
+            try:
+                result = ImageHeader.read(self.pathHolder().path(), self.var('ext'))
+            except ImageHeaderError:
+                pass
+
+        # alternatively width and height information could come from the
+        # parent directory crawler "1920x1080". For more details take a look
+        # at "Directory" crawler.
+        if 'width' not in result:
+            result['width'], result['height'] = ImageProbe.resolution(self.pathHolder())
+
+        return result
+
+
+# registering lazy variables
+Oiio.registerLazyVars(
+    Oiio,
+    ['width', 'height'],
+    Oiio._headerVars,
+    Oiio.lazyVarCostIo
+)
@@ -1,10 +1,20 @@
 from .Oiio import Oiio
+from .ImageHeader import ImageHeader
 
 class Png(Oiio):
     """
     Png crawler.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def testExtensions(cls):
+        """
+        Return the extensions that can pass the test.
+        """
+        return ['png']
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -21,3 +31,11 @@ Png.register(
     'png',
     Png
 )
+
+# registering lazy variables (the header variables of the format)
+Png.registerLazyVars(
+    Png,
+    ImageHeader.varNames('png'),
+    Png._headerVars,
+    Png.lazyVarCostIo
+)
@@ -1,6 +1,9 @@
 from .Image import Image
-from .Oiio import Oiio, OiioReadFileError
+from .ImageHeader import ImageHeader, ImageHeaderError
+from .ImageProbe import ImageProbe, OiioReadFileError
+from .Oiio import Oiio
 from .Exr import Exr
 from .Dpx import Dpx
 from .Jpg import Jpg
 from .Png import Png
+from .ImageSequence import ImageSequence
@@ -5,13 +5,14 @@ class Ccc(Lut):
     Parses a Ccc or a Cc file.
     """
 
-    def __init__(self, *args, **kwargs):
+    __slots__ = ()
+
+    @classmethod
+    def testExtensions(cls):
         """
-        Create a Ccc object.
+        Return the extensions that can pass the test.
         """
-        super(Ccc, self).__init__(*args, **kwargs)
-
-        self.__parseXML()
+        return ['ccc', 'cc']
 
     @classmethod
     def test(cls, pathHolder, parentCrawler):
@@ -20,9 +21,9 @@ class Ccc(Lut):
         """
         return pathHolder.ext() in ['ccc', 'cc']
 
-    def __parseXML(self):
+    def _cccVars(self):
         """
-        Parse the ccc file (XML file format) information and assign that to the crawler.
+        Parse the ccc file (XML file format) returning its information as a dict of variables.
         """
         tags = ['Slope', 'Offset', 'Power', 'Saturation']
         requireTags = ['ColorCorrection', 'ColorCorrectionCollection']
@@ -32,14 +33,16 @@ class Ccc(Lut):
             self.queryTag(tag)
 
         # Get the values from the cdl file
+        result = {}
         for tag in tags:
             tagValue = self.queryTag(tag)
             if tag == 'Saturation':
-                self.setVar(tag.lower(), float(tagValue[0]))
+                result[tag.lower()] = float(tagValue[0])
                 continue
 
-            value = list(map(float, tagValue[0].split(" ")))
-            self.setVar(tag.lower(), value)
+            result[tag.lower()] = list(map(float, tagValue[0].split(" ")))
+
+        return result
 
 
 # registering crawler
@@ -53,3 +56,12 @@ Ccc.register(
     'cc',
     Ccc
 )
+
+# registering lazy variables (the file is only parsed when the
+# variables are accessed)
+Ccc.registerLazyVars(
+    Ccc,
+    ['slope', 'offset', 'power', 'saturation'],
+    Ccc._cccVars,
+    Ccc.lazyVarCostIo
+)
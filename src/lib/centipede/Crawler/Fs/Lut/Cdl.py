@@ -5,13 +5,14 @@ class Cdl(Lut):
     Parses a cdl file.
     """
 
-    def __init__(self, *args, **kwargs):
+    __slots__ = ()
+
+    @classmethod
+    def testExtensions(cls):
         """
-        Create a Cdl object.
+        Return the extensions that can pass the test.
         """
-        super(Cdl, self).__init__(*args, **kwargs)
-
-        self.__parseXML()
+        return ['cdl']
 
     @classmethod
     def test(cls, pathHolder, parentCrawler):
@@ -20,9 +21,9 @@ class Cdl(Lut):
         """
         return pathHolder.ext() == 'cdl'
 
-    def __parseXML(self):
+    def _cdlVars(self):
         """
-        Parse the cld file (XML file format) information and assign that to the crawler.
+        Parse the cld file (XML file format) returning its information as a dict of variables.
         """
         cdlTags = ['Slope', 'Offset', 'Power', 'Saturation']
         cdlRequireTags = ['ColorCorrection', 'ColorDecision', 'ColorDecisionList']
@@ -32,14 +33,16 @@ class Cdl(Lut):
             self.queryTag(tag)
 
         # Get the values from the cdl file
+        result = {}
         for tag in cdlTags:
             tagValue = self.queryTag(tag)
             if tag == 'Saturation':
-                self.setVar(tag.lower(), float(tagValue[0]))
+                result[tag.lower()] = float(tagValue[0])
                 continue
 
-            value = list(map(float, tagValue[0].split(" ")))
-            self.setVar(tag.lower(), value)
+            result[tag.lower()] = list(map(float, tagValue[0].split(" ")))
+
+        return result
 
 
 # registering crawler
@@ -47,3 +50,12 @@ Cdl.register(
     'cdl',
     Cdl
 )
+
+# registering lazy variables (the file is only parsed when the
+# variables are accessed)
+Cdl.registerLazyVars(
+    Cdl,
+    ['slope', 'offset', 'power', 'saturation'],
+    Cdl._cdlVars,
+    Cdl.lazyVarCostIo
+)
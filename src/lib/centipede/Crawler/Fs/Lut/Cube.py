@@ -8,6 +8,15 @@ class Cube(Lut):
     future releases.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def testExtensions(cls):
+        """
+        Return the extensions that can pass the test.
+        """
+        return ['cube', 'ccc', 'cc', 'cdl']
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
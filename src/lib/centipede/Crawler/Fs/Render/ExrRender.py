@@ -1,10 +1,13 @@
 from ..Image import Exr
+from ....PathHolder import internString
 
 class ExrRender(Exr):
     """
     Abstracted crawler used to detect renders.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a Render object.
@@ -13,5 +16,7 @@ class ExrRender(Exr):
 
         self.setVar('category', 'render')
 
-        parts = self.var("name").split("_")
+        # the parts are shared by all the frames of the render, interning
+        # them to save memory
+        parts = list(map(internString, self.var("name").split("_")))
         self.setVar('renderType', parts[-1])
@@ -1,23 +1,28 @@
 from .ExrRender import ExrRender
+from ....PathHolder import internString
 
 class NukeRender(ExrRender):
     """
     Custom crawler to parse information from a Nuke render.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a NukeRender object.
         """
         super(NukeRender, self).__init__(*args, **kwargs)
 
-        parts = self.var("name").split("_")
-        locationParts = parts[0].split("-")
+        # the parts are shared by all the frames of the render, interning
+        # them to save memory
+        parts = list(map(internString, self.var("name").split("_")))
+        locationParts = list(map(internString, parts[0].split("-")))
 
         # Add the job var once job names on disk match job code names in shotgun
         # self.setVar('job', locationParts[0])
         self.setVar('seq', locationParts[1])
-        self.setVar('shot', '-'.join(locationParts))
+        self.setVar('shot', internString('-'.join(locationParts)))
         self.setVar('step', parts[-5])
         self.setVar('renderName', parts[-4])
         self.setVar('output', parts[-3])
@@ -29,6 +34,13 @@ class NukeRender(ExrRender):
         isMatte = 'matte' in self.var('output').lower()
         self.setVar('isMatte', int(isMatte))
 
+    @classmethod
+    def testExtensions(cls):
+        """
+        Return the extensions that can pass the test.
+        """
+        return ['exr']
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -1,18 +1,23 @@
 from .ExrRender import ExrRender
+from ....PathHolder import internString
 
 class ShotRender(ExrRender):
     """
     Custom crawler used to detect renders for shots.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a Render object.
         """
         super(ShotRender, self).__init__(*args, **kwargs)
 
-        parts = self.var("name").split("_")
-        locationParts = parts[0].split("-")
+        # the parts are shared by all the frames of the render, interning
+        # them to save memory
+        parts = list(map(internString, self.var("name").split("_")))
+        locationParts = list(map(internString, parts[0].split("-")))
 
         # Add the job var once job names on disk match job code names in shotgun
         # self.setVar('job', locationParts[0])
@@ -20,13 +25,20 @@ class ShotRender(ExrRender):
         self.setVar('shot', parts[0], True)
         self.setVar('step', parts[1], True)
         self.setVar('pass', parts[2], True)
-        self.setVar('renderName', '{}-{}'.format(
+        self.setVar('renderName', internString('{}-{}'.format(
             self.var('step'),
             self.var('pass')
-            ),
+            )),
             True
         )
 
+    @classmethod
+    def testExtensions(cls):
+        """
+        Return the extensions that can pass the test.
+        """
+        return ['exr']
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -1,17 +1,22 @@
 from .ExrRender import ExrRender
+from ....PathHolder import internString
 
 class Turntable(ExrRender):
     """
     Custom crawler used to detect turntable renders.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a Turntable object.
         """
         super(Turntable, self).__init__(*args, **kwargs)
 
-        parts = self.var("name").split("_")
+        # the parts are shared by all the frames of the render, interning
+        # them to save memory
+        parts = list(map(internString, self.var("name").split("_")))
 
         # Add the job var once job names on disk match job code names in shotgun
         # self.setVar('job', parts[0])
@@ -19,14 +24,21 @@ class Turntable(ExrRender):
         self.setVar('step', parts[2], True)
         self.setVar('variant', parts[3], True)
         self.setVar('pass', parts[4], True)
-        self.setVar('renderName', '{}-{}-{}'.format(
+        self.setVar('renderName', internString('{}-{}-{}'.format(
             self.var('assetName'),
             self.var('variant'),
             self.var('pass')
-            ),
+            )),
             True
         )
 
+    @classmethod
+    def testExtensions(cls):
+        """
+        Return the extensions that can pass the test.
+        """
+        return ['exr']
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
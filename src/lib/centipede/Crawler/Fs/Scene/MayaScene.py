@@ -5,6 +5,8 @@ class MayaScene(Scene):
     Crawler used to detect maya scenes.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a MayaScene object.
@@ -18,6 +20,13 @@ class MayaScene(Scene):
         """
         return ['ma', 'mb']
 
+    @classmethod
+    def testExtensions(cls):
+        """
+        Return the extensions that can pass the test.
+        """
+        return cls.extensions()
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
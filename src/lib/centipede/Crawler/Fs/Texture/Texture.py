@@ -5,6 +5,8 @@ class Texture(Oiio):
     Custom crawler used to detect textures.
     """
 
+    __slots__ = ()
+
     __groupTextures = True
 
     def __init__(self, *args, **kwargs):
@@ -36,6 +38,13 @@ class Texture(Oiio):
         if self.__groupTextures and name in ['assetName', 'variant']:
             self.__updateGroupTag()
 
+    @classmethod
+    def testExtensions(cls):
+        """
+        Return the extensions that can pass the test.
+        """
+        return ['exr', 'tif']
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
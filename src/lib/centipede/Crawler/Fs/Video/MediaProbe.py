@@ -0,0 +1,229 @@
+import os
+import json
+import sqlite3
+import threading
+import subprocess
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+class MediaProbeError(Exception):
+    """Media probe error."""
+
+class MediaProbe(object):
+    """
+    Shared ffprobe layer used to query the information about media files.
+
+    Each file is probed once (a single ffprobe call returning the information
+    about all streams and the format), where the result is cached in memory
+    and optionally in a persistent cache file (sqlite) keyed by path, where
+    the size and modification time of the file are used to detect changes.
+    The memory cache is size-bounded (the least recently used files are
+    removed first), the persistent cache keeps all files. Multiple files can
+    be probed at once through a pool of threads (probeMany).
+
+    The video crawlers use the default probe (see MediaProbe.default), its
+    persistent cache file can be defined through the environment
+    variable CENTIPEDE_MEDIA_PROBE_CACHE.
+    """
+
+    __defaultProbe = None
+    __defaultLock = threading.Lock()
+    __defaultCacheFile = os.environ.get('CENTIPEDE_MEDIA_PROBE_CACHE', '')
+
+    # maximum number of files kept by the memory cache
+    __cacheSize = 4096
+
+    def __init__(self, cacheFile='', workers=8, reader=None):
+        """
+        Create a media probe object.
+
+        The reader is a callable that receives a file path and returns a
+        dict with the information about the file (using the same layout as
+        the json produced by ffprobe), by default MediaProbe.ffprobe is used.
+        """
+        self.__cacheFile = cacheFile
+        self.__workers = workers
+        self.__reader = reader or MediaProbe.ffprobe
+        self.__lock = threading.Lock()
+        self.__cache = OrderedDict()
+        self.__stats = {
+            'probed': 0,
+            'cached': 0
+        }
+
+        self.__connection = None
+        if cacheFile:
+            self.__connection = sqlite3.connect(
+                cacheFile,
+                check_same_thread=False
+            )
+            self.__connection.execute(
+                'CREATE TABLE IF NOT EXISTS media (path TEXT PRIMARY KEY, size INTEGER, mtime REAL, info TEXT)'
+            )
+            self.__connection.commit()
+
+    def cacheFile(self):
+        """
+        Return the file path used by the persistent cache (empty string when it's not used).
+        """
+        return self.__cacheFile
+
+    def probe(self, pathHolder):
+        """
+        Return a dict with the information about the media file (streams and format).
+        """
+        key = (pathHolder.path(), pathHolder.size(), pathHolder.mtime())
+
+        with self.__lock:
+            info = self.__cachedInfo(key)
+            if info is not None:
+                self.__stats['cached'] += 1
+                return info
+
+        # probing the file outside of the lock, so multiple files can
+        # be probed at the same time
+        info = self.__reader(pathHolder.path())
+
+        with self.__lock:
+            self.__stats['probed'] += 1
+            self.__cacheStore(key, info)
+            if self.__connection is not None:
+                self.__connection.execute(
+                    'INSERT OR REPLACE INTO media (path, size, mtime, info) VALUES (?, ?, ?, ?)',
+                    (key[0], key[1], key[2], json.dumps(info))
+                )
+                self.__connection.commit()
+
+        return info
+
+    def probeMany(self, pathHolders):
+        """
+        Return a list with the information about the media files probed in parallel.
+        """
+        pathHolders = list(pathHolders)
+        if self.__workers <= 0 or len(pathHolders) < 2:
+            return list(map(self.probe, pathHolders))
+
+        pool = ThreadPool(min(self.__workers, len(pathHolders)))
+        try:
+            return pool.map(self.probe, pathHolders)
+        finally:
+            pool.close()
+            pool.join()
+
+    def stats(self):
+        """
+        Return a dict containing the total of files probed and found in the cache.
+        """
+        with self.__lock:
+            return dict(self.__stats)
+
+    def clear(self):
+        """
+        Remove all the information stored in the cache (including the persistent cache).
+        """
+        with self.__lock:
+            self.__cache = OrderedDict()
+            if self.__connection is not None:
+                self.__connection.execute('DELETE FROM media')
+                self.__connection.commit()
+
+    def close(self):
+        """
+        Close the persistent cache.
+        """
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+
+    @staticmethod
+    def default():
+        """
+        Return the probe shared by the video crawlers.
+        """
+        with MediaProbe.__defaultLock:
+            if MediaProbe.__defaultProbe is None:
+                MediaProbe.__defaultProbe = MediaProbe(MediaProbe.__defaultCacheFile)
+
+            return MediaProbe.__defaultProbe
+
+    @staticmethod
+    def setDefault(mediaProbe):
+        """
+        Set the probe shared by the video crawlers (None resets it to the initial probe).
+        """
+        assert mediaProbe is None or isinstance(mediaProbe, MediaProbe), \
+            "Invalid media probe type!"
+
+        with MediaProbe.__defaultLock:
+            MediaProbe.__defaultProbe = mediaProbe
+
+    @staticmethod
+    def ffprobe(filePath):
+        """
+        Return a dict with the information about the streams and format of the media file queried through ffprobe.
+        """
+        try:
+            process = subprocess.Popen(
+                [
+                    'ffprobe',
+                    '-v',
+                    'quiet',
+                    '-show_streams',
+                    '-show_format',
+                    '-print_format',
+                    'json',
+                    filePath
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=os.environ
+            )
+        except OSError as err:
+            raise MediaProbeError(
+                'Could not run ffprobe for "{}": {}'.format(filePath, err)
+            )
+
+        # capturing the output
+        output, error = process.communicate()
+        try:
+            return json.loads(output.decode("utf-8"))
+        except ValueError:
+            raise MediaProbeError(
+                'Could not probe "{}"'.format(filePath)
+            )
+
+    def __cachedInfo(self, key):
+        """
+        Return the information found in the cache for the key (None when it's not cached).
+        """
+        cached = self.__cache.pop(key[0], None)
+        if cached is not None and cached[0] == key[1:]:
+            self.__cache[key[0]] = cached
+            return cached[1]
+
+        if self.__connection is None:
+            return None
+
+        row = self.__connection.execute(
+            'SELECT size, mtime, info FROM media WHERE path = ?',
+            (key[0],)
+        ).fetchone()
+
+        if row is None or row[0] != key[1] or row[1] != key[2]:
+            return None
+
+        info = json.loads(row[2])
+        self.__cacheStore(key, info)
+
+        return info
+
+    def __cacheStore(self, key, info):
+        """
+        Store the information in the memory cache (the least recently used files are removed when the size is exceeded).
+        """
+        self.__cache.pop(key[0], None)
+        self.__cache[key[0]] = (key[1:], info)
+        while len(self.__cache) > MediaProbe.__cacheSize:
+            self.__cache.popitem(last=False)
@@ -1,58 +1,49 @@
 from .Video import Video
-import subprocess
-import json
-import os
 
 class Mov(Video):
     """
     Mov crawler.
     """
 
-    def __init__(self, *args, **kwargs):
-        """
-        Create a Mov crawler.
-        """
-        super(Mov, self).__init__(*args, **kwargs)
+    __slots__ = ()
 
-        self.__getFirstLastFrames()
-
-    def __getFirstLastFrames(self):
-        """
-        Query first frame and last frame using ffprobe and set them as crawler variables if available.
+    def _mediaVars(self, mediaInfo):
         """
-        cmd = 'ffprobe -v quiet -show_streams -print_format json {}'.format(self.var('filePath'))
+        Return a dict containing the variables based on the media information.
 
-        # calling ffprobe
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            env=os.environ,
-            shell=True
-        )
-
-        # capturing the output
-        output, error = process.communicate()
-        result = json.loads(output.decode("utf-8"))
-        if "streams" not in result:
-            return
+        The first frame and last frame are only available for movies
+        that contain a timecode.
+        """
+        result = super(Mov, self)._mediaVars(mediaInfo)
+        if not mediaInfo.get('streams'):
+            return result
 
-        tags = result['streams'][0].get("tags")
+        stream = mediaInfo['streams'][0]
+        tags = stream.get("tags")
         if not tags:
-            return
+            return result
 
         startTimecode = tags.get("timecode")
         if not startTimecode:
-            return
+            return result
 
-        nbFrames = int(result['streams'][0]['nb_frames'])-1
-        frameRateStr = result['streams'][0]['avg_frame_rate'].split("/")
+        nbFrames = int(stream['nb_frames'])-1
+        frameRateStr = stream['avg_frame_rate'].split("/")
         frameRate = int(float(frameRateStr[0])/float(frameRateStr[1]))
         firstFrame = 0
         for f, t in zip((3600*frameRate, 60*frameRate, frameRate, 1), startTimecode.split(':')):
             firstFrame += f * int(t)
-        self.setVar('firstFrame', firstFrame)
-        self.setVar('lastFrame', firstFrame+nbFrames)
+        result['firstFrame'] = firstFrame
+        result['lastFrame'] = firstFrame+nbFrames
+
+        return result
+
+    @classmethod
+    def testExtensions(cls):
+        """
+        Return the extensions that can pass the test.
+        """
+        return ['mov']
 
     @classmethod
     def test(cls, pathHolder, parentCrawler):
@@ -70,3 +61,12 @@ Mov.register(
     'mov',
     Mov
 )
+
+# registering lazy variables
+Mov.registerLazyVars(
+    Mov,
+    ['firstFrame', 'lastFrame'],
+    Mov._lazyMediaVars,
+    Mov.lazyVarCostProcess,
+    Mov._lazyMediaVarsBatch
+)
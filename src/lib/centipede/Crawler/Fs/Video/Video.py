@@ -1,13 +1,13 @@
-import subprocess
-import os
-import json
 from ..File import File
+from .MediaProbe import MediaProbe
 
 class Video(File):
     """
     Abstracted video crawler.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a video crawler.
@@ -22,27 +22,43 @@ class Video(File):
             self.pathHolder().baseName()
         )
 
-        self.__getWidthHeight()
-
-    def __getWidthHeight(self):
+    def _mediaVars(self, mediaInfo):
         """
-        Query width and height using ffprobe and set them as crawler variables.
+        For re-implementation: Return a dict containing the variables based on the media information (see MediaProbe).
         """
-        # Get width and height from movie using ffprobe
-        cmd = 'ffprobe -v quiet -print_format json -show_entries stream=height,width {}'.format(self.var('filePath'))
+        for stream in mediaInfo.get('streams', []):
+            if 'width' in stream:
+                return {
+                    'width': stream['width'],
+                    'height': stream['height']
+                }
+
+        return {}
 
-        # calling ffmpeg
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            env=os.environ,
-            shell=True
+    @staticmethod
+    def _lazyMediaVars(crawler):
+        """
+        Return the media variables for the crawler (used as lazy variable provider).
+        """
+        return crawler._mediaVars(
+            MediaProbe.default().probe(crawler.pathHolder())
         )
 
-        # capturing the output
-        output, error = process.communicate()
-        result = json.loads(output.decode("utf-8"))
-        if "streams" in result:
-            self.setVar('width', result['streams'][0]['width'])
-            self.setVar('height', result['streams'][0]['height'])
+    @staticmethod
+    def _lazyMediaVarsBatch(crawlers):
+        """
+        Return the media variables for the crawlers probed at once (used as lazy variable provider).
+        """
+        mediaInfos = MediaProbe.default().probeMany(map(lambda x: x.pathHolder(), crawlers))
+
+        return list(map(lambda x: x[0]._mediaVars(x[1]), zip(crawlers, mediaInfos)))
+
+
+# registering lazy variables
+Video.registerLazyVars(
+    Video,
+    ['width', 'height'],
+    Video._lazyMediaVars,
+    Video.lazyVarCostProcess,
+    Video._lazyMediaVarsBatch
+)
@@ -1,2 +1,3 @@
+from .MediaProbe import MediaProbe, MediaProbeError
 from .Video import Video
 from .Mov import Mov
@@ -0,0 +1,660 @@
+import os
+import sys
+import errno
+import struct
+import ctypes
+import ctypes.util
+import threading
+from collections import OrderedDict
+from ..Crawler import Crawler
+from .Directory import Directory
+
+class Watcher(object):
+    """
+    Keep the glob cache of a directory crawler up to date with the file system.
+
+    The changes are detected through inotify (when available) otherwise the
+    file system is polled. Only the crawlers affected by a change are
+    created again: created paths get new crawlers (directories are globbed),
+    removed paths get their crawlers discarded and modified files get their
+    crawlers re-created. The changes are processed by calling update (or
+    periodically by a thread through start) and reported to the
+    listeners as (event type, crawler).
+
+    Polling detects the changes by querying the stat of all the paths, in case
+    the inotify queue overflows the directories are listed again (in both
+    cases a file modified in place is only detected when its modification
+    time or size changes).
+
+    For directories that collapse image sequences (see
+    Directory.setCollapseSequences) a sequence that gains or loses frames is
+    reported as modified, changes done in place to the frames are not reported.
+
+    The watcher can be created with the filter types used to glob the
+    crawler, in this case only the crawlers that can satisfy the filter are
+    created (same as glob, see Crawler.glob) and the glob cache of that
+    filter is kept up to date.
+    """
+
+    createdEvent = 'created'
+    removedEvent = 'removed'
+    modifiedEvent = 'modified'
+
+    # inotify constants (linux/inotify.h)
+    __inotifyNonBlock = 0x800
+    __inotifyCloseExec = 0x80000
+    __inotifyCloseWrite = 0x8
+    __inotifyMovedFrom = 0x40
+    __inotifyMovedTo = 0x80
+    __inotifyCreate = 0x100
+    __inotifyDelete = 0x200
+    __inotifyOverflow = 0x4000
+    __inotifyIgnored = 0x8000
+    __inotifyEvent = struct.Struct('iIII')
+
+    def __init__(self, rootCrawler, usePolling=False, filterTypes=[], workers=0):
+        """
+        Create a watcher for the directory crawler.
+
+        In case the crawler has been globbed already (without filter or with
+        the same filter types), the crawlers from the glob cache are used,
+        otherwise the directory is globbed (using the workers, see Crawler.glob).
+        """
+        assert isinstance(rootCrawler, Directory), \
+            "Invalid directory crawler!"
+
+        self.__rootCrawler = rootCrawler
+        self.__lock = threading.RLock()
+        self.__listeners = []
+        self.__errorListeners = []
+        self.__threadError = None
+        self.__thread = None
+        self.__stopEvent = threading.Event()
+        self.__filterTypes = list(filterTypes)
+        self.__filterClasses = None
+
+        # crawlers per directory path
+        self.__directories = {}
+        self.__children = {}
+
+        # polling information (path -> (mtime, size))
+        self.__pollStats = {}
+
+        # inotify information
+        self.__libc = None
+        self.__inotify = None
+        self.__watchPaths = {}
+        self.__watchDescriptors = {}
+
+        if not usePolling:
+            self.__initializeInotify()
+
+        self.__initializeCrawlers(workers)
+        self.__updateGlobCache()
+
+    def rootCrawler(self):
+        """
+        Return the crawler watched by the watcher.
+        """
+        return self.__rootCrawler
+
+    def filterTypes(self):
+        """
+        Return the list of filter types used by the watched crawlers (empty when all crawlers are watched).
+        """
+        return list(self.__filterTypes)
+
+    def usesInotify(self):
+        """
+        Return a boolean telling if the changes are detected through inotify (otherwise polling).
+        """
+        return self.__inotify is not None
+
+    def addListener(self, listener):
+        """
+        Add a callable that gets called for each change as listener(event type, crawler).
+
+        For removed paths the crawler is the one that has been discarded, for
+        modified paths the crawler is the new one.
+        """
+        self.__listeners.append(listener)
+
+    def removeListener(self, listener):
+        """
+        Remove a listener added previously.
+        """
+        self.__listeners.remove(listener)
+
+    def addErrorListener(self, listener):
+        """
+        Add a callable that gets called as listener(error) for the errors raised while processing the changes by the thread (see start).
+        """
+        self.__errorListeners.append(listener)
+
+    def removeErrorListener(self, listener):
+        """
+        Remove an error listener added previously.
+        """
+        self.__errorListeners.remove(listener)
+
+    def update(self):
+        """
+        Process the pending changes.
+
+        Return a list of (event type, crawler) about the changes.
+        """
+        with self.__lock:
+            if self.__inotify is not None:
+                changedDirectories, modifiedFiles = self.__inotifyChanges()
+            else:
+                changedDirectories, modifiedFiles = self.__pollingChanges()
+
+            result = []
+
+            # parent directories are processed first, so the directories
+            # removed by them are not listed anymore
+            for directoryPath in sorted(changedDirectories):
+                result += self.__listDirectory(directoryPath)
+
+            createdPaths = set()
+            for eventType, crawler in result:
+                if eventType == self.createdEvent:
+                    createdPaths.add(crawler.var('filePath'))
+
+            for filePath in modifiedFiles:
+                if filePath not in createdPaths:
+                    result += self.__recreateFile(filePath)
+
+            if result:
+                self.__updateGlobCache()
+
+        for eventType, crawler in result:
+            for listener in list(self.__listeners):
+                listener(eventType, crawler)
+
+        return result
+
+    def start(self, interval=1.0):
+        """
+        Start a thread that processes the changes periodically (interval in seconds).
+
+        The errors raised while processing the changes are passed to the error
+        listeners (see addErrorListener). When there are no error listeners
+        the thread stops at the first error, which is raised by stop.
+        """
+        assert self.__thread is None, "Watcher is already running!"
+
+        self.__stopEvent.clear()
+        self.__thread = threading.Thread(target=self.__run, args=(interval,))
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        """
+        Stop the thread started by start.
+
+        Raise the error that has stopped the thread (when there are no error listeners).
+        """
+        if self.__thread is None:
+            return
+
+        self.__stopEvent.set()
+        self.__thread.join()
+        self.__thread = None
+
+        threadError = self.__threadError
+        if threadError is not None:
+            self.__threadError = None
+            raise threadError
+
+    def close(self):
+        """
+        Stop watching the file system.
+        """
+        self.stop()
+
+        with self.__lock:
+            if self.__inotify is not None:
+                os.close(self.__inotify)
+                self.__inotify = None
+
+    def __run(self, interval):
+        """
+        Process the changes until the watcher gets stopped.
+        """
+        while not self.__stopEvent.wait(interval):
+            try:
+                self.update()
+            except Exception as err:
+                if not self.__errorListeners:
+                    self.__threadError = err
+                    return
+
+                for listener in list(self.__errorListeners):
+                    listener(err)
+
+    def __initializeInotify(self):
+        """
+        Initialize inotify in case it's available.
+        """
+        if not sys.platform.startswith('linux'):
+            return
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        except (OSError, AttributeError):
+            return
+
+        fileDescriptor = libc.inotify_init1(self.__inotifyNonBlock | self.__inotifyCloseExec)
+
+        # falling back to polling (for instance, too many inotify instances)
+        if fileDescriptor < 0:
+            return
+
+        self.__libc = libc
+        self.__inotify = fileDescriptor
+
+    def __initializeCrawlers(self, workers):
+        """
+        Initialize the crawlers that are watched.
+        """
+        # the traversal without filter can be used by any filter
+        globCache = self.__rootCrawler._globCache()
+        if globCache is not None:
+            self.__filterTypes = []
+        elif self.__filterTypes:
+            globCache = self.__rootCrawler._globCache(self.__filterTypes)
+            self.__filterClasses = Crawler._filterClasses(self.__filterTypes)
+
+        # the parallel traversal is done by glob
+        if globCache is None and workers > 0:
+            self.__rootCrawler.glob(self.__filterTypes, useCache=False, workers=workers)
+            globCache = self.__rootCrawler._globCache(self.__filterTypes)
+
+        if globCache is None:
+            self.__scan(self.__rootCrawler)
+            return
+
+        # reusing the crawlers found by the glob (the children of a
+        # directory are found in the same order they were listed)
+        for crawler in globCache:
+            self.__track(crawler)
+            if crawler is not self.__rootCrawler:
+                parentPath = os.path.dirname(crawler.var('filePath'))
+                self.__children[parentPath].append(crawler)
+
+    def __scan(self, crawler):
+        """
+        Start watching the crawler and all crawlers under it.
+
+        Return a list containing all the crawlers.
+        """
+        result = [crawler]
+
+        # the crawler is tracked before listing its children, so changes
+        # that happen in the meantime are not lost
+        self.__track(crawler)
+
+        if not crawler.isLeaf():
+            if self.__filterClasses is None:
+                children = crawler.children()
+            else:
+                children = list(crawler._iterChildren(self.__filterClasses))
+            self.__children[crawler.var('filePath')] = children
+            for childCrawler in children:
+                result += self.__scan(childCrawler)
+
+        return result
+
+    def __track(self, crawler):
+        """
+        Start watching the crawler.
+        """
+        path = crawler.var('filePath')
+
+        if isinstance(crawler, Directory):
+            self.__directories[path] = crawler
+            self.__children[path] = []
+
+            if self.__inotify is not None:
+                self.__addWatch(path)
+
+        if self.__inotify is None:
+            self.__pollStats[path] = self.__statSignature(path)
+
+    def __untrack(self, crawler):
+        """
+        Stop watching the crawler and all crawlers under it.
+
+        Return a list containing all the crawlers.
+        """
+        result = [crawler]
+        path = crawler.var('filePath')
+        self.__pollStats.pop(path, None)
+
+        if path in self.__directories:
+            del self.__directories[path]
+            for childCrawler in self.__children.pop(path, []):
+                result += self.__untrack(childCrawler)
+
+            watchDescriptor = self.__watchPaths.pop(path, None)
+            if watchDescriptor is not None:
+                del self.__watchDescriptors[watchDescriptor]
+
+                # the watch is already gone in case the directory has been
+                # removed (the error is ignored)
+                self.__libc.inotify_rm_watch(self.__inotify, watchDescriptor)
+
+        return result
+
+    def __listDirectory(self, path):
+        """
+        List the directory again updating the crawlers that have been created or removed.
+
+        Return a list of (event type, crawler) about the changes.
+        """
+        directoryCrawler = self.__directories.get(path)
+        if directoryCrawler is None:
+            return []
+
+        if self.__inotify is None:
+            self.__pollStats[path] = self.__statSignature(path)
+
+        if directoryCrawler.collapseSequences():
+            return self.__listCollapsedDirectory(directoryCrawler)
+
+        try:
+            names = os.listdir(path)
+        except OSError:
+            names = []
+
+        previousChildren = OrderedDict()
+        for childCrawler in self.__children[path]:
+            previousChildren[childCrawler.var('baseName')] = childCrawler
+
+        result = []
+        children = []
+        for name in names:
+            if name in previousChildren:
+                children.append(previousChildren.pop(name))
+                continue
+
+            childCrawler = directoryCrawler._createChild(name, None, self.__filterClasses)
+            if childCrawler is None:
+                continue
+
+            children.append(childCrawler)
+            for createdCrawler in self.__scan(childCrawler):
+                result.append((self.createdEvent, createdCrawler))
+
+        for childCrawler in previousChildren.values():
+            for removedCrawler in self.__untrack(childCrawler):
+                result.append((self.removedEvent, removedCrawler))
+
+        self.__children[path] = children
+
+        return result
+
+    def __listCollapsedDirectory(self, directoryCrawler):
+        """
+        List a directory that collapses image sequences again updating the crawlers that have changed.
+
+        Since the frames of a sequence are represented by a single crawler, the
+        directory is listed through the crawler itself and the sequences are
+        compared by their frames.
+
+        Return a list of (event type, crawler) about the changes.
+        """
+        path = directoryCrawler.var('filePath')
+
+        try:
+            currentChildren = list(directoryCrawler._iterChildren(self.__filterClasses))
+        except OSError:
+            currentChildren = []
+
+        previousChildren = OrderedDict()
+        for childCrawler in self.__children[path]:
+            previousChildren[childCrawler.var('baseName')] = childCrawler
+
+        result = []
+        children = []
+        for childCrawler in currentChildren:
+            name = childCrawler.var('baseName')
+            previousCrawler = previousChildren.pop(name, None)
+
+            if previousCrawler is not None and self.__frameRange(previousCrawler) == self.__frameRange(childCrawler):
+                children.append(previousCrawler)
+                continue
+
+            children.append(childCrawler)
+
+            # the frames of the sequence have changed
+            if previousCrawler is not None and previousCrawler.isLeaf():
+                self.__track(childCrawler)
+                result.append((self.modifiedEvent, childCrawler))
+                continue
+
+            if previousCrawler is not None:
+                for removedCrawler in self.__untrack(previousCrawler):
+                    result.append((self.removedEvent, removedCrawler))
+
+            for createdCrawler in self.__scan(childCrawler):
+                result.append((self.createdEvent, createdCrawler))
+
+        for childCrawler in previousChildren.values():
+            for removedCrawler in self.__untrack(childCrawler):
+                result.append((self.removedEvent, removedCrawler))
+
+        self.__children[path] = children
+
+        return result
+
+    def __recreateFile(self, filePath):
+        """
+        Create the crawler for a modified file again.
+
+        Return a list of (event type, crawler) about the changes.
+        """
+        parentPath = os.path.dirname(filePath)
+        if parentPath not in self.__directories or not os.path.isfile(filePath):
+            return []
+
+        children = self.__children[parentPath]
+        for index, childCrawler in enumerate(children):
+            if childCrawler.var('filePath') != filePath:
+                continue
+
+            newCrawler = self.__directories[parentPath]._createChild(
+                childCrawler.var('baseName'),
+                None,
+                self.__filterClasses
+            )
+
+            # the file is not accepted by the directory anymore
+            if newCrawler is None:
+                del children[index]
+                return list(map(lambda x: (self.removedEvent, x), self.__untrack(childCrawler)))
+
+            children[index] = newCrawler
+            self.__track(newCrawler)
+
+            return [(self.modifiedEvent, newCrawler)]
+
+        return []
+
+    def __updateGlobCache(self):
+        """
+        Assign the watched crawlers to the glob cache of the root crawler (depth first).
+        """
+        result = []
+        stack = [self.__rootCrawler]
+        while stack:
+            crawler = stack.pop()
+            result.append(crawler)
+            stack += reversed(self.__children.get(crawler.var('filePath'), []))
+
+        self.__rootCrawler._setGlobCache(result, self.__filterTypes)
+
+    def __pollingChanges(self):
+        """
+        Return a set of changed directories and a list of modified files found by polling.
+        """
+        changedDirectories = set()
+        modifiedFiles = []
+        for path, signature in list(self.__pollStats.items()):
+            currentSignature = self.__statSignature(path)
+            if currentSignature == signature:
+                continue
+
+            if path in self.__directories:
+                changedDirectories.add(path)
+            elif currentSignature is None:
+                changedDirectories.add(os.path.dirname(path))
+            else:
+                self.__pollStats[path] = currentSignature
+                modifiedFiles.append(path)
+
+        return changedDirectories, modifiedFiles
+
+    def __inotifyChanges(self):
+        """
+        Return a set of changed directories and a list of modified files reported by inotify.
+        """
+        changedDirectories = set()
+        modifiedFiles = OrderedDict()
+        while True:
+            try:
+                data = os.read(self.__inotify, 65536)
+            except OSError as err:
+                if err.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                raise
+
+            offset = 0
+            while offset < len(data):
+                watchDescriptor, mask, cookie, nameSize = self.__inotifyEvent.unpack_from(data, offset)
+                offset += self.__inotifyEvent.size
+                name = data[offset:offset + nameSize].rstrip(b'\0')
+                offset += nameSize
+
+                # events have been lost, listing all directories again
+                if mask & self.__inotifyOverflow:
+                    changedDirectories.update(self.__directories.keys())
+                    continue
+
+                path = self.__watchDescriptors.get(watchDescriptor)
+                if path is None:
+                    continue
+
+                # the watch has been removed (the directory is gone)
+                if mask & self.__inotifyIgnored:
+                    del self.__watchDescriptors[watchDescriptor]
+                    del self.__watchPaths[path]
+
+                elif mask & (self.__inotifyCreate | self.__inotifyDelete | self.__inotifyMovedFrom | self.__inotifyMovedTo):
+                    changedDirectories.add(path)
+
+                elif mask & self.__inotifyCloseWrite:
+                    modifiedFiles[os.path.join(path, self.__decodePath(name))] = True
+
+        return changedDirectories, list(modifiedFiles.keys())
+
+    def __addWatch(self, path):
+        """
+        Add an inotify watch for the directory path.
+        """
+        mask = self.__inotifyCreate | self.__inotifyDelete | self.__inotifyMovedFrom | \
+            self.__inotifyMovedTo | self.__inotifyCloseWrite
+
+        watchDescriptor = self.__libc.inotify_add_watch(
+            self.__inotify,
+            self.__encodePath(path),
+            mask
+        )
+
+        if watchDescriptor < 0:
+            errorNumber = ctypes.get_errno()
+
+            # the directory has been removed in the meantime or it cannot
+            # be read (its contents are not watched)
+            if errorNumber in (errno.ENOENT, errno.EACCES):
+                return
+
+            # the limit of inotify watches has been reached
+            if errorNumber == errno.ENOSPC:
+                self.__switchToPolling()
+                return
+
+            raise OSError(
+                errorNumber,
+                'Could not watch "{}": {}'.format(path, os.strerror(errorNumber))
+            )
+
+        self.__watchPaths[path] = watchDescriptor
+        self.__watchDescriptors[watchDescriptor] = path
+
+    def __switchToPolling(self):
+        """
+        Stop using inotify and detect the changes by polling the file system.
+
+        The watched directories are listed again by the next update, since
+        the changes that have not been read from inotify are lost.
+        """
+        os.close(self.__inotify)
+        self.__inotify = None
+        self.__watchPaths = {}
+        self.__watchDescriptors = {}
+
+        for path in self.__directories.keys():
+            self.__pollStats[path] = None
+
+        for children in self.__children.values():
+            for childCrawler in children:
+                path = childCrawler.var('filePath')
+                if path not in self.__pollStats:
+                    self.__pollStats[path] = self.__statSignature(path)
+
+    @staticmethod
+    def __frameRange(crawler):
+        """
+        Return the frames about a collapsed image sequence crawler (None for any other crawler).
+        """
+        if 'frameRange' not in crawler.varNames():
+            return None
+
+        return crawler.var('frameRange')
+
+    @staticmethod
+    def __statSignature(path):
+        """
+        Return a tuple (mtime, size) used to detect changes in the path (None when it does not exist).
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        return (stat.st_mtime, stat.st_size)
+
+    @staticmethod
+    def __encodePath(path):
+        """
+        Return the path encoded as bytes.
+        """
+        if hasattr(os, 'fsencode'):
+            return os.fsencode(path)
+
+        return path
+
+    @staticmethod
+    def __decodePath(name):
+        """
+        Return the name reported by inotify decoded as str.
+        """
+        if hasattr(os, 'fsdecode'):
+            return os.fsdecode(name)
+
+        return name
@@ -1,6 +1,8 @@
 from .FsPath import FsPath
 from .File import File
 from .Directory import Directory
+from .CrawlIndex import CrawlIndex
+from .Watcher import Watcher
 
 from . import Image
 from . import Lut
@@ -6,6 +6,8 @@ class Hashmap(Crawler):
     Hashmap crawler to store key/value data.
     """
 
+    __slots__ = ()
+
     def __init__(self, data, parentCrawler=None):
         """
         Create a Hashmap crawler.
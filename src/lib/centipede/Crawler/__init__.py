@@ -1,3 +1,4 @@
 from .Crawler import Crawler, TestCrawlerError, CreateCrawlerError
+from .CrawlerBatch import CrawlerBatch, InvalidCrawlerBatchError
 from . import Fs
 from . import Generic
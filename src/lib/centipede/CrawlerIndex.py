@@ -0,0 +1,129 @@
+from collections import OrderedDict
+from .Crawler import Crawler
+
+class CrawlerIndex(object):
+    """
+    In-memory index about a set of crawlers.
+
+    The index is built once and shared by multiple queries (for instance
+    routing the same crawlers to several task holders, see
+    CrawlerMatcher.matchIndex). The crawlers are indexed by type when the
+    index is created, while the values of the variables are indexed on
+    demand (only for the crawlers that are queried about them), so the
+    value of a variable is computed once per crawler and each distinct value
+    is tested once per query.
+
+    The crawlers are referred by their position in the index (see crawlers).
+    Collapsed crawlers (for instance image sequences) are expanded to the
+    crawlers they represent (see Crawler.expand).
+    """
+
+    def __init__(self, crawlers=[]):
+        """
+        Create a crawler index object.
+
+        The crawlers can be any iterable (they are consumed only once).
+        """
+        self.__crawlers = []
+        self.__typePositions = OrderedDict()
+        self.__varValues = {}
+        self.__valuePositions = {}
+
+        for crawler in Crawler.expand(crawlers):
+            assert isinstance(crawler, Crawler), \
+                "Invalid crawler type!"
+
+            crawlerType = crawler.var('type')
+            if crawlerType not in self.__typePositions:
+                self.__typePositions[crawlerType] = []
+
+            self.__typePositions[crawlerType].append(len(self.__crawlers))
+            self.__crawlers.append(crawler)
+
+    def crawlers(self, positions=None):
+        """
+        Return a list of the indexed crawlers.
+
+        Optionally only the crawlers at the given positions are returned (keeping
+        the order of the index).
+        """
+        if positions is None:
+            return list(self.__crawlers)
+
+        return list(map(lambda x: self.__crawlers[x], sorted(positions)))
+
+    def typeNames(self):
+        """
+        Return a list of the crawler types found in the index.
+        """
+        return list(self.__typePositions.keys())
+
+    def typePositions(self, typeNames=None):
+        """
+        Return a set containing the positions of the crawlers of the given types (None means any type).
+        """
+        if typeNames is None:
+            return set(range(len(self.__crawlers)))
+
+        result = set()
+        for typeName in typeNames:
+            if typeName in self.__typePositions:
+                result.update(self.__typePositions[typeName])
+
+        return result
+
+    def varPositions(self, varName, positions, matchValue):
+        """
+        Return a set containing the positions where the variable passes the match.
+
+        Only the given positions are considered, crawlers that don't have the
+        variable are never included. The match is a callable that
+        receives the value of the variable converted to string and returns a
+        boolean, it's called once per distinct value.
+        """
+        if varName not in self.__varValues:
+            self.__varValues[varName] = {}
+            self.__valuePositions[varName] = {}
+
+        varValues = self.__varValues[varName]
+        valuePositions = self.__valuePositions[varName]
+
+        # indexing the values about the positions that have not been indexed yet
+        for position in positions:
+            if position in varValues:
+                continue
+
+            crawler = self.__crawlers[position]
+            value = None
+            if crawler.hasVar(varName):
+                value = str(crawler.var(varName))
+
+                if value not in valuePositions:
+                    valuePositions[value] = set()
+                valuePositions[value].add(position)
+
+            varValues[position] = value
+
+        # testing the values of the positions directly when there are less
+        # positions than distinct values
+        result = set()
+        if len(positions) < len(valuePositions):
+            matchedValues = {}
+            for position in positions:
+                value = varValues[position]
+                if value is None:
+                    continue
+
+                if value not in matchedValues:
+                    matchedValues[value] = matchValue(value)
+
+                if matchedValues[value]:
+                    result.add(position)
+
+            return result
+
+        for value, indexedPositions in valuePositions.items():
+            if matchValue(value):
+                result.update(indexedPositions)
+
+        return result.intersection(positions)
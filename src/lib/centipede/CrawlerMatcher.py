@@ -1,9 +1,17 @@
-from fnmatch import fnmatch
+import os
+import re
+from fnmatch import translate
 from .Crawler import Crawler
+from .CrawlerIndex import CrawlerIndex
 
 class CrawlerMatcher(object):
     """
     Used to check if a crawler meets the specification of the matcher.
+
+    The specification is compiled once: the match types are resolved to the
+    set of registered type names (re-computed when new crawler types are
+    registered) and the glob patterns of each variable are combined into a
+    single regex (following the same rules as fnmatch).
     """
 
     def __init__(self, matchTypes=[], matchVars={}):
@@ -13,6 +21,10 @@ class CrawlerMatcher(object):
         self.__setMatchTypes(matchTypes)
         self.__setMatchVars(matchVars)
 
+        self.__registryVersion = None
+        self.__compiledTypes = None
+        self.__compiledVars = self.__compileVars()
+
     def matchTypes(self):
         """
         Return a list of crawler types used to match.
@@ -42,39 +54,113 @@ class CrawlerMatcher(object):
         assert isinstance(crawler, Crawler), \
             "Invalid crawler type!"
 
-        crawlerType = crawler.var('type')
-        foundType = not self.matchTypes()
-        for matchType in self.matchTypes():
-            registeredTypes = Crawler.registeredSubTypes(matchType)
-            if crawlerType in registeredTypes:
-                foundType = True
+        return self.__match(crawler, self.__types(), self.__compiledVars)
+
+    def matchMany(self, crawlers):
+        """
+        Return a list containing the crawlers that match.
+
+        The crawlers can be any iterable (they are consumed only once), the
+        compiled specification is looked up once for all of them.
+        """
+        compiledTypes = self.__types()
+        compiledVars = self.__compiledVars
+        match = self.__match
+
+        result = []
+        for crawler in crawlers:
+            assert isinstance(crawler, Crawler), \
+                "Invalid crawler type!"
+
+            if match(crawler, compiledTypes, compiledVars):
+                result.append(crawler)
+
+        return result
+
+    def matchIndex(self, crawlerIndex):
+        """
+        Return a list containing the crawlers of the index that match (following the order of the index).
+
+        The types and variables are resolved through the index (see
+        CrawlerIndex), rather than testing each crawler.
+        """
+        assert isinstance(crawlerIndex, CrawlerIndex), \
+            "Invalid crawler index type!"
+
+        positions = crawlerIndex.typePositions(self.__types())
+        for varName, regex in self.__compiledVars:
+            if not positions:
                 break
 
-        if not foundType:
+            positions = crawlerIndex.varPositions(
+                varName,
+                positions,
+                lambda x: regex.match(os.path.normcase(x)) is not None
+            )
+
+        return crawlerIndex.crawlers(positions)
+
+    @staticmethod
+    def __match(crawler, compiledTypes, compiledVars):
+        """
+        Return a boolean telling if the crawler matches the compiled specification.
+        """
+        if compiledTypes is not None and crawler.var('type') not in compiledTypes:
             return False
 
-        for varName in self.matchVarNames():
+        for varName, regex in compiledVars:
 
             # checking if variable is part of the crawler
-            if varName not in crawler.varNames():
+            if not crawler.hasVar(varName):
+                return False
+
+            if regex.match(os.path.normcase(str(crawler.var(varName)))) is None:
                 return False
 
+        return True
+
+    def __types(self):
+        """
+        Return a set containing the registered type names that match (None when any type matches).
+        """
+        if not self.__matchTypes:
+            return None
+
+        # the registered types may change after the compilation
+        registryVersion = Crawler.registryVersion()
+        if self.__registryVersion != registryVersion:
+            compiledTypes = set()
+            for matchType in self.__matchTypes:
+                compiledTypes.update(Crawler.registeredSubTypes(matchType))
+
+            self.__compiledTypes = frozenset(compiledTypes)
+            self.__registryVersion = registryVersion
+
+        return self.__compiledTypes
+
+    def __compileVars(self):
+        """
+        Return a list of (variable name, compiled regex) about the match vars.
+
+        The possible values of each variable are combined into a single regex.
+        """
+        result = []
+        for varName in self.matchVarNames():
             matchVarValue = self.matchVar(varName)
 
             # the value can be a list of possibiblities
             if not isinstance(matchVarValue, list):
                 matchVarValue = [matchVarValue]
 
-            foundValueValue = False
-            for value in matchVarValue:
-                if fnmatch(str(crawler.var(varName)), str(value)):
-                    foundValueValue = True
-                    break
+            patterns = map(
+                lambda x: '(?:{})'.format(translate(os.path.normcase(str(x)))),
+                matchVarValue
+            )
 
-            if not foundValueValue:
-                return False
+            # an empty list of possibilities never matches
+            result.append((varName, re.compile('|'.join(patterns) or '(?!)')))
 
-        return True
+        return result
 
     def __setMatchTypes(self, matchTypes):
         """
@@ -1,5 +1,7 @@
 from .Template import Template
+from .Crawler import Crawler
 from .CrawlerMatcher import CrawlerMatcher
+from .CrawlerIndex import CrawlerIndex
 from collections import OrderedDict
 
 class CrawlerQuery(object):
@@ -29,12 +31,24 @@ class CrawlerQuery(object):
     def query(self, crawlers, vars={}):
         """
         Return a dict containg the matched crawler as key and resolved template as value.
+
+        The crawlers can be any iterable (for instance the generator returned
+        by Crawler.iglob), they are consumed only once and only the matched
+        crawlers are kept. Collapsed crawlers (for instance image sequences)
+        are expanded to the crawlers they represent (see Crawler.expand).
+        Alternatively, a crawler index can be used to query the same crawlers
+        through multiple queries (see CrawlerIndex).
         """
-        validCrawlers = {}
-        for crawler in crawlers:
-            if self.crawlerMatcher().match(crawler):
-                templateValue = self.template().valueFromCrawler(crawler, vars)
-                validCrawlers[crawler] = templateValue
+        if isinstance(crawlers, CrawlerIndex):
+            matchedCrawlers = self.crawlerMatcher().matchIndex(crawlers)
+        else:
+            matchedCrawlers = self.crawlerMatcher().matchMany(Crawler.expand(crawlers))
+
+        # resolving the template for all the matched crawlers at once
+        validCrawlers = dict(zip(
+            matchedCrawlers,
+            self.template().valuesFromCrawlers(matchedCrawlers, vars)
+        ))
 
         # sorting result
         result = OrderedDict()
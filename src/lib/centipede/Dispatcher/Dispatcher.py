@@ -92,6 +92,9 @@ class Dispatcher(object):
 
         Return a list of ids created by the dispatcher that can be used to track
         the dispatched task holder.
+
+        The crawlers can be any iterable (for instance Crawler.iglob) or a
+        crawler index (CrawlerIndex).
         """
         assert isinstance(taskHolder, TaskHolder), "Invalid task holder type!"
 
@@ -5,7 +5,7 @@ import argparse
 from glob import glob
 from collections import OrderedDict
 from centipede.Dispatcher import Dispatcher
-from centipede.Crawler import Crawler
+from centipede.Crawler import CrawlerBatch
 from centipede.TaskHolder import TaskHolder
 
 def __runCollapsed(data, taskHolder, dataJsonFile):
@@ -63,9 +63,7 @@ def __runCollapsed(data, taskHolder, dataJsonFile):
     # loading input crawlers
     crawlers = []
     for taskInputFilePath in taskInputFilePaths:
-        with open(taskInputFilePath) as jsonFile:
-            serializedCrawlers = json.load(jsonFile)
-            crawlers += list(map(lambda x: Crawler.createFromJson(x), serializedCrawlers))
+        crawlers += CrawlerBatch.read(taskInputFilePath)
 
     dispatcher = Dispatcher.createFromJson(data['dispatcher'])
     dispatchedIds = dispatcher.dispatch(
@@ -128,14 +126,13 @@ def __runExpanded(data, taskHolder, rangeStart, rangeEnd):
 
     outputCrawlers = taskHolder.run()
 
-    # writing resulted crawlers
-    with open(taskResultFilePath, 'w') as jsonFile:
-        data = list(map(lambda x: x.toJson(), outputCrawlers))
-        json.dump(
-            data,
-            jsonFile,
-            indent=4
-        )
+    # writing resulted crawlers (compressed since the result
+    # may contain a large number of crawlers)
+    CrawlerBatch.write(
+        outputCrawlers,
+        taskResultFilePath,
+        compress=True
+    )
 
 def __run(dataJsonFile, rangeStart=None, rangeEnd=None):
     """
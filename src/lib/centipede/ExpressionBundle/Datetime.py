@@ -59,35 +59,42 @@ class _Datetime(object):
 # registering expressions
 ExpressionEvaluator.register(
     'yyyy',
-    _Datetime.yyyy
+    _Datetime.yyyy,
+    arity=0
 )
 
 ExpressionEvaluator.register(
     'yy',
-    _Datetime.yy
+    _Datetime.yy,
+    arity=0
 )
 
 ExpressionEvaluator.register(
     'mm',
-    _Datetime.mm
+    _Datetime.mm,
+    arity=0
 )
 
 ExpressionEvaluator.register(
     'dd',
-    _Datetime.dd
+    _Datetime.dd,
+    arity=0
 )
 
 ExpressionEvaluator.register(
     'hour',
-    _Datetime.hour
+    _Datetime.hour,
+    arity=0
 )
 
 ExpressionEvaluator.register(
     'minute',
-    _Datetime.minute
+    _Datetime.minute,
+    arity=0
 )
 
 ExpressionEvaluator.register(
     'second',
-    _Datetime.second
+    _Datetime.second,
+    arity=0
 )
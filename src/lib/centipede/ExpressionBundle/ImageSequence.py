@@ -23,11 +23,15 @@ class _ImageSequence(object):
 # frame padding
 ExpressionEvaluator.register(
     'pad',
-    _ImageSequence.padding
+    _ImageSequence.padding,
+    pure=True,
+    arity=2
 )
 
 # retime frame padding
 ExpressionEvaluator.register(
     'retimepad',
-    _ImageSequence.retimePadding
+    _ImageSequence.retimePadding,
+    pure=True,
+    arity=3
 )
@@ -83,35 +83,47 @@ class _Math(object):
 # sum
 ExpressionEvaluator.register(
     'sum',
-    _Math.sumInt
+    _Math.sumInt,
+    pure=True,
+    arity=(2, None)
 )
 
 # subtraction
 ExpressionEvaluator.register(
     'sub',
-    _Math.subtractInt
+    _Math.subtractInt,
+    pure=True,
+    arity=(2, None)
 )
 
 # multiply
 ExpressionEvaluator.register(
     'mult',
-    _Math.multiplyInt
+    _Math.multiplyInt,
+    pure=True,
+    arity=(2, None)
 )
 
 # divide
 ExpressionEvaluator.register(
     'div',
-    _Math.divideInt
+    _Math.divideInt,
+    pure=True,
+    arity=(2, None)
 )
 
 # minimum
 ExpressionEvaluator.register(
     'min',
-    _Math.minimumInt
+    _Math.minimumInt,
+    pure=True,
+    arity=(2, None)
 )
 
 # maximum
 ExpressionEvaluator.register(
     'max',
-    _Math.maximumInt
+    _Math.maximumInt,
+    pure=True,
+    arity=(2, None)
 )
@@ -1,11 +1,38 @@
 import os
+import time
+import threading
+from collections import OrderedDict
 from ..ExpressionEvaluator import ExpressionEvaluator
 
+# compatibility with python 2/3 (os.scandir is only available on python 3.5+,
+# otherwise the scandir backport is used when available)
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
 class _Path(object):
     """
     Basic path functions.
+
+    The directory listings used to find files (findpath and rfindpath) are
+    shared through a size-bounded cache, so templates that look for the
+    same file for every crawler (for instance a config per shot) don't
+    list the same directories again.
     """
 
+    # seconds between the modification time and the listing of the
+    # directory required to cache the listing
+    __mtimeResolution = 2.0
+
+    # least recently used cache of directory listings
+    __listingCacheLock = threading.Lock()
+    __listingCache = OrderedDict()
+    __listingCacheSize = 4096
+
     @staticmethod
     def dirname(string):
         """
@@ -28,7 +55,7 @@ class _Path(object):
         return os.path.basename(string)
 
     @staticmethod
-    def rfindpath(fileName, startPath, finalPath=None):
+    def rfindpath(fileName, startPath, finalPath=None, maxDepth=None):
         """
         Find and return a specific file.
 
@@ -41,19 +68,25 @@ class _Path(object):
         :type startPath: str
         :param finalPath: It stops to search when reaching this path.
         :type: finalPath: str
+        :param maxDepth: Maximum number of levels above the start path that are searched (None means no limit).
+        :type: maxDepth: int
         """
-        resultPath = os.path.join(startPath, fileName)
-        if os.path.exists(resultPath):
-            return resultPath
+        maxDepth = None if maxDepth is None else int(maxDepth)
+        depth = 0
+        while True:
+            resultPath = _Path.__childPath(startPath, fileName, _Path.__listDirectory(startPath)[1])
+            if resultPath:
+                return resultPath
 
-        if startPath == finalPath or startPath == '/':
-            raise IOError('File was not found')
+            previousPath = os.path.dirname(startPath)
+            if startPath == finalPath or startPath == '/' or previousPath == startPath or depth == maxDepth:
+                raise IOError('File was not found')
 
-        previousPath = os.path.dirname(startPath)
-        return _Path.rfindpath(fileName, previousPath, finalPath)
+            startPath = previousPath
+            depth += 1
 
     @staticmethod
-    def findpath(fileName, startPath):
+    def findpath(fileName, startPath, maxDepth=None):
         """
         Find and return a specific file.
 
@@ -64,49 +97,169 @@ class _Path(object):
         :type fileName: str
         :param startPath: The path to start.
         :type startPath: str
+        :param maxDepth: Maximum number of levels below the start path that are searched (None means no limit).
+        :type: maxDepth: int
+        """
+        return _Path.__findpath(
+            fileName,
+            startPath,
+            None if maxDepth is None else int(maxDepth),
+            {}
+        )
+
+    @staticmethod
+    def __findpath(fileName, startPath, maxDepth, visitedPaths):
+        """
+        Find the file under the start path (depth first).
+
+        The visited paths map the identity (device, inode) of the
+        directories that have already been searched by this run to the
+        depth that was left when they were searched, so a directory reached
+        more than once (through symlinks) is only searched again when
+        there is more depth left than before (None means no limit).
         """
-        result = ''
-        resultPath = os.path.join(startPath, fileName)
-        if os.path.exists(resultPath):
+        identity, names, dirNames = _Path.__listDirectory(startPath)
+        resultPath = _Path.__childPath(startPath, fileName, names)
+        if resultPath:
             return resultPath
 
-        # When it can not access the next directory (e.g. permissions errors), It raises a StopIteration Error.
-        try:
-            dirList = next(os.walk(startPath))[1]
-        except StopIteration:
-            dirList = []
+        if maxDepth == 0:
+            return ''
+
+        if identity in visitedPaths:
+            visitedDepth = visitedPaths[identity]
+            if visitedDepth is None or (maxDepth is not None and visitedDepth >= maxDepth):
+                return ''
 
-        for dirName in dirList:
-            nextPath = os.path.join(startPath, dirName)
-            result = _Path.findpath(fileName, nextPath)
+        if identity is not None:
+            visitedPaths[identity] = maxDepth
+
+        # directories that can not be accessed (e.g. permissions errors) have no entries
+        for dirName in dirNames:
+            result = _Path.__findpath(
+                fileName,
+                os.path.join(startPath, dirName),
+                None if maxDepth is None else maxDepth - 1,
+                visitedPaths
+            )
             if result:
                 return result
 
+        return ''
+
+    @staticmethod
+    def __childPath(path, fileName, names):
+        """
+        Return the path of the file under the path when it exists, otherwise return an empty string.
+
+        The names are the lower case entries of the path (see __listDirectory).
+        """
+        resultPath = os.path.join(path, fileName)
+
+        # file names that are not entries of the path (for instance
+        # containing sub directories) are checked directly
+        if fileName in ('', os.curdir, os.pardir) or os.sep in fileName or (os.altsep and os.altsep in fileName):
+            return resultPath if os.path.exists(resultPath) else ''
+
+        # the names are compared ignoring the case, since the file system
+        # may be case insensitive (the existence is confirmed by
+        # the file system, the entry may also be a broken link)
+        if fileName.lower() in names and os.path.exists(resultPath):
+            return resultPath
+
+        return ''
+
+    @staticmethod
+    def __listDirectory(path):
+        """
+        Return a tuple (identity, lower case entry names, directory names) about the contents of the path.
+
+        The identity is a tuple (device, inode) about the path.
+
+        The listings are shared through a size-bounded cache, where a listing
+        is invalidated when the modification time of the directory
+        changes (listings taken too close to the modification time are not
+        cached since the file system may not update the modification
+        time for entries created during the same tick). Paths that can not be
+        listed return empty contents (where the identity is None).
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return (None, frozenset(), ())
+
+        mtime = stat.st_mtime
+
+        with _Path.__listingCacheLock:
+            listing = _Path.__listingCache.pop(path, None)
+            if listing is not None and listing[0] == mtime:
+                _Path.__listingCache[path] = listing
+                return listing[1]
+
+        listingTime = time.time()
+        names = []
+        dirNames = []
+        try:
+            if scandir is None:
+                for name in os.listdir(path):
+                    names.append(name)
+                    if os.path.isdir(os.path.join(path, name)):
+                        dirNames.append(name)
+            else:
+                for dirEntry in scandir(path):
+                    names.append(dirEntry.name)
+                    try:
+                        if dirEntry.is_dir():
+                            dirNames.append(dirEntry.name)
+                    except OSError:
+                        pass
+        except OSError:
+            return (None, frozenset(), ())
+
+        result = (
+            (stat.st_dev, stat.st_ino),
+            frozenset(map(lambda x: x.lower(), names)),
+            tuple(dirNames)
+        )
+        if listingTime - mtime > _Path.__mtimeResolution:
+            with _Path.__listingCacheLock:
+                _Path.__listingCache[path] = (mtime, result)
+                while len(_Path.__listingCache) > _Path.__listingCacheSize:
+                    _Path.__listingCache.popitem(last=False)
+
         return result
 
 
 # registering expressions
 ExpressionEvaluator.register(
     'dirname',
-    _Path.dirname
+    _Path.dirname,
+    pure=True,
+    arity=1
 )
 
 ExpressionEvaluator.register(
     'parentdirname',
-    _Path.parentdirname
+    _Path.parentdirname,
+    pure=True,
+    arity=1
 )
 
 ExpressionEvaluator.register(
     'basename',
-    _Path.basename
+    _Path.basename,
+    pure=True,
+    arity=1
 )
 
 ExpressionEvaluator.register(
     'rfindpath',
-    _Path.rfindpath
+    _Path.rfindpath,
+    arity=(2, 4)
 )
 
 ExpressionEvaluator.register(
     'findpath',
-    _Path.findpath
+    _Path.findpath,
+    arity=(2, 3)
 )
@@ -28,10 +28,12 @@ class _System(object):
 # registering expressions
 ExpressionEvaluator.register(
     'tmpdir',
-    _System.tmpdir
+    _System.tmpdir,
+    arity=0
 )
 
 ExpressionEvaluator.register(
     'env',
-    _System.env
+    _System.env,
+    arity=(1, 2)
 )
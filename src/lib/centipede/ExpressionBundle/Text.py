@@ -37,23 +37,31 @@ class _Text(object):
 # upper case
 ExpressionEvaluator.register(
     'upper',
-    _Text.upper
+    _Text.upper,
+    pure=True,
+    arity=1
 )
 
 # lower case
 ExpressionEvaluator.register(
     'lower',
-    _Text.lower
+    _Text.lower,
+    pure=True,
+    arity=1
 )
 
 # replace
 ExpressionEvaluator.register(
     'replace',
-    _Text.replace
+    _Text.replace,
+    pure=True,
+    arity=3
 )
 
 # remove
 ExpressionEvaluator.register(
     'remove',
-    _Text.remove
+    _Text.remove,
+    pure=True,
+    arity=2
 )
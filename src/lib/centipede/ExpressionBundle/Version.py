@@ -1,5 +1,9 @@
 import os
 import re
+import time
+import errno
+import threading
+from collections import OrderedDict
 from ..ExpressionEvaluator import ExpressionEvaluator
 
 class _Version(object):
@@ -7,8 +11,25 @@ class _Version(object):
     Basic version expressions.
 
     The versionsPath is usually specified using <parentPath> token.
+
+    The latest version found under a versions path is cached per path
+    (through a size-bounded cache) and invalidated when the modification
+    time of the path changes. Listings taken too close to the modification
+    time of the path are not cached, since the file system may not change
+    the modification time again for entries created during the same tick.
     """
 
+    __versionRegEx = re.compile("^v[0-9]{3}$")
+
+    # seconds between the modification time and the listing of the path
+    # required to cache the listing
+    __mtimeResolution = 2.0
+
+    # least recently used cache of the latest versions
+    __cacheLock = threading.Lock()
+    __latestVersions = OrderedDict()
+    __latestVersionsSize = 4096
+
     @staticmethod
     def new(versionsPath):
         """
@@ -27,6 +48,40 @@ class _Version(object):
 
         return 'v' + str(version).zfill(3)
 
+    @staticmethod
+    def reserve(versionsPath):
+        """
+        Return a new version that is reserved by creating its directory.
+
+        The directory is created through an exclusive mkdir, in case the
+        version has already been created (for instance by a parallel job) the
+        next version is tried, so parallel jobs always get distinct versions.
+        The versions path is created when it does not exist.
+        """
+        try:
+            os.makedirs(versionsPath)
+        except OSError as err:
+            if err.errno != errno.EEXIST:
+                raise
+
+        version = _Version.__queryLatest(versionsPath) + 1
+        while True:
+            versionName = 'v' + str(version).zfill(3)
+            try:
+                os.mkdir(os.path.join(versionsPath, versionName))
+            except OSError as err:
+                if err.errno != errno.EEXIST:
+                    raise
+                version += 1
+            else:
+                break
+
+        # the versions path has changed
+        with _Version.__cacheLock:
+            _Version.__latestVersions.pop(os.path.normpath(versionsPath), None)
+
+        return versionName
+
     @staticmethod
     def __queryLatest(versionsPath):
         """
@@ -34,14 +89,31 @@ class _Version(object):
 
         In case none version is found, it returns 0 by default.
         """
+        try:
+            mtime = os.stat(versionsPath).st_mtime
+        except OSError:
+            return 0
+
+        cacheKey = os.path.normpath(versionsPath)
+        with _Version.__cacheLock:
+            cachedVersion = _Version.__latestVersions.pop(cacheKey, None)
+            if cachedVersion is not None and cachedVersion[0] == mtime:
+                _Version.__latestVersions[cacheKey] = cachedVersion
+                return cachedVersion[1]
+
+        listingTime = time.time()
         version = 0
-        versionRegEx = "^v[0-9]{3}$"
 
         # finding the latest version
-        if os.path.exists(versionsPath):
-            for directory in os.listdir(versionsPath):
-                if re.match(versionRegEx, directory):
-                    version = max(int(directory[1:]), version)
+        for directory in os.listdir(versionsPath):
+            if _Version.__versionRegEx.match(directory):
+                version = max(int(directory[1:]), version)
+
+        if listingTime - mtime > _Version.__mtimeResolution:
+            with _Version.__cacheLock:
+                _Version.__latestVersions[cacheKey] = (mtime, version)
+                while len(_Version.__latestVersions) > _Version.__latestVersionsSize:
+                    _Version.__latestVersions.popitem(last=False)
 
         return version
 
@@ -49,11 +121,20 @@ class _Version(object):
 # new version expression
 ExpressionEvaluator.register(
     'newver',
-    _Version.new
+    _Version.new,
+    arity=1
 )
 
 # latest version expression
 ExpressionEvaluator.register(
     'latestver',
-    _Version.latest
+    _Version.latest,
+    arity=1
+)
+
+# reserved new version expression
+ExpressionEvaluator.register(
+    'reservever',
+    _Version.reserve,
+    arity=1
 )
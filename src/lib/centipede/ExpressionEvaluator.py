@@ -1,28 +1,126 @@
+import time
+import functools
+import threading
+from collections import OrderedDict
+
 # compatibility with python 2/3
 try:
     basestring
 except NameError:
     basestring = str
 
+# compatibility with python 2/3
+try:
+    timer = time.perf_counter
+except AttributeError:
+    timer = time.time
+
 class ExpressionNotFoundError(Exception):
     """Expression not found error."""
 
+class InvalidExpressionArityError(TypeError):
+    """Invalid expression arity error."""
+
 class ExpressionEvaluator(object):
     """
     Runs exressions used by templates.
+
+    Parsed expressions are compiled into callables (see compile) that are
+    shared through a size-bounded cache. The compiled callables of pure
+    expressions also memoize their result, so the same pure expression
+    is only executed once (across all templates), while impure expressions
+    are always executed.
     """
 
     __registered = {}
+    __pure = set()
+    __arity = {}
+
+    # least recently used cache of compiled expressions
+    __compiledLock = threading.Lock()
+    __compiled = OrderedDict()
+    __compiledSize = 4096
+
+    # statistics per expression name (calls, cacheHits, seconds)
+    __stats = {}
 
     @staticmethod
-    def register(name, expressionCallable):
+    def register(name, expressionCallable, pure=False, arity=None):
         """
         Register a expressionCallable as expression.
+
+        A pure expression always returns the same result for the same
+        arguments without side effects (for instance "pad"), so its results
+        can be shared by all templates. Expressions that depend on
+        anything else than their arguments (for instance the file system,
+        the environment or the current date) must not be declared as pure.
+
+        The arity tells the number of arguments accepted by the expression,
+        it can be either an int or a tuple (minimum, maximum) where the
+        maximum can be None (unbounded). The arity is checked when the
+        expression is compiled or run (None means any number of arguments).
         """
         assert hasattr(expressionCallable, '__call__'), \
             "Invalid callable!"
 
+        if isinstance(arity, int):
+            arity = (arity, arity)
+
+        assert arity is None or (isinstance(arity, tuple) and len(arity) == 2), \
+            "Invalid arity!"
+
         ExpressionEvaluator.__registered[name] = expressionCallable
+        ExpressionEvaluator.__arity[name] = arity
+
+        if pure:
+            ExpressionEvaluator.__pure.add(name)
+        else:
+            ExpressionEvaluator.__pure.discard(name)
+
+        # the compiled expressions may be bound to the previous callable
+        ExpressionEvaluator.clearCache()
+
+    @staticmethod
+    def unregister(name):
+        """
+        Remove a registered expression.
+        """
+        if name not in ExpressionEvaluator.__registered:
+            raise ExpressionNotFoundError(
+                'Could not find expression name: "{0}"'.format(
+                    name
+                )
+            )
+
+        del ExpressionEvaluator.__registered[name]
+        del ExpressionEvaluator.__arity[name]
+        ExpressionEvaluator.__pure.discard(name)
+
+        # the compiled expressions may be bound to the removed callable
+        ExpressionEvaluator.clearCache()
+
+    @staticmethod
+    def isPure(expressionName):
+        """
+        Return a boolean telling if the expression has been registered as pure.
+        """
+        return expressionName in ExpressionEvaluator.__pure
+
+    @staticmethod
+    def arity(expressionName):
+        """
+        Return a tuple (minimum, maximum) about the number of arguments accepted by the expression.
+
+        None is returned when the arity has not been declared.
+        """
+        if expressionName not in ExpressionEvaluator.__registered:
+            raise ExpressionNotFoundError(
+                'Could not find expression name: "{0}"'.format(
+                    expressionName
+                )
+            )
+
+        return ExpressionEvaluator.__arity[expressionName]
 
     @staticmethod
     def registeredNames():
@@ -31,6 +129,57 @@ class ExpressionEvaluator(object):
         """
         return ExpressionEvaluator.__registered.keys()
 
+    @staticmethod
+    def setCacheSize(size):
+        """
+        Set the maximum number of compiled expressions kept by the cache.
+        """
+        assert isinstance(size, int) and size >= 0, \
+            "Invalid cache size!"
+
+        with ExpressionEvaluator.__compiledLock:
+            ExpressionEvaluator.__compiledSize = size
+            while len(ExpressionEvaluator.__compiled) > size:
+                ExpressionEvaluator.__compiled.popitem(last=False)
+
+    @staticmethod
+    def cacheSize():
+        """
+        Return the maximum number of compiled expressions kept by the cache.
+        """
+        return ExpressionEvaluator.__compiledSize
+
+    @staticmethod
+    def clearCache():
+        """
+        Remove the compiled expressions (including the results of pure expressions).
+        """
+        with ExpressionEvaluator.__compiledLock:
+            ExpressionEvaluator.__compiled.clear()
+
+    @staticmethod
+    def stats():
+        """
+        Return a dict containing the statistics per expression name.
+
+        The statistics of each expression contain the total of times it
+        has been executed (calls), the total of times the result of a pure
+        expression has been returned from the cache (cacheHits) and the
+        total of seconds spent executing it (seconds). The values are
+        approximated when expressions are executed from multiple threads.
+        """
+        return dict(map(
+            lambda x: (x[0], dict(zip(('calls', 'cacheHits', 'seconds'), x[1]))),
+            list(ExpressionEvaluator.__stats.items())
+        ))
+
+    @staticmethod
+    def resetStats():
+        """
+        Reset the statistics about the expressions.
+        """
+        ExpressionEvaluator.__stats = {}
+
     @staticmethod
     def run(expressionName, *args):
         """
@@ -43,8 +192,14 @@ class ExpressionEvaluator(object):
                 )
             )
 
+        ExpressionEvaluator.__checkArity(expressionName, len(args))
+
         # executing expression
-        return str(ExpressionEvaluator.__registered[expressionName](*args))
+        return ExpressionEvaluator.__execute(
+            expressionName,
+            ExpressionEvaluator.__registered[expressionName],
+            args
+        )
 
     @staticmethod
     def parseRun(expression):
@@ -60,14 +215,111 @@ class ExpressionEvaluator(object):
         The arguments are always parsed as string, and they should be
         handled per expression callable bases.
         """
+        return ExpressionEvaluator.compile(expression)()
+
+    @staticmethod
+    def compile(expression):
+        """
+        Return a callable (without arguments) that runs the parsed expression (see parseRun).
+
+        The compiled expressions are cached per expression string. The
+        callables of pure expressions memoize their result.
+        """
         assert isinstance(expression, basestring), \
             "Invalid expression type!"
 
+        with ExpressionEvaluator.__compiledLock:
+            compiledExpression = ExpressionEvaluator.__compiled.get(expression)
+            if compiledExpression is not None:
+                ExpressionEvaluator.__compiled.pop(expression)
+                ExpressionEvaluator.__compiled[expression] = compiledExpression
+                return compiledExpression
+
         cleanedExpressionEvaluator = list(filter(
             lambda x: x != '', expression.strip(" ").split(" ")
         ))
 
         expressionName = cleanedExpressionEvaluator[0]
-        expressionArgs = cleanedExpressionEvaluator[1:]
+        expressionArgs = tuple(cleanedExpressionEvaluator[1:])
+
+        if expressionName not in ExpressionEvaluator.__registered:
+            raise ExpressionNotFoundError(
+                'Could not find expression name: "{0}"'.format(
+                    expressionName
+                )
+            )
+
+        ExpressionEvaluator.__checkArity(expressionName, len(expressionArgs))
+
+        compiledExpression = functools.partial(
+            ExpressionEvaluator.__execute,
+            expressionName,
+            ExpressionEvaluator.__registered[expressionName],
+            expressionArgs
+        )
+
+        if ExpressionEvaluator.isPure(expressionName):
+            compiledExpression = functools.partial(
+                ExpressionEvaluator.__memoized,
+                expressionName,
+                compiledExpression,
+                []
+            )
+
+        with ExpressionEvaluator.__compiledLock:
+            if ExpressionEvaluator.__compiledSize:
+                ExpressionEvaluator.__compiled[expression] = compiledExpression
+                while len(ExpressionEvaluator.__compiled) > ExpressionEvaluator.__compiledSize:
+                    ExpressionEvaluator.__compiled.popitem(last=False)
+
+        return compiledExpression
+
+    @staticmethod
+    def __checkArity(expressionName, argsCount):
+        """
+        Raise an exception in case the number of arguments is not accepted by the expression.
+        """
+        arity = ExpressionEvaluator.__arity[expressionName]
+        if arity is not None and (argsCount < arity[0] or (arity[1] is not None and argsCount > arity[1])):
+            raise InvalidExpressionArityError(
+                'Invalid number of arguments ({0}) for the expression: "{1}"'.format(
+                    argsCount,
+                    expressionName
+                )
+            )
+
+    @staticmethod
+    def __memoized(expressionName, compiledExpression, result):
+        """
+        Return the result of the compiled expression, it's only executed in case the result is empty.
+        """
+        if result:
+            ExpressionEvaluator.__expressionStats(expressionName)[1] += 1
+        else:
+            result.append(compiledExpression())
+
+        return result[0]
+
+    @staticmethod
+    def __execute(expressionName, expressionCallable, args):
+        """
+        Execute the expression callable and return its result as string.
+        """
+        startTime = timer()
+        try:
+            return str(expressionCallable(*args))
+        finally:
+            stats = ExpressionEvaluator.__expressionStats(expressionName)
+            stats[0] += 1
+            stats[2] += timer() - startTime
+
+    @staticmethod
+    def __expressionStats(expressionName):
+        """
+        Return the list [calls, cacheHits, seconds] used to collect the statistics about the expression.
+        """
+        stats = ExpressionEvaluator.__stats.get(expressionName)
+        if stats is None:
+            stats = ExpressionEvaluator.__stats.setdefault(expressionName, [0, 0, 0.0])
 
-        return ExpressionEvaluator.run(expressionName, *expressionArgs)
+        return stats
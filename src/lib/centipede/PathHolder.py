@@ -1,13 +1,47 @@
 import os
 
+# compatibility with python 2/3
+try:
+    _intern = intern
+except NameError:
+    from sys import intern as _intern
+
+def internString(value):
+    """
+    Return the interned version of the input string.
+
+    Only native strings can be interned under python 2 (values loaded from
+    json are unicode), those values are returned as they are.
+    """
+    if type(value) is str:
+        return _intern(value)
+    return value
+
 class PathHolder(object):
     """
     Provides quick access to query information about the path.
     """
 
-    def __init__(self, path):
+    __slots__ = (
+        '__path',
+        '__basename',
+        '__name',
+        '__pathExists',
+        '__isDirectory',
+        '__size',
+        '__ext',
+        '__mtime',
+        '__inode'
+    )
+
+    def __init__(self, path, dirEntry=None):
         """
         Create a path holder object.
+
+        Optionally a dir entry (from os.scandir) can be passed. In this case the
+        information already provided by the entry (type, inode and on windows
+        the size and modification time) is used rather than querying the file
+        system again.
         """
         # lazy data
         self.__basename = None
@@ -16,10 +50,15 @@ class PathHolder(object):
         self.__isDirectory = None
         self.__size = None
         self.__ext = None
+        self.__mtime = None
+        self.__inode = None
 
         # setting path
         self.__setPath(path)
 
+        if dirEntry is not None:
+            self.__setDirEntry(dirEntry)
+
     def isDirectory(self):
         """
         Return a boolean telling if the path is a directory.
@@ -40,7 +79,8 @@ class PathHolder(object):
         Return the file extension for the path (converts automatically to lowercase).
         """
         if self.__ext is None:
-            self.__ext = os.path.splitext(self.path())[-1][1:].lower()
+            # extensions are shared by many paths, interning them to save memory
+            self.__ext = internString(os.path.splitext(self.path())[-1][1:].lower())
 
         return self.__ext
 
@@ -49,10 +89,28 @@ class PathHolder(object):
         Return the size of the file.
         """
         if self.__size is None:
-            self.__size = os.stat(self.path()).st_size
+            self.__queryStat()
 
         return self.__size
 
+    def mtime(self):
+        """
+        Return the modification time of the path.
+        """
+        if self.__mtime is None:
+            self.__queryStat()
+
+        return self.__mtime
+
+    def inode(self):
+        """
+        Return the inode number of the path.
+        """
+        if self.__inode is None:
+            self.__queryStat()
+
+        return self.__inode
+
     def baseName(self):
         """
         Return the base name about the path.
@@ -90,6 +148,41 @@ class PathHolder(object):
         """
         return self.__path
 
+    def __queryStat(self):
+        """
+        Query the stat information about the path.
+
+        @private
+        """
+        stat = os.stat(self.path())
+
+        self.__size = stat.st_size
+        self.__mtime = stat.st_mtime
+        self.__inode = stat.st_ino
+
+    def __setDirEntry(self, dirEntry):
+        """
+        Set the information provided by a dir entry to the path holder.
+
+        @private
+        """
+        self.__isDirectory = dirEntry.is_dir()
+
+        # an entry that came from the listing exists (except when it is
+        # a broken symlink). Also, the inode is provided by the listing
+        # itself on posix systems (for symlinks it would be the inode of
+        # the link rather than the target)
+        if not dirEntry.is_symlink():
+            self.__pathExists = True
+            if os.name != 'nt':
+                self.__inode = dirEntry.inode()
+
+        # on windows the stat information comes for free from the listing
+        if os.name == 'nt':
+            stat = dirEntry.stat()
+            self.__size = stat.st_size
+            self.__mtime = stat.st_mtime
+
     def __setPath(self, path):
         """
         Set a path to the path holder.
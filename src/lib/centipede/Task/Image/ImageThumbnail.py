@@ -1,4 +1,6 @@
 from ..Task import Task
+from ...Crawler.Fs.Image import Oiio
+from ...Crawler.Fs.Image import ImageProbe
 
 class ImageThumbnail(Task):
     """
@@ -6,11 +8,14 @@ class ImageThumbnail(Task):
 
     Options:
         - Optional: "convertToRGBA"
+        - Optional: "propagateSequenceResolution" (reads the resolution from a
+        single frame per image sequence, assigning it to the other frames)
     """
 
     __defaultWidth = 640
     __defaultHeight = 480
     __defaultConvertToRGBA = True
+    __defaultPropagateSequenceResolution = False
 
     def __init__(self, *args, **kwargs):
         """
@@ -21,6 +26,7 @@ class ImageThumbnail(Task):
         self.setOption('width', self.__defaultWidth)
         self.setOption('height', self.__defaultHeight)
         self.setOption("convertToRGBA", self.__defaultConvertToRGBA)
+        self.setOption("propagateSequenceResolution", self.__defaultPropagateSequenceResolution)
         self.setMetadata('dispatch.split', True)
 
     def _perform(self):
@@ -29,9 +35,17 @@ class ImageThumbnail(Task):
         """
         width = self.option('width')
         height = self.option('height')
+        crawlers = self.crawlers()
+
+        # reading the resolution of the images at once
+        imageProbe = ImageProbe(
+            propagateSequences=self.option('propagateSequenceResolution')
+        )
+        imageProbe.addCrawlers(filter(lambda x: isinstance(x, Oiio), crawlers))
+        imageProbe.run()
 
         result = []
-        for crawler in self.crawlers():
+        for crawler in crawlers:
             targetFilePath = self.target(crawler)
 
             # creating a task to resize the thumbnail
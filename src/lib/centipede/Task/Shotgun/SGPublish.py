@@ -172,7 +172,7 @@ class SGPublish(Task):
         lastFrame = None
         imageSeqPath = None
         movCrawler = FsPath.createFromPath(movieFilePath)
-        if firstFrame in movCrawler.varNames():
+        if movCrawler.hasVar('firstFrame'):
             firstFrame = movCrawler.var('firstFrame')
             lastFrame = movCrawler.var('lastFrame')
 
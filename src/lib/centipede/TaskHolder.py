@@ -4,6 +4,7 @@ from .TaskWrapper import TaskWrapper
 from .Template import Template
 from .CrawlerMatcher import CrawlerMatcher
 from .CrawlerQuery import CrawlerQuery
+from .CrawlerIndex import CrawlerIndex
 
 class TaskHolderInvalidVarNameError(Exception):
     """Task holder invalid var name error."""
@@ -141,7 +142,8 @@ class TaskHolder(object):
         Add a list of crawlers to the task.
 
         The crawlers are added to the task using "query" method to resolve
-        the target template.
+        the target template. Any iterable of crawlers is accepted (for
+        instance Crawler.iglob) or a crawler index (CrawlerIndex).
         """
         for crawler, filePath in self.query(crawlers).items():
 
@@ -217,6 +219,7 @@ class TaskHolder(object):
         """
         Perform the task.
 
+        The input crawlers can be any iterable (for instance Crawler.iglob) or a crawler index (CrawlerIndex).
         Return all the crawlers resulted by the execution of the task (and sub tasks).
         """
         return self.__recursiveTaskRunner(
@@ -324,8 +327,12 @@ class TaskHolder(object):
         taskCrawlers = taskHolder.taskWrapper().run(taskHolder.task())
         result += taskCrawlers
 
-        # calling subtask holders
-        for subTaskHolder in taskHolder.subTaskHolders():
+        # calling subtask holders (the crawlers are indexed once for all of them)
+        subTaskHolders = taskHolder.subTaskHolders()
+        if len(subTaskHolders) > 1:
+            taskCrawlers = CrawlerIndex(taskCrawlers)
+
+        for subTaskHolder in subTaskHolders:
             result += cls.__recursiveTaskRunner(subTaskHolder, taskCrawlers)
 
         return result
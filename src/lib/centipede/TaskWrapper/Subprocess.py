@@ -1,10 +1,9 @@
 import os
-import json
 import tempfile
 from ulauncher import EnvModifier, ProcessExecution
 from .TaskWrapper import TaskWrapper
 from ..Task import Task
-from ..Crawler import Crawler
+from ..Crawler import CrawlerBatch
 
 class SubprocessFailedError(Exception):
     """Subprocess failed Error."""
@@ -106,16 +105,9 @@ class Subprocess(TaskWrapper):
                 )
             )
 
-        # the task passes the result by serializing it as json, we need to load the json file
-        # and re-create the crawlers.
-        result = []
-        with open(serializedTaskFile) as jsonFile:
-            for serializedJsonCrawler in json.load(jsonFile):
-                result.append(
-                    Crawler.createFromJson(serializedJsonCrawler)
-                )
-
-        return result
+        # the task passes the result by serializing it as a crawler batch, we need to
+        # load the batch and re-create the crawlers.
+        return CrawlerBatch.read(serializedTaskFile)
 
     @staticmethod
     def runSerializedTask():
@@ -130,15 +122,13 @@ class Subprocess(TaskWrapper):
         # re-creating the task from the json contents
         task = Task.createFromJson(serializedJsonTaskContent)
 
-        # running task and serializing the output as json.
-        serializedCrawlers = []
-        for crawler in task.output():
-            serializedCrawlers.append(crawler.toJson())
-
-        # we use the environment to tell where the result has been serialized
-        # so it can be resulted back by the parent process.
-        with open(serializedTaskFilePath, 'w') as f:
-            f.write(json.dumps(serializedCrawlers))
+        # running task and serializing the output as a crawler batch. We use the
+        # environment to tell where the result has been serialized so it can be
+        # resulted back by the parent process.
+        CrawlerBatch.write(
+            task.output(),
+            serializedTaskFilePath
+        )
 
     def __envModifier(self):
         """
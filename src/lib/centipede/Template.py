@@ -1,5 +1,8 @@
 import os
+import re
 import uuid
+import threading
+from collections import OrderedDict
 from .ExpressionEvaluator import ExpressionEvaluator
 
 # compatibility with python 2/3
@@ -29,17 +32,55 @@ class Template(object):
     Also, you can use the token "<parentPath>" to pass the computed parent path
     to an expression. Keep in mind this is only supported by expressions.
         '{prefix}/testing/(computeVersion <parentPath>)/{name}.(pad {frame} 10).{ext}'
+
+    The template string is compiled once into a list of tokens (literals,
+    variables and expressions), that is evaluated by value. The compiled
+    templates are interned per input string (shared by all template objects).
+
+    An expression is evaluated only once per template object. The results of
+    pure expressions (see ExpressionEvaluator.register) are also shared by all
+    template objects through a size-bounded cache, while impure expressions
+    (for instance the ones that create new versions) are always evaluated
+    by each template object.
+
+    The directory part of the template (up to the last "/" that follows an
+    expression) is memoized per template object keyed by the values of the
+    variables it depends on, so resolving crawlers that only differ by the
+    file name (for instance the frames of a sequence) resolves the directory
+    once. Likewise, a required path level is only checked once per
+    template object.
     """
 
     __safeTokenId = uuid.uuid1()
 
+    # tokens used to escape the special template tokens
+    __safeFunctionStart = '<{}>'.format(__safeTokenId)
+    __safeFunctionEnd = '</{}>'.format(__safeTokenId)
+    __safeLevelExist = '[{}]'.format(__safeTokenId)
+    __safeParentPath = '[[{}]]'.format(__safeTokenId)
+
+    # token types used by the compiled template
+    __literalToken = 0
+    __varToken = 1
+    __expressionToken = 2
+    __parentPathToken = 3
+
+    # checking for variables "{name}"
+    __varRegex = re.compile(r'\{([^{}]*)\}')
+
+    # least recently used caches shared by all templates
+    __sharedCacheLock = threading.Lock()
+    __internedTemplates = OrderedDict()
+    __internedTemplatesSize = 1024
+
     def __init__(self, inputString=""):
         """
         Create a template object.
         """
         self.setInputString(inputString)
-        self.__setVarNames()
+        self.__varNames = list(self.__interned(inputString)[0])
         self.__expressionValueCache = {}
+        self.__existingRequiredPaths = set()
 
     def inputString(self):
         """
@@ -55,6 +96,7 @@ class Template(object):
             "Invalid template string!"
 
         self.__inputString = inputString
+        self.__prefixValues = {}
 
     def varNames(self):
         """
@@ -62,18 +104,73 @@ class Template(object):
         """
         return self.__varNames
 
+    @staticmethod
+    def setSharedCacheSize(size):
+        """
+        Set the maximum number of results of pure expressions shared by all templates.
+
+        The results are kept by the compiled expressions (see ExpressionEvaluator.setCacheSize).
+        """
+        ExpressionEvaluator.setCacheSize(size)
+
+    @staticmethod
+    def sharedCacheSize():
+        """
+        Return the maximum number of results of pure expressions shared by all templates.
+        """
+        return ExpressionEvaluator.cacheSize()
+
+    @staticmethod
+    def clearSharedCache():
+        """
+        Remove the interned templates and the results of pure expressions shared by all templates.
+        """
+        with Template.__sharedCacheLock:
+            Template.__internedTemplates.clear()
+
+        ExpressionEvaluator.clearCache()
+
     def valueFromCrawler(self, crawler, vars={}):
         """
         Return the value of the template based on a crawler.
         """
-        contextVariableValues = {}
-        for varName in self.varNames():
-            if varName in vars:
-                contextVariableValues[varName] = str(vars[varName])
-            else:
-                contextVariableValues[varName] = str(crawler.var(varName))
+        return self.valuesFromCrawlers([crawler], vars)[0]
 
-        return self.value(contextVariableValues)
+    def valuesFromCrawlers(self, crawlers, vars={}):
+        """
+        Return a list containing the values of the template based on the crawlers.
+
+        Same as valueFromCrawler, however the template is prepared once for
+        all crawlers: the input variables (shared by all crawlers) and the
+        expressions that only depend on them are resolved once, where the
+        remaining variables are queried from each crawler.
+        """
+        plan = None
+        sharedVars = dict(map(lambda x: (x, str(vars[x])), filter(lambda x: x in vars, self.varNames())))
+        crawlerVarNames = list(filter(lambda x: x not in vars, self.varNames()))
+
+        result = []
+        escapedValues = {}
+        prefixValues = {}
+        for crawler in crawlers:
+
+            # the tokens are bound to the shared variables only when there is
+            # at least one crawler (avoiding to run expressions otherwise)
+            if plan is None:
+                plan = self.__plan(
+                    self.__bindTokens(self.__interned(self.inputString())[1], self.__escapeVars(sharedVars))
+                )
+
+            escapedVars = {}
+            for varName in crawlerVarNames:
+                value = str(crawler.var(varName))
+                if value not in escapedValues:
+                    escapedValues[value] = self.__escapeTemplateTokens(value)
+                escapedVars[varName] = escapedValues[value]
+
+            result.append(self.__resolve(plan, escapedVars, prefixValues))
+
+        return result
 
     def value(self, vars={}):
         """
@@ -81,49 +178,107 @@ class Template(object):
         """
         self.__validateTemplateVariables(vars)
 
-        # resolving variables values
-        resolvedTemplate = self.inputString()
+        return self.__resolve(
+            self.__interned(self.inputString())[2],
+            self.__escapeVars(vars),
+            self.__prefixValues
+        )
+
+    @classmethod
+    def __interned(cls, inputString):
+        """
+        Return a tuple (variable names, tokens, plan) about the input string.
+
+        The result is shared by all templates using the same input string,
+        it must not be modified.
+        """
+        with cls.__sharedCacheLock:
+            result = cls.__cacheValue(cls.__internedTemplates, inputString)
+
+        if result is None:
+            tokens = cls.__compile(inputString)
+            result = (tuple(cls.__parseVarNames(inputString)), tokens, cls.__plan(tokens))
+
+            with cls.__sharedCacheLock:
+                cls.__cacheStore(cls.__internedTemplates, inputString, result, cls.__internedTemplatesSize)
+
+        return result
+
+    @staticmethod
+    def __cacheValue(cache, key):
+        """
+        Return the value of the key from the least recently used cache (None when not found).
+        """
+        value = cache.pop(key, None)
+        if value is not None:
+            cache[key] = value
+
+        return value
+
+    @staticmethod
+    def __cacheStore(cache, key, value, size):
+        """
+        Store the value in the least recently used cache (the oldest values are removed when the size is exceeded).
+        """
+        cache.pop(key, None)
+        if size <= 0:
+            return
+
+        cache[key] = value
+        while len(cache) > size:
+            cache.popitem(last=False)
+
+    def __escapeVars(self, vars):
+        """
+        Return a dict containing the escaped values of the variables.
+        """
+        result = {}
         for varName, varValue in vars.items():
-            resolvedTemplate = resolvedTemplate.replace(
-                ('{' + varName + '}'),
-                self.__escapeTemplateTokens(varValue)
-            )
+            result[varName] = self.__escapeTemplateTokens(varValue)
 
-        # resolving function values
-        finalResolvedTemplate = ""
-        for templatePart in resolvedTemplate.split("("):
-
-            endIndex = templatePart.find(')')
-            if endIndex != -1:
-
-                # processing the expression only when it has not been
-                # evaluated yet, otherwise return it from the cache.
-                # Potentially we could add support for "<expression>" rather
-                # than "(expression)" to tell to avoid this cache. However, the
-                # default behaviour should be to always cache it (never change it)
-                # otherwise it could side effect in expressions that create
-                # new versions...
-                rawExpression = templatePart[:endIndex]
-
-                # this is a special token that allows to pass the parent path
-                # to an expression, replacing it with the parent path at this point.
-                rawExpression = rawExpression.replace(
-                    "<parentPath>",
-                    self.__escapeTemplateTokens(finalResolvedTemplate.replace("/!", "/"), 0)
-                )
+        return result
 
-                if rawExpression not in self.__expressionValueCache:
-                    # replacing any reserved token from the result of the expression
-                    self.__expressionValueCache[rawExpression] = self.__escapeTemplateTokens(
-                        ExpressionEvaluator.parseRun(
-                            rawExpression
-                        )
-                    )
+    def __bindTokens(self, tokens, escapedVars):
+        """
+        Return a list of tokens where the variables and the expressions that only depend on the escaped vars are resolved.
+        """
+        result = []
+        for tokenType, tokenValue in tokens:
+            if tokenType == self.__varToken and tokenValue in escapedVars:
+                result.append((self.__literalToken, escapedVars[tokenValue]))
+
+            elif tokenType == self.__expressionToken:
+                expressionTokens = self.__bindTokens(tokenValue, escapedVars)
+
+                # resolving the expression right away
+                if all(map(lambda x: x[0] == self.__literalToken, expressionTokens)):
+                    result.append((self.__literalToken, self.__expressionValue(expressionTokens, {}, [])))
+                else:
+                    result.append((tokenType, expressionTokens))
 
-                expressionValue = self.__expressionValueCache[rawExpression]
-                finalResolvedTemplate += expressionValue + templatePart[endIndex + 1:]
             else:
-                finalResolvedTemplate += templatePart
+                result.append((tokenType, tokenValue))
+
+        return self.__mergeLiterals(result)
+
+    def __resolve(self, plan, escapedVars, prefixValues):
+        """
+        Return the value of the template resolving the plan (see __plan).
+
+        The resolved prefixes are memoized in the prefix values (keyed by the
+        values of the variables used by the prefix).
+        """
+        prefixTokens, prefixVarNames, tokens = plan
+
+        resolvedParts = []
+        if prefixTokens is not None:
+            prefixKey = tuple(map(escapedVars.get, prefixVarNames))
+            if prefixKey not in prefixValues:
+                prefixValues[prefixKey] = ''.join(self.__resolveTokens(prefixTokens, escapedVars, []))
+
+            resolvedParts.append(prefixValues[prefixKey])
+
+        finalResolvedTemplate = ''.join(self.__resolveTokens(tokens, escapedVars, resolvedParts))
 
         # resolving required path levels
         if "/!" in finalResolvedTemplate:
@@ -132,6 +287,9 @@ class Template(object):
                 if pathLevel.startswith("!"):
                     finalPath.append(pathLevel[1:])
                     resolvedPath = os.sep.join(finalPath)
+                    if resolvedPath in self.__existingRequiredPaths:
+                        continue
+
                     if not os.path.exists(resolvedPath):
                         raise RequiredPathNotFoundError(
                             'Template contains a path marked as required:\n"{0}"\n\nThis error is caused because the target path does not exist in the file system:\n{1}'.format(
@@ -140,6 +298,8 @@ class Template(object):
                             )
                         )
 
+                    self.__existingRequiredPaths.add(resolvedPath)
+
                 else:
                     finalPath.append(pathLevel)
             finalResolvedTemplate = os.sep.join(finalPath)
@@ -149,6 +309,185 @@ class Template(object):
 
         return finalResolvedTemplate
 
+    def __resolveTokens(self, tokens, escapedVars, resolvedParts):
+        """
+        Resolve the tokens appending the results to the resolved parts (returned by the method).
+        """
+        for tokenType, tokenValue in tokens:
+            if tokenType == self.__literalToken:
+                resolvedParts.append(tokenValue)
+            elif tokenType == self.__varToken:
+                resolvedParts.append(self.__varValue(tokenValue, escapedVars))
+            else:
+                resolvedParts.append(self.__expressionValue(tokenValue, escapedVars, resolvedParts))
+
+        return resolvedParts
+
+    def __varValue(self, varName, escapedVars):
+        """
+        Return the escaped value of a variable token.
+        """
+        # variables that have not been provided are kept as they are
+        if varName not in escapedVars:
+            return '{' + varName + '}'
+
+        return escapedVars[varName]
+
+    def __expressionValue(self, expressionTokens, escapedVars, resolvedParts):
+        """
+        Return the escaped value of an expression token.
+
+        The resolved parts are used to compute the parent path.
+        """
+        rawExpressionParts = []
+        for tokenType, tokenValue in expressionTokens:
+            if tokenType == self.__literalToken:
+                rawExpressionParts.append(tokenValue)
+            elif tokenType == self.__varToken:
+                rawExpressionParts.append(self.__varValue(tokenValue, escapedVars))
+
+            # this is a special token that allows to pass the parent path
+            # to an expression, replacing it with the parent path at this point.
+            else:
+                rawExpressionParts.append(
+                    self.__escapeTemplateTokens(''.join(resolvedParts).replace("/!", "/"), 0)
+                )
+
+        # processing the expression only when it has not been
+        # evaluated yet, otherwise return it from the cache.
+        # Potentially we could add support for "<expression>" rather
+        # than "(expression)" to tell to avoid this cache. However, the
+        # default behaviour should be to always cache it (never change it)
+        # otherwise it could side effect in expressions that create
+        # new versions...
+        rawExpression = ''.join(rawExpressionParts)
+        if rawExpression not in self.__expressionValueCache:
+            self.__expressionValueCache[rawExpression] = self.__evaluateExpression(rawExpression)
+
+        return self.__expressionValueCache[rawExpression]
+
+    @classmethod
+    def __evaluateExpression(cls, rawExpression):
+        """
+        Return the escaped result of the expression.
+
+        The results of pure expressions are shared by all templates (see ExpressionEvaluator.compile).
+        """
+        # replacing any reserved token from the result of the expression
+        return cls.__escapeTemplateTokens(
+            ExpressionEvaluator.compile(
+                rawExpression
+            )()
+        )
+
+    @classmethod
+    def __compile(cls, inputString):
+        """
+        Return a list of tokens (token type, value) about the input string.
+
+        An expression starts at "(" and finishes at the first ")" that follows
+        it, where its value is a list of tokens (literals, variables and
+        parent path). A "(" without a closing ")" is dropped, while a ")"
+        without an opening "(" closes an expression started at the
+        beginning of the template.
+        """
+        # splitting the literals from the variables, the parts are
+        # split again by "(" where each part may contain an expression
+        parts = [[]]
+        for index, value in enumerate(cls.__varRegex.split(inputString)):
+            if index % 2:
+                parts[-1].append((cls.__varToken, value))
+                continue
+
+            literals = value.split('(')
+            parts[-1].append((cls.__literalToken, literals[0]))
+            for literal in literals[1:]:
+                parts.append([(cls.__literalToken, literal)])
+
+        result = []
+        for part in parts:
+            for index, (tokenType, tokenValue) in enumerate(part):
+                if tokenType == cls.__literalToken and ')' in tokenValue:
+                    endIndex = tokenValue.find(')')
+                    expressionTokens = []
+                    for expressionTokenType, expressionTokenValue in part[:index] + [(cls.__literalToken, tokenValue[:endIndex])]:
+                        if expressionTokenType == cls.__varToken:
+                            expressionTokens.append((expressionTokenType, expressionTokenValue))
+                            continue
+
+                        literals = expressionTokenValue.split('<parentPath>')
+                        expressionTokens.append((cls.__literalToken, literals[0]))
+                        for literal in literals[1:]:
+                            expressionTokens.append((cls.__parentPathToken, None))
+                            expressionTokens.append((cls.__literalToken, literal))
+
+                    result.append((cls.__expressionToken, cls.__mergeLiterals(expressionTokens)))
+                    result.append((cls.__literalToken, tokenValue[endIndex + 1:]))
+                    result += part[index + 1:]
+                    break
+            else:
+                result += part
+
+        return cls.__mergeLiterals(result)
+
+    @classmethod
+    def __plan(cls, tokens):
+        """
+        Return a tuple (prefix tokens, prefix variable names, remaining tokens) used to resolve the tokens.
+
+        The prefix finishes at the last "/" found in a literal after an
+        expression (the prefix tokens are None when there is no such literal),
+        the prefix variable names are the ones used by the prefix (including
+        the ones used by its expressions).
+        """
+        prefixIndex = None
+        hasExpression = False
+        for index, (tokenType, tokenValue) in enumerate(tokens):
+            if tokenType == cls.__expressionToken:
+                hasExpression = True
+            elif tokenType == cls.__literalToken and hasExpression and '/' in tokenValue:
+                prefixIndex = index
+
+        if prefixIndex is None:
+            return (None, (), tokens)
+
+        literal = tokens[prefixIndex][1]
+        separatorIndex = literal.rfind('/') + 1
+        prefixTokens = tokens[:prefixIndex] + [(cls.__literalToken, literal[:separatorIndex])]
+
+        prefixVarNames = set()
+        for tokenType, tokenValue in prefixTokens:
+            if tokenType == cls.__varToken:
+                prefixVarNames.add(tokenValue)
+            elif tokenType == cls.__expressionToken:
+                for expressionTokenType, expressionTokenValue in tokenValue:
+                    if expressionTokenType == cls.__varToken:
+                        prefixVarNames.add(expressionTokenValue)
+
+        return (
+            prefixTokens,
+            tuple(sorted(prefixVarNames)),
+            cls.__mergeLiterals([(cls.__literalToken, literal[separatorIndex:])] + tokens[prefixIndex + 1:])
+        )
+
+    @classmethod
+    def __mergeLiterals(cls, tokens):
+        """
+        Return a list of tokens where the consecutive literals are merged (empty literals are removed).
+        """
+        result = []
+        for tokenType, tokenValue in tokens:
+            if tokenType != cls.__literalToken:
+                result.append((tokenType, tokenValue))
+            elif not tokenValue:
+                continue
+            elif result and result[-1][0] == cls.__literalToken:
+                result[-1] = (cls.__literalToken, result[-1][1] + tokenValue)
+            else:
+                result.append((tokenType, tokenValue))
+
+        return result
+
     def __validateTemplateVariables(self, vars):
         """
         Make sure the variables used by template are available, otherwise thown an exception (VariableNotFoundError).
@@ -161,31 +500,32 @@ class Template(object):
                     )
                 )
 
-    def __setVarNames(self):
+    @staticmethod
+    def __parseVarNames(inputString):
         """
-        Set the variable names found in the input template.
+        Return a list of the variable names found in the input string.
         """
         result = set()
 
         # detecting variables
-        for templatePart in self.inputString().split("{"):
+        for templatePart in inputString.split("{"):
             if templatePart is '' or "}" not in templatePart:
                 continue
 
             endIndex = templatePart.find('}')
             result.add(templatePart[:endIndex])
 
-        self.__varNames = list(result)
+        return list(result)
 
     @classmethod
     def __escapeTemplateTokens(cls, value, direction=1):
         """
         Escape special template tokens from the input string.
         """
-        safeFunctionStart = '<{}>'.format(cls.__safeTokenId)
-        safeFunctionEnd = '</{}>'.format(cls.__safeTokenId)
-        safeLevelExist = '[{}]'.format(cls.__safeTokenId)
-        safeParentPath = '[[{}]]'.format(cls.__safeTokenId)
+        safeFunctionStart = cls.__safeFunctionStart
+        safeFunctionEnd = cls.__safeFunctionEnd
+        safeLevelExist = cls.__safeLevelExist
+        safeParentPath = cls.__safeParentPath
 
         if direction:
             return str(value).replace(
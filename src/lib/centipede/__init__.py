@@ -1,6 +1,7 @@
 from .PathHolder import PathHolder
 from . import Crawler
 from .Template import Template, RequiredPathNotFoundError, VariableNotFoundError
+from .CrawlerIndex import CrawlerIndex
 from .CrawlerQuery import CrawlerQuery
 from .ExpressionEvaluator import ExpressionEvaluator
 from .CrawlerMatcher import CrawlerMatcher
@@ -0,0 +1,49 @@
+import os
+import json
+import unittest
+from ..BaseTestCase import BaseTestCase
+from centipede.Crawler import CrawlerBatch
+from centipede.Crawler.Fs import FsPath
+
+class CrawlerBatchTest(BaseTestCase):
+    """Test CrawlerBatch."""
+
+    __dir = os.path.join(BaseTestCase.dataDirectory(), "glob")
+
+    def testCrawlerBatchSerialize(self):
+        """
+        Test that the crawlers can be serialized as a batch and back.
+        """
+        crawlers = FsPath.createFromPath(self.__dir).glob()
+        crawlers[0].setVar('testList', [1, 2], True)
+        crawlers[-1].setTag('testTag', 'value')
+
+        for compress in (False, True):
+            result = CrawlerBatch.deserialize(CrawlerBatch.serialize(crawlers, compress))
+            self.assertEqual(len(result), len(crawlers))
+            for crawler, resultCrawler in zip(crawlers, result):
+                self.assertEqual(type(crawler), type(resultCrawler))
+                self.assertCountEqual(crawler.varNames(), resultCrawler.varNames())
+                for varName in crawler.varNames():
+                    self.assertEqual(crawler.var(varName), resultCrawler.var(varName))
+                self.assertCountEqual(crawler.contextVarNames(), resultCrawler.contextVarNames())
+                self.assertCountEqual(crawler.tagNames(), resultCrawler.tagNames())
+
+            self.assertEqual(result[-1].tag('testTag'), 'value')
+            self.assertIn('testList', result[0].contextVarNames())
+
+    def testCrawlerBatchLegacy(self):
+        """
+        Test that the legacy format (list of json crawlers) can be loaded.
+        """
+        crawlers = FsPath.createFromPath(self.__dir).glob()
+        legacyData = json.dumps(list(map(lambda x: x.toJson(), crawlers)))
+        result = CrawlerBatch.deserialize(legacyData)
+        self.assertEqual(
+            list(map(lambda x: x.var('filePath'), crawlers)),
+            list(map(lambda x: x.var('filePath'), result))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
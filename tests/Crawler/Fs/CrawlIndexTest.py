@@ -0,0 +1,120 @@
+import os
+import time
+import shutil
+import tempfile
+import unittest
+from ...BaseTestCase import BaseTestCase
+from centipede.Crawler import Crawler
+from centipede.Crawler.Fs import FsPath
+from centipede.Crawler.Fs import File
+from centipede.Crawler.Fs import CrawlIndex
+
+class CrawlIndexTest(BaseTestCase):
+    """Test CrawlIndex."""
+
+    __dir = os.path.join(BaseTestCase.dataDirectory(), "glob")
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Create a copy of the glob directory used by the tests.
+        """
+        cls.__tempDirectory = tempfile.mkdtemp()
+        cls.__globDirectory = os.path.join(cls.__tempDirectory, "glob")
+        shutil.copytree(cls.__dir, cls.__globDirectory)
+
+        # the directories modified just now are not trusted by the index
+        cls.__touchDirectories(time.time() - 60)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Remove the directory used by the tests.
+        """
+        shutil.rmtree(cls.__tempDirectory)
+
+    def testCrawlIndexGlob(self):
+        """
+        Test that the crawlers created from the index are the same as the glob ones.
+        """
+        indexFile = os.path.join(self.__tempDirectory, "index.db")
+        crawlIndex = CrawlIndex(indexFile)
+        crawlIndex.clear()
+        globCrawlers = FsPath.createFromPath(self.__globDirectory).glob()
+        indexCrawlers = FsPath.createFromPath(self.__globDirectory).glob(crawlIndex=crawlIndex)
+        self.assertEqual(crawlIndex.stats()['restored'], 0)
+        crawlIndex.close()
+
+        # re-opening the index
+        crawlIndex = CrawlIndex(indexFile)
+        restoredCrawlers = FsPath.createFromPath(self.__globDirectory).glob(crawlIndex=crawlIndex)
+        self.assertEqual(crawlIndex.stats()['listed'], 0)
+        self.assertGreater(crawlIndex.stats()['restored'], 0)
+
+        for crawlers in (indexCrawlers, restoredCrawlers):
+            self.assertEqual(len(crawlers), len(globCrawlers))
+            for crawler, globCrawler in zip(crawlers, globCrawlers):
+                self.assertEqual(type(crawler), type(globCrawler))
+                self.assertEqual(crawler.pathHolder().path(), globCrawler.pathHolder().path())
+                self.assertCountEqual(crawler.varNames(), globCrawler.varNames())
+                for varName in globCrawler.varNames():
+                    self.assertEqual(crawler.var(varName), globCrawler.var(varName))
+                self.assertCountEqual(crawler.contextVarNames(), globCrawler.contextVarNames())
+                self.assertCountEqual(crawler.tagNames(), globCrawler.tagNames())
+        crawlIndex.close()
+
+    def testCrawlIndexModifiedDirectory(self):
+        """
+        Test that only the modified directories are listed again.
+        """
+        crawlIndex = CrawlIndex()
+        FsPath.createFromPath(self.__globDirectory).glob(crawlIndex=crawlIndex)
+        listed = crawlIndex.stats()['listed']
+
+        newFile = os.path.join(self.__globDirectory, "newFile.txt")
+        open(newFile, "w").close()
+        self.__touchDirectories(time.time() - 60)
+        try:
+            crawlers = FsPath.createFromPath(self.__globDirectory).glob(crawlIndex=crawlIndex)
+            self.assertIn(newFile, map(lambda x: x.var("filePath"), crawlers))
+            self.assertEqual(crawlIndex.stats()['listed'], listed + 1)
+        finally:
+            os.remove(newFile)
+            self.__touchDirectories(time.time() - 60)
+        crawlIndex.close()
+
+    def testCrawlIndexRegisteredTypes(self):
+        """
+        Test that the index is cleared only when the registered crawler types change.
+        """
+        crawlIndex = CrawlIndex()
+        FsPath.createFromPath(self.__globDirectory).glob(crawlIndex=crawlIndex)
+        listed = crawlIndex.stats()['listed']
+
+        # registering the same type again does not change the signature
+        Crawler.register('generic', File)
+        FsPath.createFromPath(self.__globDirectory).glob(crawlIndex=crawlIndex)
+        self.assertEqual(crawlIndex.stats()['listed'], listed)
+
+        class CustomFile(File):
+            pass
+
+        Crawler.register('generic', CustomFile)
+        try:
+            FsPath.createFromPath(self.__globDirectory).glob(crawlIndex=crawlIndex)
+            self.assertEqual(crawlIndex.stats()['listed'], listed * 2)
+        finally:
+            Crawler.register('generic', File)
+        crawlIndex.close()
+
+    @classmethod
+    def __touchDirectories(cls, mtime):
+        """
+        Set the modification time for all directories used by the tests.
+        """
+        for directory, _, _ in os.walk(cls.__globDirectory):
+            os.utime(directory, (mtime, mtime))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import os
 import glob
+import pickle
 import unittest
 from ...BaseTestCase import BaseTestCase
 from centipede.Crawler import Crawler
@@ -61,6 +62,56 @@ class FsPathTest(BaseTestCase):
         otherCrawlerPaths = list(map(lambda x: x.var("filePath"), otherCrawlers))
         self.assertCountEqual(crawlerPaths, otherCrawlerPaths)
 
+    def testFsPathGlobWorkers(self):
+        """
+        Test that the parallel glob returns the same result as the serial glob.
+        """
+        crawler = Crawler.create(PathHolder(self.__dir))
+        serialPaths = list(map(lambda x: x.var("filePath"), crawler.glob(useCache=False)))
+        parallelPaths = list(map(lambda x: x.var("filePath"), crawler.glob(useCache=False, workers=4)))
+        self.assertEqual(serialPaths, parallelPaths)
+
+        otherCrawler = Crawler.create(PathHolder(self.__dir))
+        crawlers = Crawler.globCrawlers([crawler, otherCrawler], workers=4)
+        crawlerPaths = list(map(lambda x: x.var("filePath"), crawlers))
+        self.assertEqual(crawlerPaths, serialPaths + serialPaths)
+
+    def testFsPathGlobFilterPushdown(self):
+        """
+        Test that the filtered glob does not create the crawlers that cannot satisfy the filter.
+        """
+        crawler = Crawler.create(PathHolder(self.__dir))
+        exrPaths = list(map(lambda x: x.var("filePath"), filter(
+            lambda x: isinstance(x, Exr),
+            crawler.glob(useCache=False)
+        )))
+
+        Crawler.resetDispatchStats()
+        crawlerPaths = list(map(lambda x: x.var("filePath"), crawler.glob(['exr'], useCache=False)))
+        self.assertEqual(crawlerPaths, exrPaths)
+
+        for registeredName in Crawler.dispatchStats()['typeHits'].keys():
+            registeredType = Crawler.registeredType(registeredName)
+            self.assertTrue(issubclass(registeredType, (Exr, Crawler.registeredType('directory'))))
+
+        iglobPaths = list(map(lambda x: x.var("filePath"), crawler.iglob(['exr'], useCache=False)))
+        self.assertEqual(iglobPaths, exrPaths)
+
+    def testFsPathIglob(self):
+        """
+        Test that the iglob yields the same crawlers as the glob.
+        """
+        crawler = Crawler.create(PathHolder(self.__dir))
+        iglobResult = crawler.iglob()
+        self.assertFalse(isinstance(iglobResult, list))
+        iglobPaths = list(map(lambda x: x.var("filePath"), iglobResult))
+        globPaths = list(map(lambda x: x.var("filePath"), crawler.glob(useCache=False)))
+        self.assertEqual(iglobPaths, globPaths)
+
+        globExrPaths = list(map(lambda x: x.var("filePath"), crawler.glob(['exr'])))
+        iglobExrPaths = list(map(lambda x: x.var("filePath"), crawler.iglob(['exr'], useCache=False)))
+        self.assertEqual(iglobExrPaths, globExrPaths)
+
     def testPathVariables(self):
         """
         Test that the crawler variables are set properly.
@@ -74,6 +125,30 @@ class FsPathTest(BaseTestCase):
         self.assertEqual(crawler.var('sourceDirectory'), os.path.dirname(name))
         self.assertRaises(InvalidVarError, crawler.var, "dummyVar")
 
+    def testCrawlerVarsInheritance(self):
+        """
+        Test that the variables of the parent crawler are passed to the children.
+        """
+        crawler = Crawler.create(PathHolder(self.__dir))
+        crawler.setVar('parentVar', 'a')
+        crawler.setVar('parentContextVar', 'b', True)
+        child = crawler.children()[0]
+        self.assertEqual(child.var('parentVar'), 'a')
+        self.assertEqual(child.var('parentContextVar'), 'b')
+        self.assertIn('parentContextVar', child.contextVarNames())
+
+        # changes in the parent should not affect the existing children
+        crawler.setVar('parentVar', 'c')
+        crawler.setVar('parentContextVar', 'd', False)
+        self.assertEqual(child.var('parentVar'), 'a')
+        self.assertIn('parentContextVar', child.contextVarNames())
+        self.assertNotIn('parentContextVar', crawler.contextVarNames())
+
+        # changes in the children should not affect the parent
+        child.setVar('parentVar', 'e')
+        self.assertEqual(crawler.var('parentVar'), 'c')
+        self.assertEqual(crawler.children()[0].var('parentVar'), 'c')
+
     def testCrawlerTags(self):
         """
         Test that the Crawler tags are set properly.
@@ -95,6 +170,85 @@ class FsPathTest(BaseTestCase):
         self.assertIn(DummyCrawler, Crawler.registeredSubclasses("generic"))
         self.assertIn(DummyCrawler, Crawler.registeredSubclasses(FsPath))
 
+    def testCrawlerTypeHierarchy(self):
+        """
+        Test that the type hierarchy index is invalidated by the registration.
+        """
+        self.assertTrue(Crawler.isSubType("exr", "generic"))
+        self.assertTrue(Crawler.isSubType("exr", Exr))
+        self.assertFalse(Crawler.isSubType("generic", "exr"))
+        self.assertNotIn("dummyHierarchy", Crawler.registeredSubTypes("exr"))
+
+        class DummyHierarchyCrawler(Exr):
+            @classmethod
+            def testExtensions(cls):
+                return []
+
+            @classmethod
+            def test(cls, pathHolder, parentCrawler):
+                return False
+
+        version = Crawler.registryVersion()
+        Crawler.register("dummyHierarchy", DummyHierarchyCrawler)
+        self.addCleanup(Crawler.unregister, "dummyHierarchy")
+        self.assertNotEqual(Crawler.registryVersion(), version)
+        self.assertTrue(Crawler.isSubType("dummyHierarchy", "exr"))
+        self.assertIn("dummyHierarchy", Crawler.registeredSubTypes("exr"))
+        self.assertIn(DummyHierarchyCrawler, Crawler.registeredSubclasses(Exr))
+
+    def testCrawlerLazyVars(self):
+        """
+        Test that the lazy variables are only computed when they are accessed.
+        """
+        calls = []
+
+        class DummyLazyCrawler(File):
+            def _dummyVars(self):
+                calls.append(self.var('filePath'))
+                return {'dummyA': 'a', 'dummyB': 'b'}
+
+        Crawler.registerLazyVars(
+            DummyLazyCrawler,
+            ['dummyA', 'dummyB', 'dummyC'],
+            DummyLazyCrawler._dummyVars,
+            Crawler.lazyVarCostCpu
+        )
+        self.assertCountEqual(Crawler.registeredLazyVarNames(DummyLazyCrawler), ['dummyA', 'dummyB', 'dummyC'])
+
+        crawler = DummyLazyCrawler(PathHolder(self.__turntableFile))
+        self.assertCountEqual(crawler.lazyVarNames(), ['dummyA', 'dummyB', 'dummyC'])
+        self.assertNotIn('dummyA', crawler.varNames())
+        self.assertNotIn('dummyA', crawler.toJson())
+        self.assertEqual(crawler.var('dummyA'), 'a')
+        self.assertIn('dummyB', crawler.varNames())
+        self.assertIn('dummyB', crawler.toJson())
+
+        # the provider is called only once (even for variables it does not compute)
+        self.assertFalse(crawler.hasVar('dummyC'))
+        self.assertRaises(InvalidVarError, crawler.var, 'dummyC')
+        self.assertEqual(len(calls), 1)
+
+        crawlers = [DummyLazyCrawler(PathHolder(self.__turntableFile)) for i in range(3)]
+        Crawler.resolveLazyVars(crawlers)
+        self.assertEqual(len(calls), 4)
+        for lazyCrawler in crawlers:
+            self.assertIn('dummyB', lazyCrawler.varNames())
+            self.assertEqual(lazyCrawler.lazyVarNames(), [])
+
+    def testCrawlerDispatchIndex(self):
+        """
+        Test that the dispatch index only tests the candidate crawler types.
+        """
+        Crawler.resetDispatchStats()
+        crawler = Crawler.create(PathHolder(os.path.join(self.dataDirectory(), "test.exr")))
+        self.assertIsInstance(crawler, Exr)
+
+        stats = Crawler.dispatchStats()
+        self.assertEqual(stats['creates'], 1)
+        self.assertEqual(stats['typeHits'], {'exr': 1})
+        self.assertGreater(stats['testsSkipped'], 0)
+        self.assertLess(stats['testsRun'], len(Crawler.registeredNames()))
+
     def testCrawlerClone(self):
         """
         Test that cloning crawlers works.
@@ -105,6 +259,44 @@ class FsPathTest(BaseTestCase):
         self.assertCountEqual(crawler.contextVarNames(), clone.contextVarNames())
         self.assertCountEqual(crawler.tagNames(), clone.tagNames())
 
+    def testCrawlerCloneStructural(self):
+        """
+        Test that the clone does not share mutable values with the crawler.
+        """
+        crawler = Crawler.create(PathHolder(os.path.join(self.dataDirectory(), "test.exr")))
+        crawler.setVar('testList', [1, 2], True)
+        clone = crawler.clone()
+        clone.var('testList').append(3)
+        self.assertEqual(crawler.var('testList'), [1, 2])
+        self.assertIn('testList', clone.contextVarNames())
+        self.assertEqual(clone.pathHolder().path(), crawler.pathHolder().path())
+
+    def testCrawlerBinary(self):
+        """
+        Test that you can convert a crawler to binary and back.
+        """
+        crawler = Crawler.create(PathHolder(os.path.join(self.dataDirectory(), "test.exr")))
+        crawler.setTag('testTag', 'value')
+        crawlerResult = Crawler.createFromBinary(crawler.toBinary())
+        self.assertIsInstance(crawlerResult, Exr)
+        self.assertCountEqual(crawler.varNames(), crawlerResult.varNames())
+        for varName in crawler.varNames():
+            self.assertEqual(crawler.var(varName), crawlerResult.var(varName))
+        self.assertCountEqual(crawler.contextVarNames(), crawlerResult.contextVarNames())
+        self.assertEqual(crawlerResult.tag('testTag'), 'value')
+
+    def testCrawlerPickleProtocol2(self):
+        """
+        Test that a crawler can be pickled through the protocol 2 (highest protocol under python 2).
+        """
+        crawler = Crawler.create(PathHolder(os.path.join(self.dataDirectory(), "test.exr")))
+        crawler.setVar('testVar', 'value', True)
+        crawlerResult = pickle.loads(pickle.dumps(crawler, 2))
+        self.assertIsInstance(crawlerResult, Exr)
+        self.assertEqual(crawlerResult.var('testVar'), 'value')
+        self.assertIn('testVar', crawlerResult.contextVarNames())
+        self.assertEqual(crawlerResult.var('filePath'), crawler.var('filePath'))
+
     def testCrawlerJson(self):
         """
         Test that you can convert a crawler to json and back.
@@ -134,5 +326,21 @@ class FsPathTest(BaseTestCase):
         pathHolder = PathHolder("/")
         self.assertEqual(pathHolder.baseName(), os.sep)
 
+    def testPathHolderDirEntry(self):
+        """
+        Test that a PathHolder created from a dir entry provides the same information.
+        """
+        for dirEntry in os.scandir(self.dataDirectory()):
+            if dirEntry.is_symlink():
+                continue
+
+            pathHolder = PathHolder(dirEntry.path, dirEntry)
+            stat = os.stat(dirEntry.path)
+            self.assertEqual(pathHolder.isDirectory(), os.path.isdir(dirEntry.path))
+            self.assertTrue(pathHolder.exists())
+            self.assertEqual(pathHolder.size(), stat.st_size)
+            self.assertEqual(pathHolder.mtime(), stat.st_mtime)
+            self.assertEqual(pathHolder.inode(), stat.st_ino)
+
 if __name__ == "__main__":
     unittest.main()
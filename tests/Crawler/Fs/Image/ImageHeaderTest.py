@@ -0,0 +1,87 @@
+import os
+import unittest
+from ....BaseTestCase import BaseTestCase
+from centipede.Crawler import Crawler
+from centipede.PathHolder import PathHolder
+from centipede.Crawler.Fs.Image import ImageHeader
+from centipede.Crawler.Fs.Image.ImageHeader import ImageHeaderError
+
+class ImageHeaderTest(BaseTestCase):
+    """Test ImageHeader."""
+
+    __exrFile = os.path.join(BaseTestCase.dataDirectory(), "test.exr")
+    __pngFile = os.path.join(BaseTestCase.dataDirectory(), "test.png")
+    __jpgFile = os.path.join(BaseTestCase.dataDirectory(), "test.jpg")
+    __txtFile = os.path.join(BaseTestCase.dataDirectory(), "test.txt")
+
+    def testExrHeader(self):
+        """
+        Test that the exr header is read properly.
+        """
+        header = ImageHeader.read(self.__exrFile)
+        self.assertEqual(header['width'], 1828)
+        self.assertEqual(header['height'], 1556)
+        self.assertEqual(header['dataWindow'], [0, 0, 1827, 1555])
+        self.assertEqual(header['displayWindow'], [0, 0, 1827, 1555])
+        self.assertEqual(header['channels'], ['B', 'G', 'R'])
+        self.assertEqual(header['compression'], 'zips')
+
+    def testPngHeader(self):
+        """
+        Test that the png header is read properly.
+        """
+        header = ImageHeader.read(self.__pngFile)
+        self.assertEqual(header['width'], 640)
+        self.assertEqual(header['height'], 480)
+        self.assertEqual(header['bitDepth'], 8)
+
+    def testJpgHeader(self):
+        """
+        Test that the jpg header is read properly.
+        """
+        header = ImageHeader.read(self.__jpgFile)
+        self.assertEqual(header['width'], 512)
+        self.assertEqual(header['height'], 512)
+        self.assertEqual(header['components'], 3)
+
+    def testInvalidHeader(self):
+        """
+        Test that invalid files raise an error.
+        """
+        self.assertRaises(ImageHeaderError, ImageHeader.read, self.__txtFile)
+        self.assertRaises(ImageHeaderError, ImageHeader.read, self.__txtFile, 'exr')
+        self.assertRaises(ImageHeaderError, ImageHeader.read, self.__txtFile, 'dpx')
+        self.assertEqual(ImageHeader.varNames('txt'), [])
+
+    def testHeaderVariables(self):
+        """
+        Test that the header information is available as crawler variables.
+        """
+        crawler = Crawler.create(PathHolder(self.__exrFile))
+        self.assertNotIn('channels', crawler.varNames())
+        self.assertEqual(crawler.var('channels'), ['B', 'G', 'R'])
+        self.assertIn('width', crawler.varNames())
+        self.assertEqual(crawler.var('compression'), 'zips')
+
+    def testHeaderVariableNames(self):
+        """
+        Test that each format only provides the header variables it can produce.
+        """
+        exrCrawler = Crawler.create(PathHolder(self.__exrFile))
+        self.assertCountEqual(exrCrawler.lazyVarNames(), ImageHeader.varNames('exr'))
+
+        pngCrawler = Crawler.create(PathHolder(self.__pngFile))
+        self.assertCountEqual(pngCrawler.lazyVarNames(), ImageHeader.varNames('png'))
+        self.assertNotIn('channels', pngCrawler.lazyVarNames())
+
+        # the header is not read for variables that the format does not provide
+        self.assertFalse(pngCrawler.hasVar('channels'))
+        self.assertNotIn('width', pngCrawler.varNames())
+
+        textureCrawler = Crawler.create(PathHolder(os.path.join(BaseTestCase.dataDirectory(), "test_DIFF_u1_v1.exr")))
+        self.assertEqual(textureCrawler.var("type"), "texture")
+        self.assertCountEqual(textureCrawler.lazyVarNames(), ['width', 'height'])
+
+
+if __name__ == "__main__":
+    unittest.main()
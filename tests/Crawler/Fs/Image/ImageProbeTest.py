@@ -0,0 +1,141 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from ....BaseTestCase import BaseTestCase
+from centipede.Crawler import Crawler
+from centipede.PathHolder import PathHolder
+from centipede.Crawler.Fs.Image import ImageProbe
+
+class ImageProbeTest(BaseTestCase):
+    """Test ImageProbe."""
+
+    __exrFile = os.path.join(BaseTestCase.dataDirectory(), "test.exr")
+
+    def setUp(self):
+        """
+        Create the directory used by the tests.
+        """
+        ImageProbe.clearCache()
+        self.__readPaths = []
+        self.__readLock = threading.Lock()
+
+        self.__dir = tempfile.mkdtemp()
+        for frame in range(1, 5):
+            shutil.copyfile(self.__exrFile, os.path.join(self.__dir, "testSeq.{0:04d}.exr".format(frame)))
+        shutil.copyfile(self.__exrFile, os.path.join(self.__dir, "test.exr"))
+
+    def tearDown(self):
+        """
+        Remove the directory used by the tests.
+        """
+        ImageProbe.clearCache()
+        shutil.rmtree(self.__dir)
+
+    def testImageProbeBatch(self):
+        """
+        Test that the probe reads each file once and assigns the resolution to the crawlers.
+        """
+        crawlers = Crawler.create(PathHolder(self.__dir)).children()
+        imageProbe = ImageProbe(reader=self.__reader)
+        imageProbe.addCrawlers(crawlers)
+        self.assertEqual(imageProbe.pending(), 5)
+        self.assertEqual(imageProbe.run(), 5)
+        self.assertEqual(imageProbe.pending(), 0)
+        self.assertCountEqual(self.__readPaths, map(lambda x: x.var('filePath'), crawlers))
+
+        for crawler in crawlers:
+            self.assertEqual(crawler.var('width'), 1828)
+            self.assertEqual(crawler.var('height'), 1556)
+
+        # the files that have not changed are not read again
+        crawlers = Crawler.create(PathHolder(self.__dir)).children()
+        imageProbe.addCrawlers(crawlers)
+        self.assertEqual(imageProbe.run(), 0)
+        self.assertEqual(len(self.__readPaths), 5)
+        self.assertEqual(crawlers[0].var('width'), 1828)
+
+    def testImageProbePropagateSequences(self):
+        """
+        Test that only one frame is read per image sequence when propagating the resolution.
+        """
+        crawlers = Crawler.create(PathHolder(self.__dir)).children()
+        imageProbe = ImageProbe(propagateSequences=True, reader=self.__reader)
+        imageProbe.addCrawlers(crawlers)
+        self.assertEqual(imageProbe.pending(), 2)
+        self.assertEqual(imageProbe.run(), 2)
+
+        for crawler in crawlers:
+            self.assertIn('width', crawler.varNames())
+            self.assertEqual(crawler.var('height'), 1556)
+
+    def testImageProbeCache(self):
+        """
+        Test that a modified file replaces its entry in the cache, which is bounded by size.
+        """
+        filePath = os.path.join(self.__dir, "test.exr")
+        ImageProbe.resolution(PathHolder(filePath), self.__reader)
+        with open(filePath, "ab") as f:
+            f.write(b"modified")
+        ImageProbe.resolution(PathHolder(filePath), self.__reader)
+        ImageProbe.resolution(PathHolder(filePath), self.__reader)
+        self.assertEqual(self.__readPaths, [filePath, filePath])
+        self.assertEqual(len(ImageProbe._ImageProbe__cache), 1)
+
+        cacheSize = ImageProbe._ImageProbe__cacheSize
+        ImageProbe._ImageProbe__cacheSize = 2
+        try:
+            crawlers = Crawler.create(PathHolder(self.__dir)).children()
+            imageProbe = ImageProbe(reader=self.__reader)
+            imageProbe.addCrawlers(crawlers)
+            imageProbe.run()
+            self.assertEqual(len(ImageProbe._ImageProbe__cache), 2)
+        finally:
+            ImageProbe._ImageProbe__cacheSize = cacheSize
+
+    def testImageProbeReadError(self):
+        """
+        Test that a file that cannot be read does not prevent the other crawlers from getting the resolution.
+        """
+        badFile = os.path.join(self.__dir, "test.exr")
+
+        def reader(filePath):
+            if filePath == badFile:
+                raise IOError("truncated file")
+            return self.__reader(filePath)
+
+        crawlers = Crawler.create(PathHolder(self.__dir)).children()
+        imageProbe = ImageProbe(reader=reader)
+        imageProbe.addCrawlers(crawlers)
+        self.assertEqual(imageProbe.run(), 4)
+
+        for crawler in crawlers:
+            if crawler.var('filePath') == badFile:
+                self.assertNotIn('width', crawler._contents()[0])
+            else:
+                self.assertEqual(crawler.var('width'), 1828)
+
+    def testImageProbeRewrittenFile(self):
+        """
+        Test that a file rewritten after its path holder has been queried is read again.
+        """
+        pathHolder = PathHolder(os.path.join(self.__dir, "test.exr"))
+        ImageProbe.resolution(pathHolder, self.__reader)
+        with open(pathHolder.path(), "ab") as f:
+            f.write(b"modified")
+        ImageProbe.resolution(pathHolder, self.__reader)
+        self.assertEqual(self.__readPaths, [pathHolder.path(), pathHolder.path()])
+
+    def __reader(self, filePath):
+        """
+        Return a fixed resolution keeping track of the files that have been read.
+        """
+        with self.__readLock:
+            self.__readPaths.append(filePath)
+
+        return (1828, 1556)
+
+
+if __name__ == "__main__":
+    unittest.main()
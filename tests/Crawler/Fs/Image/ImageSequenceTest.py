@@ -0,0 +1,131 @@
+import os
+import shutil
+import tempfile
+import unittest
+from ....BaseTestCase import BaseTestCase
+from centipede.Crawler import Crawler
+from centipede.PathHolder import PathHolder
+from centipede.Crawler.Fs.Image import Exr
+from centipede.Crawler.Fs.Image import ImageSequence
+
+class ImageSequenceTest(BaseTestCase):
+    """Test ImageSequence crawler."""
+
+    __exrFile = os.path.join(BaseTestCase.dataDirectory(), "test.exr")
+
+    def setUp(self):
+        """
+        Create the directory used by the tests.
+        """
+        self.__dir = tempfile.mkdtemp()
+        for frame in (1, 2, 3, 5):
+            shutil.copyfile(self.__exrFile, os.path.join(self.__dir, "testSeq.{0:04d}.exr".format(frame)))
+        shutil.copyfile(self.__exrFile, os.path.join(self.__dir, "test.exr"))
+        open(os.path.join(self.__dir, "test.txt"), "w").close()
+
+    def tearDown(self):
+        """
+        Remove the directory used by the tests.
+        """
+        shutil.rmtree(self.__dir)
+
+    def testImageSequenceCollapse(self):
+        """
+        Test that the directory collapses the image sequences.
+        """
+        crawler = Crawler.create(PathHolder(self.__dir))
+        crawler.setCollapseSequences(True)
+        crawlers = crawler.children()
+        self.assertEqual(len(crawlers), 3)
+
+        sequences = list(filter(lambda x: isinstance(x, ImageSequence), crawlers))
+        self.assertEqual(len(sequences), 1)
+        self.assertEqual(sequences[0].var("type"), "imageSequence")
+        self.assertEqual(sequences[0].var("frameType"), "exr")
+        self.assertEqual(sequences[0].var("name"), "testSeq")
+        self.assertEqual(sequences[0].var("padding"), 4)
+        self.assertEqual(sequences[0].var("frameRange"), [[1, 3], [5, 5]])
+        self.assertEqual(sequences[0].var("firstFrame"), 1)
+        self.assertEqual(sequences[0].var("lastFrame"), 5)
+        self.assertEqual(sequences[0].frames(), [1, 2, 3, 5])
+        self.assertEqual(sequences[0].tag("group"), "testSeq.####.exr")
+
+    def testImageSequenceExpand(self):
+        """
+        Test that expanding the collapsed crawlers returns the same crawlers as the regular glob.
+        """
+        crawler = Crawler.create(PathHolder(self.__dir))
+        expectedCrawlers = crawler.glob(['exr'])
+
+        collapsedCrawler = Crawler.create(PathHolder(self.__dir))
+        collapsedCrawler.setCollapseSequences(True)
+        collapsedCrawlers = collapsedCrawler.glob(['exr'])
+        self.assertEqual(len(collapsedCrawlers), 2)
+
+        crawlers = list(Crawler.expand(collapsedCrawlers))
+        self.assertCountEqual(
+            list(map(lambda x: x.var("filePath"), crawlers)),
+            list(map(lambda x: x.var("filePath"), expectedCrawlers))
+        )
+
+        for expandedCrawler in crawlers:
+            self.assertIsInstance(expandedCrawler, Exr)
+            if expandedCrawler.var("imageType") == "sequence":
+                self.assertEqual(expandedCrawler.tag("group"), "testSeq.####.exr")
+                self.assertIn(expandedCrawler.var("frame"), [1, 2, 3, 5])
+
+    def testImageSequenceSerialization(self):
+        """
+        Test that the collapsed crawler can be cloned and serialized.
+        """
+        crawler = Crawler.create(PathHolder(self.__dir))
+        crawler.setCollapseSequences(True)
+        sequence = list(filter(lambda x: isinstance(x, ImageSequence), crawler.children()))[0]
+
+        for otherSequence in (sequence.clone(), Crawler.createFromBinary(sequence.toBinary())):
+            self.assertIsInstance(otherSequence, ImageSequence)
+            self.assertEqual(otherSequence.framePaths(), sequence.framePaths())
+            self.assertEqual(
+                list(map(lambda x: x.var("filePath"), otherSequence.frameCrawlers())),
+                sequence.framePaths()
+            )
+
+    def testImageSequenceExpandDetached(self):
+        """
+        Test that the frames of a cloned or deserialized sequence do not inherit the variables of the sequence.
+        """
+        crawler = Crawler.create(PathHolder(self.__dir))
+        crawler.setVar("testContextVar", "a", True)
+        crawler.setCollapseSequences(True)
+        sequence = list(filter(lambda x: isinstance(x, ImageSequence), crawler.children()))[0]
+        expectedCrawlers = list(sequence.frameCrawlers())
+
+        for otherSequence in (sequence.clone(), Crawler.createFromBinary(sequence.toBinary())):
+            crawlers = list(Crawler.expand([otherSequence]))
+            self.assertEqual(len(crawlers), len(expectedCrawlers))
+            for frameCrawler, expectedCrawler in zip(crawlers, expectedCrawlers):
+                self.assertIsInstance(frameCrawler, Exr)
+                self.assertEqual(frameCrawler.var("frame"), expectedCrawler.var("frame"))
+                self.assertEqual(frameCrawler.var("testContextVar"), "a")
+                self.assertIn("testContextVar", frameCrawler.contextVarNames())
+                for varName in ("frameRange", "firstFrame", "lastFrame", "frameType"):
+                    self.assertNotIn(varName, frameCrawler.varNames())
+                self.assertCountEqual(frameCrawler.varNames(), expectedCrawler.varNames())
+
+    def testImageSequenceGroup(self):
+        """
+        Test that a collapsed sequence is grouped with the frames of the same sequence.
+        """
+        crawler = Crawler.create(PathHolder(self.__dir))
+        crawler.setCollapseSequences(True)
+        sequence = list(filter(lambda x: isinstance(x, ImageSequence), crawler.children()))[0]
+        frameCrawler = Crawler.create(PathHolder(os.path.join(self.__dir, "testSeq.0001.exr")))
+
+        groups = Crawler.group([sequence, frameCrawler])
+        self.assertEqual(len(groups), 1)
+        self.assertCountEqual(groups[0], [sequence, frameCrawler])
+        self.assertEqual(len(list(Crawler.expand(groups[0]))), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
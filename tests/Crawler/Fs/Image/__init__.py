@@ -1,4 +1,7 @@
 from .DpxTest import DpxTest
 from .ExrTest import ExrTest
+from .ImageHeaderTest import ImageHeaderTest
+from .ImageProbeTest import ImageProbeTest
+from .ImageSequenceTest import ImageSequenceTest
 from .JpgTest import JpgTest
 from .PngTest import PngTest
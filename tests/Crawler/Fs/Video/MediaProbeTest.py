@@ -0,0 +1,118 @@
+import os
+import shutil
+import tempfile
+import unittest
+from ....BaseTestCase import BaseTestCase
+from centipede.Crawler import Crawler
+from centipede.PathHolder import PathHolder
+from centipede.Crawler.Fs.Video import MediaProbe
+
+class MediaProbeTest(BaseTestCase):
+    """Test MediaProbe."""
+
+    __movFile = os.path.join(BaseTestCase.dataDirectory(), "copyVideo.mov")
+    __mediaInfo = {
+        'streams': [
+            {
+                'width': 1920,
+                'height': 1080,
+                'nb_frames': '12',
+                'avg_frame_rate': '24/1',
+                'tags': {
+                    'timecode': '00:00:00:01'
+                }
+            }
+        ]
+    }
+
+    def setUp(self):
+        """
+        Create the directory used by the tests.
+        """
+        self.__dir = tempfile.mkdtemp()
+        self.__probedPaths = []
+
+    def tearDown(self):
+        """
+        Remove the directory used by the tests.
+        """
+        MediaProbe.setDefault(None)
+        shutil.rmtree(self.__dir)
+
+    def testMediaProbeCache(self):
+        """
+        Test that the files are only probed once (including the persistent cache).
+        """
+        cacheFile = os.path.join(self.__dir, "cache.db")
+        movFile = os.path.join(self.__dir, "test.mov")
+        shutil.copyfile(self.__movFile, movFile)
+
+        mediaProbe = MediaProbe(cacheFile, reader=self.__reader)
+        self.assertEqual(mediaProbe.probe(PathHolder(movFile)), self.__mediaInfo)
+        self.assertEqual(mediaProbe.probe(PathHolder(movFile)), self.__mediaInfo)
+        self.assertEqual(mediaProbe.stats(), {'probed': 1, 'cached': 1})
+        mediaProbe.close()
+
+        mediaProbe = MediaProbe(cacheFile, reader=self.__reader)
+        self.assertEqual(mediaProbe.probe(PathHolder(movFile)), self.__mediaInfo)
+        self.assertEqual(len(self.__probedPaths), 1)
+
+        # modified files are probed again
+        with open(movFile, "ab") as f:
+            f.write(b"\0")
+        mediaProbe.probe(PathHolder(movFile))
+        self.assertEqual(len(self.__probedPaths), 2)
+
+        # the modified file replaces its entry in the memory cache
+        self.assertEqual(len(mediaProbe._MediaProbe__cache), 1)
+        mediaProbe.close()
+
+    def testMediaProbeMany(self):
+        """
+        Test that multiple files can be probed at once.
+        """
+        movFiles = []
+        for index in range(4):
+            movFile = os.path.join(self.__dir, "test{}.mov".format(index))
+            shutil.copyfile(self.__movFile, movFile)
+            movFiles.append(movFile)
+
+        mediaProbe = MediaProbe(reader=self.__reader)
+        result = mediaProbe.probeMany(map(PathHolder, movFiles))
+        self.assertEqual(result, [self.__mediaInfo] * 4)
+        self.assertCountEqual(self.__probedPaths, movFiles)
+
+        # the memory cache is bounded by size
+        cacheSize = MediaProbe._MediaProbe__cacheSize
+        MediaProbe._MediaProbe__cacheSize = 2
+        try:
+            mediaProbe = MediaProbe(reader=self.__reader)
+            mediaProbe.probeMany(map(PathHolder, movFiles))
+            self.assertEqual(len(mediaProbe._MediaProbe__cache), 2)
+        finally:
+            MediaProbe._MediaProbe__cacheSize = cacheSize
+
+    def testMediaProbeVariables(self):
+        """
+        Test that the video crawlers query the media information on demand.
+        """
+        MediaProbe.setDefault(MediaProbe(reader=self.__reader))
+        crawler = Crawler.create(PathHolder(self.__movFile))
+        self.assertEqual(self.__probedPaths, [])
+        self.assertEqual(crawler.var("width"), 1920)
+        self.assertEqual(crawler.var("height"), 1080)
+        self.assertEqual(crawler.var("firstFrame"), 1)
+        self.assertEqual(crawler.var("lastFrame"), 12)
+        self.assertEqual(self.__probedPaths, [self.__movFile])
+
+    def __reader(self, filePath):
+        """
+        Return the media information keeping track of the files that have been probed.
+        """
+        self.__probedPaths.append(filePath)
+
+        return self.__mediaInfo
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1 +1,2 @@
+from .MediaProbeTest import MediaProbeTest
 from .MovTest import MovTest
@@ -0,0 +1,192 @@
+import os
+import time
+import errno
+import ctypes
+import shutil
+import tempfile
+import unittest
+from ...BaseTestCase import BaseTestCase
+from centipede.Crawler import Crawler
+from centipede.Crawler.Fs import FsPath
+from centipede.Crawler.Fs import Directory
+from centipede.Crawler.Fs import Watcher
+
+class WatcherTest(BaseTestCase):
+    """Test Watcher."""
+
+    def setUp(self):
+        """
+        Create the directory used by the tests.
+        """
+        self.__dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.__dir, "images"))
+        open(os.path.join(self.__dir, "images", "test.txt"), "w").close()
+
+        # making sure the changes done by the tests change the modification
+        # time of the directories
+        oldTime = time.time() - 60
+        for directory in (self.__dir, os.path.join(self.__dir, "images")):
+            os.utime(directory, (oldTime, oldTime))
+
+    def tearDown(self):
+        """
+        Remove the directory used by the tests.
+        """
+        shutil.rmtree(self.__dir)
+
+    def testWatcherInotify(self):
+        """
+        Test that the glob cache is updated by the changes detected through inotify.
+        """
+        self.__testWatcher(False)
+
+    def testWatcherPolling(self):
+        """
+        Test that the glob cache is updated by the changes detected through polling.
+        """
+        self.__testWatcher(True)
+
+    def __testWatcher(self, usePolling):
+        """
+        Test that the glob cache of the watched crawler is kept up to date.
+        """
+        crawler = FsPath.createFromPath(self.__dir)
+        crawler.glob()
+        watcher = Watcher(crawler, usePolling)
+        events = []
+        watcher.addListener(lambda eventType, eventCrawler: events.append((eventType, eventCrawler.var('filePath'))))
+
+        txtFile = os.path.join(self.__dir, "images", "test.txt")
+        jsonFile = os.path.join(self.__dir, "new", "test.json")
+        os.makedirs(os.path.dirname(jsonFile))
+        with open(jsonFile, "w") as f:
+            f.write("{}")
+        with open(txtFile, "w") as f:
+            f.write("modified")
+
+        watcher.update()
+        self.assertIn((Watcher.createdEvent, os.path.dirname(jsonFile)), events)
+        self.assertIn((Watcher.createdEvent, jsonFile), events)
+        self.assertIn((Watcher.modifiedEvent, txtFile), events)
+
+        del events[:]
+        shutil.rmtree(os.path.join(self.__dir, "images"))
+        watcher.update()
+        self.assertIn((Watcher.removedEvent, txtFile), events)
+
+        # the glob cache should be the same as globbing the directory again
+        globPaths = map(lambda x: x.var("filePath"), FsPath.createFromPath(self.__dir).glob())
+        cachePaths = map(lambda x: x.var("filePath"), crawler.glob())
+        self.assertCountEqual(globPaths, cachePaths)
+        self.assertEqual(watcher.update(), [])
+        watcher.close()
+
+    def testWatcherWatchLimit(self):
+        """
+        Test that the watcher falls back to polling when the limit of inotify watches is reached.
+        """
+        crawler = FsPath.createFromPath(self.__dir)
+        watcher = Watcher(crawler)
+        if not watcher.usesInotify():
+            watcher.close()
+            self.skipTest("inotify is not available")
+
+        class WatchLimitLibc(object):
+            def inotify_add_watch(self, *args):
+                ctypes.set_errno(errno.ENOSPC)
+                return -1
+
+            def inotify_rm_watch(self, *args):
+                return 0
+
+        watcher._Watcher__libc = WatchLimitLibc()
+        newDir = os.path.join(self.__dir, "new")
+        os.makedirs(newDir)
+        events = list(map(lambda x: (x[0], x[1].var("filePath")), watcher.update()))
+        self.assertEqual(events, [(Watcher.createdEvent, newDir)])
+        self.assertFalse(watcher.usesInotify())
+
+        # the changes are detected by polling from now on
+        jsonFile = os.path.join(newDir, "test.json")
+        with open(jsonFile, "w") as f:
+            f.write("{}")
+        events = list(map(lambda x: (x[0], x[1].var("filePath")), watcher.update()))
+        self.assertEqual(events, [(Watcher.createdEvent, jsonFile)])
+        self.assertEqual(watcher.update(), [])
+        watcher.close()
+
+    def testWatcherFilter(self):
+        """
+        Test that the watcher reuses the filtered glob without walking the tree again.
+        """
+        exrFile = os.path.join(BaseTestCase.dataDirectory(), "test.exr")
+        shutil.copyfile(exrFile, os.path.join(self.__dir, "images", "test.exr"))
+
+        crawler = FsPath.createFromPath(self.__dir)
+        globPaths = list(map(lambda x: x.var("filePath"), crawler.glob(["exr"])))
+
+        Crawler.resetDispatchStats()
+        watcher = Watcher(crawler, True, ["exr"], 2)
+        self.assertEqual(Crawler.dispatchStats()["creates"], 0)
+        self.assertEqual(watcher.filterTypes(), ["exr"])
+        self.assertEqual(list(map(lambda x: x.var("filePath"), crawler.glob(["exr"]))), globPaths)
+
+        # only the crawlers that can satisfy the filter are created
+        shutil.copyfile(exrFile, os.path.join(self.__dir, "new.exr"))
+        open(os.path.join(self.__dir, "new.txt"), "w").close()
+        events = list(map(lambda x: (x[0], x[1].var("filePath")), watcher.update()))
+        self.assertEqual(events, [(Watcher.createdEvent, os.path.join(self.__dir, "new.exr"))])
+        self.assertNotIn("txt", Crawler.dispatchStats()["typeHits"])
+
+        globPaths = map(lambda x: x.var("filePath"), FsPath.createFromPath(self.__dir).glob(["exr"]))
+        cachePaths = map(lambda x: x.var("filePath"), crawler.glob(["exr"]))
+        self.assertCountEqual(globPaths, cachePaths)
+        watcher.close()
+
+    def testWatcherRejectedFile(self):
+        """
+        Test that a modified file that is not accepted by the directory anymore is reported as removed.
+        """
+        crawler = FsPath.createFromPath(self.__dir)
+        watcher = Watcher(crawler, True)
+        txtFile = os.path.join(self.__dir, "images", "test.txt")
+        with open(txtFile, "w") as f:
+            f.write("modified")
+
+        createChild = Directory._createChild
+        try:
+            Directory._createChild = lambda *args: None
+            events = list(map(lambda x: (x[0], x[1].var("filePath")), watcher.update()))
+        finally:
+            Directory._createChild = createChild
+
+        self.assertEqual(events, [(Watcher.removedEvent, txtFile)])
+        self.assertNotIn(txtFile, map(lambda x: x.var("filePath"), crawler.glob()))
+        self.assertEqual(watcher.update(), [])
+        watcher.close()
+
+    def testWatcherErrors(self):
+        """
+        Test that the errors raised by the thread are passed to the error listeners (otherwise raised by stop).
+        """
+        def update():
+            raise OSError("test")
+
+        watcher = Watcher(FsPath.createFromPath(self.__dir), True)
+        watcher.update = update
+        watcher.start(0.01)
+        time.sleep(0.1)
+        self.assertRaises(OSError, watcher.stop)
+
+        errors = []
+        watcher.addErrorListener(errors.append)
+        watcher.start(0.01)
+        time.sleep(0.1)
+        watcher.stop()
+        self.assertGreater(len(errors), 0)
+        self.assertIsInstance(errors[0], OSError)
+        watcher.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
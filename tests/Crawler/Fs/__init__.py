@@ -5,5 +5,7 @@ from . import Render
 from . import Scene
 from . import Texture
 from . import Video
+from .CrawlIndexTest import CrawlIndexTest
 from .DirectoryTest import DirectoryTest
 from .FsPathTest import FsPathTest
+from .WatcherTest import WatcherTest
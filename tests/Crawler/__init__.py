@@ -1,2 +1,3 @@
 from . import Fs
 from . import Generic
+from .CrawlerBatchTest import CrawlerBatchTest
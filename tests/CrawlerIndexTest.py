@@ -0,0 +1,75 @@
+import os
+import unittest
+from .BaseTestCase import BaseTestCase
+from centipede.CrawlerIndex import CrawlerIndex
+from centipede.CrawlerMatcher import CrawlerMatcher
+from centipede.CrawlerQuery import CrawlerQuery
+from centipede.Template import Template
+from centipede.Crawler.Fs import FsPath
+
+class CrawlerIndexTest(BaseTestCase):
+    """Test CrawlerIndex."""
+
+    __files = [
+        os.path.join(BaseTestCase.dataDirectory(), 'test.exr'),
+        os.path.join(BaseTestCase.dataDirectory(), 'test.json'),
+        os.path.join(BaseTestCase.dataDirectory(), 'test.txt'),
+        os.path.join(BaseTestCase.dataDirectory(), 'test_DIFF_u1_v1.exr'),
+        os.path.join(BaseTestCase.dataDirectory(), 'test.png')
+    ]
+
+    def testCrawlerIndexTypes(self):
+        """
+        Test that the crawlers are indexed by type.
+        """
+        crawlers = list(map(FsPath.createFromPath, self.__files))
+        crawlerIndex = CrawlerIndex(iter(crawlers))
+
+        self.assertEqual(crawlerIndex.crawlers(), crawlers)
+        self.assertEqual(crawlers[3].var('type'), 'texture')
+        self.assertEqual(crawlerIndex.typePositions(['exr']), set([0]))
+        self.assertEqual(crawlerIndex.typePositions(['exr', 'texture']), set([0, 3]))
+        self.assertEqual(crawlerIndex.typePositions(['dummyType']), set())
+        self.assertEqual(crawlerIndex.typePositions(), set(range(len(crawlers))))
+        self.assertEqual(crawlerIndex.crawlers(set([3, 0])), [crawlers[0], crawlers[3]])
+
+    def testCrawlerIndexMatch(self):
+        """
+        Test that matching through the index returns the same crawlers as the linear match.
+        """
+        crawlers = list(map(FsPath.createFromPath, self.__files))
+        crawlerIndex = CrawlerIndex(crawlers)
+
+        crawlerMatchers = [
+            CrawlerMatcher(),
+            CrawlerMatcher(['exr']),
+            CrawlerMatcher(['generic'], {'ext': ['exr', 'p?g']}),
+            CrawlerMatcher([], {'name': 'test'}),
+            CrawlerMatcher(['exr'], {'name': 'test*', 'ext': 'exr'}),
+            CrawlerMatcher(['exr', 'texture'], {'name': 'test*'}),
+            CrawlerMatcher(['json'], {'dummyVar': '*'})
+        ]
+
+        for crawlerMatcher in crawlerMatchers:
+            self.assertEqual(
+                crawlerMatcher.matchIndex(crawlerIndex),
+                crawlerMatcher.matchMany(crawlers)
+            )
+
+    def testCrawlerIndexQuery(self):
+        """
+        Test that the query accepts a crawler index.
+        """
+        crawlers = list(map(FsPath.createFromPath, self.__files))
+        crawlerQuery = CrawlerQuery(
+            Template('/tmp/{name}.{ext}'),
+            CrawlerMatcher(['generic'], {'ext': 'exr'})
+        )
+
+        result = crawlerQuery.query(CrawlerIndex(crawlers))
+        self.assertEqual(list(result.items()), list(crawlerQuery.query(crawlers).items()))
+        self.assertEqual(list(result.values()), ['/tmp/test.exr', '/tmp/test_DIFF_u1_v1.exr'])
+
+
+if __name__ == "__main__":
+    unittest.main()
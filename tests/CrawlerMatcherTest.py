@@ -0,0 +1,83 @@
+import os
+import unittest
+from .BaseTestCase import BaseTestCase
+from centipede.CrawlerMatcher import CrawlerMatcher
+from centipede.Crawler import Crawler
+from centipede.Crawler.Fs import FsPath
+from centipede.Crawler.Fs.Image import Exr
+
+class CrawlerMatcherTest(BaseTestCase):
+    """Test CrawlerMatcher."""
+
+    __exrFile = os.path.join(BaseTestCase.dataDirectory(), 'test.exr')
+    __jsonFile = os.path.join(BaseTestCase.dataDirectory(), 'test.json')
+    __txtFile = os.path.join(BaseTestCase.dataDirectory(), 'test.txt')
+
+    def testMatchTypes(self):
+        """
+        Test that the crawlers are matched by type (including derived types).
+        """
+        exrCrawler = FsPath.createFromPath(self.__exrFile)
+        jsonCrawler = FsPath.createFromPath(self.__jsonFile)
+
+        self.assertTrue(CrawlerMatcher().match(exrCrawler))
+        self.assertTrue(CrawlerMatcher(['exr']).match(exrCrawler))
+        self.assertTrue(CrawlerMatcher(['generic']).match(exrCrawler))
+        self.assertFalse(CrawlerMatcher(['exr']).match(jsonCrawler))
+        self.assertTrue(CrawlerMatcher(['exr', 'json']).match(jsonCrawler))
+
+    def testMatchTypesRegistration(self):
+        """
+        Test that the types registered after the creation of the matcher are matched.
+        """
+        class DummyMatcherCrawler(Exr):
+            @classmethod
+            def testExtensions(cls):
+                return []
+
+            @classmethod
+            def test(cls, pathHolder, parentCrawler):
+                return False
+
+        crawler = FsPath.createFromPath(self.__exrFile)
+        crawlerMatcher = CrawlerMatcher(['exr'])
+        self.assertTrue(crawlerMatcher.match(crawler))
+
+        Crawler.register('dummyMatcher', DummyMatcherCrawler)
+        self.addCleanup(Crawler.unregister, 'dummyMatcher')
+        crawler.setVar('type', 'dummyMatcher')
+        self.assertTrue(crawlerMatcher.match(crawler))
+
+    def testMatchVars(self):
+        """
+        Test that the variables are matched using glob syntax.
+        """
+        crawler = FsPath.createFromPath(self.__exrFile)
+
+        self.assertTrue(CrawlerMatcher([], {'ext': 'exr'}).match(crawler))
+        self.assertTrue(CrawlerMatcher([], {'ext': 'e*'}).match(crawler))
+        self.assertTrue(CrawlerMatcher([], {'ext': ['jpg', 'e?r']}).match(crawler))
+        self.assertTrue(CrawlerMatcher([], {'name': 'te[st]t'}).match(crawler))
+        self.assertFalse(CrawlerMatcher([], {'ext': 'ex'}).match(crawler))
+        self.assertFalse(CrawlerMatcher([], {'ext': ['jpg', 'png']}).match(crawler))
+        self.assertFalse(CrawlerMatcher([], {'ext': []}).match(crawler))
+        self.assertFalse(CrawlerMatcher([], {'dummyVar': '*'}).match(crawler))
+        self.assertFalse(CrawlerMatcher(['json'], {'ext': 'exr'}).match(crawler))
+
+    def testMatchMany(self):
+        """
+        Test that the batch match returns the crawlers that match.
+        """
+        crawlers = list(map(
+            FsPath.createFromPath,
+            [self.__exrFile, self.__jsonFile, self.__txtFile]
+        ))
+
+        crawlerMatcher = CrawlerMatcher(['exr', 'txt'], {'name': 'test'})
+        result = crawlerMatcher.matchMany(iter(crawlers))
+        self.assertEqual(result, [crawlers[0], crawlers[2]])
+        self.assertEqual(result, list(filter(crawlerMatcher.match, crawlers)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
 import unittest
 import os
+import shutil
+import tempfile
 from ..BaseTestCase import BaseTestCase
 from centipede.ExpressionEvaluator import ExpressionEvaluator
 from centipede.ExpressionEvaluator import ExpressionNotFoundError
+from centipede.ExpressionBundle.Path import _Path
 
 class PathTest(BaseTestCase):
     """Test Path expressions."""
@@ -47,6 +50,96 @@ class PathTest(BaseTestCase):
         testPath = os.path.join(BaseTestCase.dataDirectory(), 'config', 'crawlers', 'TestCrawler.py')
         self.assertEqual(result, testPath)
 
+    def testFindPathMaxDepth(self):
+        """
+        Test that the find expressions do not search beyond the max depth.
+        """
+        result = ExpressionEvaluator.run("findpath", 'TestCrawler.py', BaseTestCase.dataDirectory(), 1)
+        self.assertEqual(result, '')
+        result = ExpressionEvaluator.parseRun("findpath TestCrawler.py {} 2".format(BaseTestCase.dataDirectory()))
+        self.assertEqual(result, os.path.join(BaseTestCase.dataDirectory(), 'config', 'crawlers', 'TestCrawler.py'))
+
+        startPath = os.path.join(BaseTestCase.dataDirectory(), 'config', 'crawlers')
+        self.assertRaises(IOError, ExpressionEvaluator.run, 'rfindpath', 'test.txt', startPath, None, 1)
+        result = ExpressionEvaluator.run('rfindpath', 'test.txt', startPath, None, 2)
+        self.assertEqual(result, os.path.join(BaseTestCase.dataDirectory(), 'test.txt'))
+
+    def testFindPathSymlinkMaxDepth(self):
+        """
+        Test that a directory reached first through a deeper symlink is searched again from its own location.
+        """
+        rootPath = tempfile.mkdtemp()
+        listDirectory = _Path._Path__listDirectory
+        try:
+            os.makedirs(os.path.join(rootPath, 'a'))
+            os.makedirs(os.path.join(rootPath, 'b', 'c', 'd'))
+            os.symlink(os.path.join(rootPath, 'b'), os.path.join(rootPath, 'a', 'link'))
+            open(os.path.join(rootPath, 'b', 'c', 'd', 'target.lut'), 'w').close()
+
+            # the order of the directory entries depends on the file system,
+            # so both orders are tested
+            for reverse in (False, True):
+                _Path._Path__listDirectory = staticmethod(
+                    lambda path, reverse=reverse: listDirectory(path)[:2] + (tuple(sorted(listDirectory(path)[2], reverse=reverse)),)
+                )
+                self.assertEqual(
+                    ExpressionEvaluator.run("findpath", 'target.lut', rootPath, 3),
+                    os.path.join(rootPath, 'b', 'c', 'd', 'target.lut')
+                )
+                self.assertEqual(ExpressionEvaluator.run("findpath", 'target.lut', rootPath, 2), '')
+        finally:
+            _Path._Path__listDirectory = staticmethod(listDirectory)
+            shutil.rmtree(rootPath)
+
+    def testFindPathCase(self):
+        """
+        Test that the find expressions match the case of the file names the same way as the file system.
+        """
+        rootPath = tempfile.mkdtemp()
+        try:
+            os.makedirs(os.path.join(rootPath, 'a'))
+            open(os.path.join(rootPath, 'a', 'Config.json'), 'w').close()
+            caseSensitive = not os.path.exists(os.path.join(rootPath, 'a', 'config.json'))
+
+            self.assertEqual(
+                ExpressionEvaluator.run("findpath", 'Config.json', rootPath),
+                os.path.join(rootPath, 'a', 'Config.json')
+            )
+            self.assertEqual(
+                ExpressionEvaluator.run("findpath", 'config.json', rootPath),
+                '' if caseSensitive else os.path.join(rootPath, 'a', 'config.json')
+            )
+            if caseSensitive:
+                self.assertRaises(IOError, ExpressionEvaluator.run, "rfindpath", 'config.json', os.path.join(rootPath, 'a'), rootPath)
+            else:
+                self.assertEqual(
+                    ExpressionEvaluator.run("rfindpath", 'config.json', os.path.join(rootPath, 'a'), rootPath),
+                    os.path.join(rootPath, 'a', 'config.json')
+                )
+        finally:
+            shutil.rmtree(rootPath)
+
+    def testFindPathListingCache(self):
+        """
+        Test that the find expressions see the files created after a previous search.
+        """
+        rootPath = tempfile.mkdtemp()
+        try:
+            os.makedirs(os.path.join(rootPath, 'a', 'b'))
+            os.symlink(rootPath, os.path.join(rootPath, 'a', 'loop'))
+            os.utime(os.path.join(rootPath, 'a'), (0, 0))
+            os.utime(os.path.join(rootPath, 'a', 'b'), (0, 0))
+            self.assertEqual(ExpressionEvaluator.run("findpath", 'test.lut', rootPath), '')
+
+            with open(os.path.join(rootPath, 'a', 'b', 'test.lut'), 'w') as f:
+                f.write('lut')
+            self.assertEqual(
+                ExpressionEvaluator.run("findpath", 'test.lut', rootPath),
+                os.path.join(rootPath, 'a', 'b', 'test.lut')
+            )
+        finally:
+            shutil.rmtree(rootPath)
+
     def testRegistration(self):
         """
         Test that the expression registration works properly.
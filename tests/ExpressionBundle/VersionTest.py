@@ -1,5 +1,7 @@
 import unittest
 import os
+import shutil
+import tempfile
 from ..BaseTestCase import BaseTestCase
 from centipede.ExpressionEvaluator import ExpressionEvaluator
 
@@ -22,6 +24,36 @@ class VersionTest(BaseTestCase):
         result = ExpressionEvaluator.run("latestver", os.path.join(BaseTestCase.dataDirectory(), "glob"))
         self.assertEqual(result, "v000")
 
+    def testLatestVersionCache(self):
+        """
+        Test that the cached latest version is invalidated when the versions path changes.
+        """
+        versionsPath = tempfile.mkdtemp()
+        try:
+            os.mkdir(os.path.join(versionsPath, "v001"))
+            os.utime(versionsPath, (0, 0))
+            self.assertEqual(ExpressionEvaluator.run("latestver", versionsPath), "v001")
+
+            os.mkdir(os.path.join(versionsPath, "v004"))
+            os.utime(versionsPath, (10, 10))
+            self.assertEqual(ExpressionEvaluator.run("latestver", versionsPath), "v004")
+            self.assertEqual(ExpressionEvaluator.run("newver", versionsPath), "v005")
+        finally:
+            shutil.rmtree(versionsPath)
+
+    def testReserveVersion(self):
+        """
+        Test that the reserved versions are created and are never returned twice.
+        """
+        versionsPath = os.path.join(tempfile.mkdtemp(), "versions")
+        try:
+            result = list(map(lambda x: ExpressionEvaluator.run("reservever", versionsPath), range(3)))
+            self.assertEqual(result, ["v001", "v002", "v003"])
+            self.assertCountEqual(os.listdir(versionsPath), result)
+            self.assertEqual(ExpressionEvaluator.run("latestver", versionsPath), "v003")
+        finally:
+            shutil.rmtree(os.path.dirname(versionsPath))
+
 
 if __name__ == "__main__":
     unittest.main()
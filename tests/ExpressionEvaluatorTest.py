@@ -0,0 +1,86 @@
+import unittest
+from .BaseTestCase import BaseTestCase
+from centipede.ExpressionEvaluator import ExpressionEvaluator
+from centipede.ExpressionEvaluator import ExpressionNotFoundError
+from centipede.ExpressionEvaluator import InvalidExpressionArityError
+
+class ExpressionEvaluatorTest(BaseTestCase):
+    """Test ExpressionEvaluator."""
+
+    def tearDown(self):
+        """
+        Remove the expressions registered by the tests.
+        """
+        for expressionName in ('testArity', 'testCompilePure', 'testCompileImpure', 'testStats'):
+            if expressionName in ExpressionEvaluator.registeredNames():
+                ExpressionEvaluator.unregister(expressionName)
+
+    def testExpressionArity(self):
+        """
+        Test that the number of arguments is checked when the expression is compiled or run.
+        """
+        ExpressionEvaluator.register('testArity', lambda *args: len(args), arity=(1, 2))
+        self.assertEqual(ExpressionEvaluator.arity('testArity'), (1, 2))
+        self.assertEqual(ExpressionEvaluator.arity('pad'), (2, 2))
+        self.assertEqual(ExpressionEvaluator.parseRun('testArity a  b'), '2')
+        self.assertRaises(InvalidExpressionArityError, ExpressionEvaluator.compile, 'testArity')
+        self.assertRaises(InvalidExpressionArityError, ExpressionEvaluator.compile, 'testArity a b c')
+        self.assertRaises(ExpressionNotFoundError, ExpressionEvaluator.compile, 'dummyExpression a')
+        self.assertEqual(ExpressionEvaluator.run('testArity', 'a'), '1')
+        self.assertRaises(InvalidExpressionArityError, ExpressionEvaluator.run, 'testArity')
+        self.assertRaises(InvalidExpressionArityError, ExpressionEvaluator.run, 'pad', 1)
+
+        ExpressionEvaluator.register('testArity', lambda *args: len(args))
+        self.assertIsNone(ExpressionEvaluator.arity('testArity'))
+        self.assertEqual(ExpressionEvaluator.parseRun('testArity a b c'), '3')
+
+        ExpressionEvaluator.unregister('testArity')
+        self.assertNotIn('testArity', ExpressionEvaluator.registeredNames())
+        self.assertRaises(ExpressionNotFoundError, ExpressionEvaluator.compile, 'testArity a')
+        self.assertRaises(ExpressionNotFoundError, ExpressionEvaluator.unregister, 'testArity')
+
+    def testExpressionCompile(self):
+        """
+        Test that only the compiled pure expressions memoize their result.
+        """
+        calls = []
+        ExpressionEvaluator.register('testCompilePure', lambda x: calls.append(x) or x.upper(), pure=True)
+        ExpressionEvaluator.register('testCompileImpure', lambda x: calls.append(x) or x.lower())
+
+        compiledExpression = ExpressionEvaluator.compile('testCompilePure a')
+        self.assertIs(ExpressionEvaluator.compile('testCompilePure a'), compiledExpression)
+        self.assertEqual(compiledExpression(), 'A')
+        self.assertEqual(ExpressionEvaluator.parseRun('testCompilePure a'), 'A')
+        self.assertEqual(calls, ['a'])
+
+        self.assertEqual(ExpressionEvaluator.parseRun('testCompileImpure B'), 'b')
+        self.assertEqual(ExpressionEvaluator.parseRun('testCompileImpure B'), 'b')
+        self.assertEqual(calls, ['a', 'B', 'B'])
+
+        ExpressionEvaluator.clearCache()
+        self.assertEqual(ExpressionEvaluator.parseRun('testCompilePure a'), 'A')
+        self.assertEqual(calls, ['a', 'B', 'B', 'a'])
+
+    def testExpressionStats(self):
+        """
+        Test that the calls of the expressions are collected by the statistics.
+        """
+        ExpressionEvaluator.register('testStats', lambda x: x, pure=True)
+        ExpressionEvaluator.resetStats()
+
+        for i in range(3):
+            ExpressionEvaluator.parseRun('testStats a')
+        ExpressionEvaluator.run('testStats', 'a')
+
+        stats = ExpressionEvaluator.stats()
+        self.assertEqual(list(stats.keys()), ['testStats'])
+        self.assertEqual(stats['testStats']['calls'], 2)
+        self.assertEqual(stats['testStats']['cacheHits'], 2)
+        self.assertGreaterEqual(stats['testStats']['seconds'], 0.0)
+
+        ExpressionEvaluator.resetStats()
+        self.assertEqual(ExpressionEvaluator.stats(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
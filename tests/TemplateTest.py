@@ -4,6 +4,7 @@ from .BaseTestCase import BaseTestCase
 from centipede.Template import Template
 from centipede.Template import RequiredPathNotFoundError
 from centipede.Template import VariableNotFoundError
+from centipede.ExpressionEvaluator import ExpressionEvaluator
 from centipede.Crawler.Fs import FsPath
 
 class TemplateTest(BaseTestCase):
@@ -11,6 +12,14 @@ class TemplateTest(BaseTestCase):
 
     __file = os.path.join(BaseTestCase.dataDirectory(), 'RND-TST-SHT_lighting_beauty_sr.1001.exr')
 
+    def tearDown(self):
+        """
+        Remove the expressions registered by the tests.
+        """
+        for expressionName in ('testPure', 'testImpure', 'testPrefix'):
+            if expressionName in ExpressionEvaluator.registeredNames():
+                ExpressionEvaluator.unregister(expressionName)
+
     def testTemplate(self):
         """
         Test that the Template works properly.
@@ -43,6 +52,103 @@ class TemplateTest(BaseTestCase):
         variables['var'] = 'test'
         self.assertEqual(Template('{var}').value(variables), 'test')
 
+    def testTemplateValuesFromCrawlers(self):
+        """
+        Test that the template can be resolved for multiple crawlers at once.
+        """
+        crawlers = list(map(FsPath.createFromPath, [
+            self.__file,
+            os.path.join(BaseTestCase.dataDirectory(), 'test.exr'),
+            os.path.join(BaseTestCase.dataDirectory(), 'test.json')
+        ]))
+
+        value = '{prefix}/(pad {padding} 3)/{name}.(pad {padding} 2).{ext}'
+        variables = {'prefix': '/tmp', 'padding': 5}
+        result = Template(value).valuesFromCrawlers(iter(crawlers), variables)
+        self.assertEqual(result, list(map(lambda x: Template(value).valueFromCrawler(x, variables), crawlers)))
+        self.assertEqual(result[1], '/tmp/005/test.05.exr')
+        self.assertEqual(Template(value).valuesFromCrawlers([], variables), [])
+
+    def testTemplateSharedCache(self):
+        """
+        Test that only the results of pure expressions are shared by the templates.
+        """
+        calls = []
+        ExpressionEvaluator.register('testPure', lambda x: calls.append('pure') or x, pure=True)
+        ExpressionEvaluator.register('testImpure', lambda x: calls.append('impure') or x)
+        self.assertTrue(ExpressionEvaluator.isPure('testPure'))
+        self.assertFalse(ExpressionEvaluator.isPure('testImpure'))
+
+        value = '/tmp/(testPure {var})/(testImpure {var})'
+        template = Template(value)
+        self.assertEqual(template.value({'var': 'a'}), '/tmp/a/a')
+        self.assertEqual(template.value({'var': 'a'}), '/tmp/a/a')
+        self.assertEqual(calls, ['pure', 'impure'])
+
+        # impure expressions are evaluated once per template object
+        self.assertEqual(Template(value).value({'var': 'a'}), '/tmp/a/a')
+        self.assertEqual(calls, ['pure', 'impure', 'impure'])
+
+        Template.clearSharedCache()
+        self.assertEqual(Template(value).value({'var': 'a'}), '/tmp/a/a')
+        self.assertEqual(calls, ['pure', 'impure', 'impure', 'pure', 'impure'])
+
+    def testTemplatePrefixMemoization(self):
+        """
+        Test that the directory prefix is resolved once per distinct value of the variables it uses.
+        """
+        calls = []
+        ExpressionEvaluator.register('testPrefix', lambda *args: calls.append(args) or 'v001')
+
+        requiredPath = os.path.join(BaseTestCase.dataDirectory(), 'glob')
+        existsCalls = []
+        resolveTokensCalls = []
+        exists = os.path.exists
+        resolveTokens = Template._Template__resolveTokens
+
+        def countedExists(path):
+            existsCalls.append(path)
+            return exists(path)
+
+        def countedResolveTokens(self, *args):
+            resolveTokensCalls.append(args)
+            return resolveTokens(self, *args)
+
+        os.path.exists = countedExists
+        Template._Template__resolveTokens = countedResolveTokens
+        try:
+            value = '{prefix}/!glob/(testPrefix <parentPath>)/{name}.(pad {frame} 4).exr'
+            template = Template(value)
+            result = list(map(lambda x: template.value({'prefix': BaseTestCase.dataDirectory(), 'name': 'a', 'frame': x}), range(3)))
+            self.assertEqual(result, list(map(
+                lambda x: os.path.join(BaseTestCase.dataDirectory(), 'glob', 'v001', 'a.000{}.exr'.format(x)),
+                range(3)
+            )))
+            self.assertEqual(len(calls), 1)
+
+            # the required level is checked once for all frames
+            self.assertEqual(existsCalls.count(requiredPath), 1)
+
+            # the prefix is resolved by the first frame only (the remaining
+            # tokens are resolved by every frame)
+            self.assertEqual(len(resolveTokensCalls), 4)
+
+            # the prefix is keyed only by the variables it uses
+            self.assertEqual(
+                template.value({'prefix': BaseTestCase.dataDirectory(), 'name': 'b', 'frame': 5}),
+                os.path.join(BaseTestCase.dataDirectory(), 'glob', 'v001', 'b.0005.exr')
+            )
+            self.assertEqual(len(resolveTokensCalls), 5)
+            self.assertEqual(existsCalls.count(requiredPath), 1)
+
+            # a different value for a variable used by the prefix resolves it again
+            self.assertRaises(RequiredPathNotFoundError, template.value, {'prefix': '/badPath', 'name': 'a', 'frame': 1})
+            self.assertEqual(len(resolveTokensCalls), 7)
+            self.assertEqual(len(calls), 2)
+        finally:
+            os.path.exists = exists
+            Template._Template__resolveTokens = resolveTokens
+
 
 if __name__ == "__main__":
     unittest.main()
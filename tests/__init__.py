@@ -1,5 +1,8 @@
 from .BaseTestCase import BaseTestCase
 from .TemplateTest import TemplateTest
+from .ExpressionEvaluatorTest import ExpressionEvaluatorTest
+from .CrawlerMatcherTest import CrawlerMatcherTest
+from .CrawlerIndexTest import CrawlerIndexTest
 from . import Crawler
 from . import ExpressionBundle
 from . import Task